@@ -0,0 +1,354 @@
+import json
+import os
+from typing import Any, AsyncIterator, Awaitable, Iterator, List, Optional
+
+from aiohttp import BasicAuth, ClientSession, ClientTimeout, TCPConnector
+
+from dao.async_dao import AsyncDAO
+from dao.connection_pool import get_pool_config
+from dao.dao import Timer
+from stats.statistics import Statistics
+from utils.data_loader import iter_json_chunks
+
+
+class AsyncCouchDbDAO(AsyncDAO):
+
+    """Represents asyncio CouchDB Data Access Object.
+
+    Talks to the CouchDB HTTP API with aiohttp, Documents are written with
+    _bulk_docs and read page by page through _all_docs.
+    """
+
+    def __init__(
+        self,
+        statistics: Statistics,
+        batch_size: Optional[int] = 1000,
+        page_size: Optional[int] = 1000,
+        concurrency: Optional[int] = 16,
+        instrumentation: Optional[bool] = True
+    ) -> None:
+        """Initializes the AsyncCouchDbDAO Class.
+
+        Args:
+            statistics (Statistics): Database Testing Statistics Object.
+            batch_size (Optional[int]): Number of Documents sent in one
+            _bulk_docs request. Defaults to 1000.
+            page_size (Optional[int]): Number of Documents fetched in one
+            _all_docs or _find request. Defaults to 1000.
+            concurrency (Optional[int]): Maximum number of requests in
+            flight. Defaults to 16.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
+        """
+        super().__init__(
+            database_type='CouchDB (Async)',
+            statistics=statistics,
+            concurrency=concurrency,
+            instrumentation=instrumentation
+        )
+
+        self.__batch_size: int = batch_size
+        self.__page_size: int = page_size
+        self.__config = get_pool_config('COUCHDB', 5984)
+        self.__url: str = (
+            f"http://{self.__config['host']}:{self.__config['port']}"
+        )
+        self.__connection: Optional[ClientSession] = None
+
+    def create_connection(self, **kwargs) -> ClientSession:
+        """Creates new aiohttp Client Session (see get_pool_config, prefix
+        'COUCHDB'). The pool is sized to the concurrency if not configured.
+
+        Args:
+            **kwargs (str): Keyword Arguments ('username' and 'password'
+            expected).
+
+        Returns:
+            ClientSession: New CouchDB Connection.
+        """
+        return ClientSession(
+            auth=BasicAuth(kwargs['username'], kwargs['password']),
+            connector=TCPConnector(
+                limit=self.__config['pool_size'] or self.concurrency,
+                force_close=not self.__config['keepalive']
+            ),
+            timeout=ClientTimeout(
+                connect=self.__config['connect_timeout'],
+                sock_read=self.__config['socket_timeout']
+            )
+        )
+
+    def __session(self) -> ClientSession:
+        # Sessions are bound to the running event loop, so the first call
+        # made inside the loop creates it.
+        if self.__connection is None:
+            self.__connection = self.create_connection(
+                username=os.getenv('ASOS_USERNAME'),
+                password=os.getenv('PASSWORD')
+            )
+
+        return self.__connection
+
+    async def __request(self, method: str, path: str, **kwargs) -> Any:
+        # Sends a request and returns the decoded JSON response.
+        async with self.__session().request(
+            method, f'{self.__url}/{path}', **kwargs
+        ) as response:
+            response.raise_for_status()
+
+            return await response.json()
+
+    @staticmethod
+    def __database_name(database: str, collection: str) -> str:
+        # Name of the CouchDB Database of a collection.
+        return '_'.join([database, collection]).lower()
+
+    async def __page(
+        self,
+        method: str,
+        path: str,
+        dataset: str,
+        timer: Timer,
+        action: Optional[str] = 'read',
+        **kwargs
+    ) -> Any:
+        # Fetches single page, recorded as one operation of the action.
+        with timer.phase('network'), self._operation(dataset, action):
+            return await self.__request(method, path, **kwargs)
+
+    async def __read_pages(
+        self,
+        database_name: str,
+        page_size: int,
+        dataset: str,
+        timer: Timer,
+        action: Optional[str] = 'read'
+    ) -> AsyncIterator[dict]:
+        # Fetches Documents page by page through _all_docs, the next page
+        # starts right after the last key of the previous one.
+        params = {'include_docs': 'true', 'limit': str(page_size)}
+
+        while True:
+            result = await self.__page(
+                'GET',
+                f'{database_name}/_all_docs',
+                dataset,
+                timer,
+                action,
+                params=params
+            )
+
+            for row in result['rows']:
+                yield row['doc']
+
+            if len(result['rows']) < page_size:
+                return
+
+            params['startkey'] = json.dumps(result['rows'][-1]['id'])
+            params['skip'] = '1'
+
+    async def __find_pages(
+        self,
+        database_name: str,
+        fields: List[str],
+        page_size: int,
+        dataset: str,
+        timer: Timer
+    ) -> AsyncIterator[dict]:
+        # Fetches projected Documents page by page through _find.
+        query = {
+            'selector': {'_id': {'$gt': None}},
+            'fields': fields,
+            'limit': page_size
+        }
+
+        while True:
+            result = await self.__page(
+                'POST', f'{database_name}/_find', dataset, timer, json=query
+            )
+
+            if not result['docs']:
+                return
+
+            for document in result['docs']:
+                yield document
+
+            query['bookmark'] = result['bookmark']
+
+    async def read_data(self, **kwargs: Any) -> int:
+        """Reads every entry in Database.
+
+        Args:
+            **kwargs (Any): Keyword Arguments ('database' and 'collection'
+            expected; 'fields', 'batch_size' and 'sink' optional, see
+            CouchDbDAO.read_data).
+
+        Returns:
+            int: Checksum of the read Documents.
+        """
+        database_name = self.__database_name(
+            kwargs['database'], kwargs['collection']
+        )
+        page_size = kwargs.get('batch_size') or self.__page_size
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'read'
+        ) as timer:
+            return await self._consume_async(
+                self.__read_pages(
+                    database_name, page_size, kwargs['collection'], timer
+                )
+                if kwargs.get('fields') is None
+                else self.__find_pages(
+                    database_name,
+                    kwargs['fields'],
+                    page_size,
+                    kwargs['collection'],
+                    timer
+                ),
+                timer,
+                kwargs.get('sink', 'print')
+            )
+
+    async def insert_data(self, **kwargs) -> None:
+        """Inserts Document to Database.
+
+        Args:
+            **kwargs (Union[str, dict]): Keyword Arguments ('database',
+            'collection' and 'data' expected).
+        """
+        await self.__request(
+            'POST',
+            self.__database_name(kwargs['database'], kwargs['collection']),
+            json=kwargs['data']
+        )
+
+    async def __bulk_docs(
+        self,
+        database_name: str,
+        documents: List[dict],
+        dataset: str,
+        action: str
+    ) -> None:
+        # Writes batch of Documents with one _bulk_docs request.
+        with self._operation(dataset, action):
+            await self.__request(
+                'POST',
+                f'{database_name}/_bulk_docs',
+                json={'docs': documents}
+            )
+
+    async def update_data(self, **kwargs) -> None:
+        """Updates Documents in Database, updated pages are written back
+        with concurrent _bulk_docs requests.
+
+        Args:
+            **kwargs (Union[str, List[dict]]): Keyword Arguments ('database',
+            'collection', 'key' and 'new_value' expected).
+        """
+        database_name = self.__database_name(
+            kwargs['database'], kwargs['collection']
+        )
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'update'
+        ) as timer:
+            documents = [
+                document | {kwargs['key']: kwargs['new_value']}
+                async for document in self.__read_pages(
+                    database_name,
+                    self.__page_size,
+                    kwargs['collection'],
+                    timer,
+                    'update'
+                )
+            ]
+
+            await self._bounded(
+                self.__bulk_docs(
+                    database_name,
+                    documents[start:start + self.__batch_size],
+                    kwargs['collection'],
+                    'update'
+                )
+                for start in range(0, len(documents), self.__batch_size)
+            )
+
+    async def delete_data(self, **kwargs) -> None:
+        """Removes every Document from Database.
+
+        Args:
+            **kwargs (str): Keyword Arguments ('database' and 'collection'
+            expected).
+        """
+        database_name = self.__database_name(
+            kwargs['database'], kwargs['collection']
+        )
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'delete'
+        ), self._operation(kwargs['collection'], 'delete'):
+            async with self.__session().delete(
+                f'{self.__url}/{database_name}'
+            ) as response:
+                # The Database does not exist before the first populate.
+                if response.status != 404:
+                    response.raise_for_status()
+
+            await self.__request('PUT', database_name)
+
+    async def close_connection(self) -> None:
+        """Closes the Client Session and its pooled connections."""
+        if self.__connection is not None:
+            await self.__connection.close()
+            self.__connection = None
+
+    async def populate_database(self, data_folder: str) -> None:
+        """Populates CouchDB Database from JSON Files in Data Folder with
+        concurrent _bulk_docs requests.
+
+        Args:
+            data_folder (str): Data Folder Path.
+        """
+        for file in os.listdir(data_folder):
+            database_name = self.__database_name(
+                os.getenv('DB_NAME'), file.split('.')[0]
+            )
+
+            with self._timed(
+                os.getenv('DB_NAME'), file.split('.')[0], 'insert'
+            ) as timer:
+                async with self.__session().head(
+                    f'{self.__url}/{database_name}'
+                ) as response:
+                    exists = response.status == 200
+
+                if not exists:
+                    await self.__request('PUT', database_name)
+
+                await self._bounded(
+                    self.__inserts(
+                        os.path.join(data_folder, file),
+                        database_name,
+                        file.split('.')[0],
+                        timer
+                    )
+                )
+
+    def __inserts(
+        self,
+        file_path: str,
+        database_name: str,
+        collection: str,
+        timer: Timer
+    ) -> Iterator[Awaitable[None]]:
+        # Parses the JSON File lazily, one _bulk_docs request per chunk.
+        for documents in timer.iterate(
+            iter_json_chunks(file_path, chunk_size=self.__batch_size),
+            'serialization'
+        ):
+            timer.add_records(len(documents))
+
+            yield self.__bulk_docs(
+                database_name, documents, collection, 'insert'
+            )
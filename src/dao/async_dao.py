@@ -0,0 +1,128 @@
+import asyncio
+from typing import (
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union
+)
+
+from dao.dao import DAO, READ_SINKS, Timer
+from stats.statistics import Statistics
+
+
+T = TypeVar('T')
+
+
+class AsyncDAO(DAO):
+
+    """Represents asyncio Data Access Object.
+
+    CRUD and populate methods keep the contract of the synchronous DAOs but
+    are coroutines, so many requests are kept in flight from one process.
+    Concurrent requests are bounded by a semaphore and timed with the same
+    instrumentation, so results land in the same Statistics.
+    """
+
+    def __init__(
+        self,
+        database_type: Optional[str] = None,
+        statistics: Optional[Statistics] = None,
+        concurrency: Optional[int] = 16,
+        instrumentation: Optional[bool] = True
+    ) -> None:
+        """Initializes the AsyncDAO Class.
+
+        Args:
+            database_type (Optional[str]): Type of NoSQL Database reported
+            to Statistics. Defaults to None.
+            statistics (Optional[Statistics]): Database Testing Statistics
+            Object. Nothing is recorded if not set. Defaults to None.
+            concurrency (Optional[int]): Maximum number of requests in
+            flight. Defaults to 16.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
+        """
+        super().__init__(
+            database_type=database_type,
+            statistics=statistics,
+            instrumentation=instrumentation
+        )
+
+        self.__concurrency: int = concurrency
+
+    @property
+    def concurrency(self) -> int:
+        """Returns maximum number of requests in flight.
+
+        Returns:
+            int: Maximum number of requests in flight.
+        """
+        return self.__concurrency
+
+    async def _bounded(self, awaitables: Iterable[Awaitable[T]]) -> List[T]:
+        """Awaits every awaitable with at most concurrency in flight.
+
+        Awaitables are created lazily from the iterable, so a streaming
+        source is never fully materialized.
+
+        Args:
+            awaitables (Iterable[Awaitable[T]]): Awaitables, e.g. requests.
+
+        Returns:
+            List[T]: Results in completion order.
+        """
+        results = []
+        pending = set()
+
+        for awaitable in awaitables:
+            if len(pending) >= self.__concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                results.extend(task.result() for task in done)
+
+            pending.add(asyncio.ensure_future(awaitable))
+
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            results.extend(task.result() for task in done)
+
+        return results
+
+    async def _consume_async(
+        self,
+        documents: AsyncIterable[T],
+        timer: Timer,
+        sink: Optional[Union[str, Callable[[T], None]]] = 'print'
+    ) -> int:
+        """Consumes asynchronously read Documents, see DAO._consume.
+
+        Args:
+            documents (AsyncIterable[T]): Read Documents.
+            timer (Timer): Timer of the surrounding read call.
+            sink (Optional[Union[str, Callable[[T], None]]]): 'print',
+            'null', 'checksum' or a callable. Defaults to 'print'.
+
+        Raises:
+            ValueError: Sink is unknown.
+
+        Returns:
+            int: Checksum of the Documents, 0 unless the sink is 'checksum'.
+        """
+        if not callable(sink) and sink not in READ_SINKS:
+            raise ValueError(f'Unknown read sink: {sink}')
+
+        checksum = 0
+        records = 0
+
+        async for document in documents:
+            records += 1
+            checksum = self._sink(document, timer, sink, checksum)
+
+        timer.add_records(records)
+
+        return checksum
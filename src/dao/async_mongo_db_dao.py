@@ -0,0 +1,205 @@
+import os
+from typing import Any, Awaitable, Iterator, List, Optional, Union
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import errors
+
+from dao.async_dao import AsyncDAO
+from dao.connection_pool import get_pool_config
+from dao.dao import Timer
+from stats.statistics import Statistics
+from utils.data_loader import iter_json_chunks
+
+
+class AsyncMongoDbDAO(AsyncDAO):
+
+    """Represents asyncio MongoDB Data Access Object (motor)."""
+
+    def __init__(
+        self,
+        statistics: Statistics,
+        chunk_size: Optional[int] = 1000,
+        concurrency: Optional[int] = 16,
+        instrumentation: Optional[bool] = True
+    ) -> None:
+        """Initializes the AsyncMongoDbDAO Class.
+
+        Args:
+            statistics (Statistics): Database Testing Statistics Object.
+            chunk_size (Optional[int]): Number of Documents sent with one
+            insert_many call. Defaults to 1000.
+            concurrency (Optional[int]): Maximum number of requests in
+            flight. Defaults to 16.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
+        """
+        super().__init__(
+            database_type='MongoDB (Async)',
+            statistics=statistics,
+            concurrency=concurrency,
+            instrumentation=instrumentation
+        )
+
+        self.__chunk_size: int = chunk_size
+        self.__port: int = 27017
+        self.__connection: AsyncIOMotorClient = self.create_connection()
+
+    def create_connection(self, **kwargs: str) -> AsyncIOMotorClient:
+        """Creates new motor Client (see get_pool_config, prefix
+        'MONGODB'). The pool is sized to the concurrency if not configured.
+
+        Returns:
+            AsyncIOMotorClient: New MongoDB Connection.
+        """
+        config = get_pool_config('MONGODB', self.__port)
+
+        options = {
+            'connectTimeoutMS': config['connect_timeout'],
+            'socketTimeoutMS': config['socket_timeout'],
+            'waitQueueTimeoutMS': config['pool_timeout']
+        }
+
+        return AsyncIOMotorClient(
+            host=f"mongodb://{config['host']}:{config['port']}/",
+            maxPoolSize=config['pool_size'] or self.concurrency,
+            **{
+                option: value * 1000 for option, value in options.items()
+                if value is not None
+            }
+        )
+
+    async def read_data(self, **kwargs: Any) -> int:
+        """Reads every entry in Collection.
+
+        Args:
+            **kwargs (Any): Keyword Arguments ('database' and 'collection'
+            expected; 'fields', 'batch_size' and 'sink' optional, see
+            MongoDbDAO.read_data).
+
+        Returns:
+            int: Checksum of the read Documents.
+        """
+        cursor = self.__connection[kwargs['database']][
+            kwargs['collection']
+        ].find(
+            {},
+            None if kwargs.get('fields') is None
+            else {field: 1 for field in kwargs['fields']}
+        )
+
+        if kwargs.get('batch_size') is not None:
+            cursor = cursor.batch_size(kwargs['batch_size'])
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'read'
+        ) as timer:
+            return await self._consume_async(
+                cursor, timer, kwargs.get('sink', 'print')
+            )
+
+    async def insert_data(self, **kwargs: Union[str, List[dict]]) -> None:
+        """Inserts entries to Collection, chunk-sized insert_many calls run
+        concurrently.
+
+        Args:
+            **kwargs (Union[str, List[dict]]): Keyword Arguments ('database',
+            'collection' and 'data' expected).
+        """
+        data = kwargs['data']
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'insert'
+        ) as timer:
+            await self._bounded(
+                self.__insert_many(
+                    kwargs['database'],
+                    kwargs['collection'],
+                    data[start:start + self.__chunk_size]
+                )
+                for start in range(0, len(data), self.__chunk_size)
+            )
+
+            timer.add_records(len(data))
+
+    async def __insert_many(
+        self,
+        database: str,
+        collection: str,
+        data: List[dict]
+    ) -> None:
+        # Inserts Documents with one insert_many call.
+        with self._operation(collection, 'insert'):
+            try:
+                await self.__connection[database][collection].insert_many(
+                    data, ordered=False
+                )
+
+            except errors.BulkWriteError as bwe:
+                print(bwe.details)
+                raise
+
+    async def update_data(self, **kwargs: Union[str, List[dict]]) -> None:
+        """Updates entries in Collection.
+
+        Args:
+            **kwargs (Union[str, List[dict]]): Keyword Arguments ('database',
+            'collection', 'old_values' and 'new_values' expected).
+        """
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'update'
+        ), self._operation(kwargs['collection'], 'update'):
+            await self.__connection[kwargs['database']][
+                kwargs['collection']
+            ].update_many(kwargs['old_values'], kwargs['new_values'])
+
+    async def delete_data(self, **kwargs: str) -> None:
+        """Removes every entry from Collection.
+
+        Args:
+            **kwargs (str): Keyword Arguments ('database' and 'collection'
+            expected).
+        """
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'delete'
+        ), self._operation(kwargs['collection'], 'delete'):
+            await self.__connection[kwargs['database']][
+                kwargs['collection']
+            ].delete_many({})
+
+    async def close_connection(self) -> None:
+        """Closes MongoDB Connection."""
+        self.__connection.close()
+
+    async def populate_database(self, data_folder: str) -> None:
+        """Populates MongoDB Database from JSON Files in Data Folder, chunks
+        are inserted concurrently while the next ones are parsed.
+
+        Args:
+            data_folder (str): Data Folder Path.
+        """
+        for file in os.listdir(data_folder):
+            with self._timed(
+                os.getenv('DB_NAME'), file.split('.')[0], 'insert'
+            ) as timer:
+                await self._bounded(
+                    self.__inserts(
+                        os.path.join(data_folder, file),
+                        file.split('.')[0],
+                        timer
+                    )
+                )
+
+    def __inserts(
+        self,
+        file_path: str,
+        collection: str,
+        timer: Timer
+    ) -> Iterator[Awaitable[None]]:
+        # Parses the JSON File lazily, one insert_many per chunk.
+        for data in timer.iterate(
+            iter_json_chunks(file_path, chunk_size=self.__chunk_size),
+            'serialization'
+        ):
+            timer.add_records(len(data))
+
+            yield self.__insert_many(os.getenv('DB_NAME'), collection, data)
@@ -0,0 +1,289 @@
+import json
+import os
+from typing import Any, AsyncIterator, Awaitable, Iterator, List, Optional
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.commands.json.path import Path
+
+from dao.async_dao import AsyncDAO
+from dao.connection_pool import get_pool_config
+from dao.dao import Timer
+from stats.statistics import Statistics
+from utils.data_loader import iter_json_chunks
+
+
+class AsyncRedisDAO(AsyncDAO):
+
+    """Represents asyncio Redis Data Access Object (redis.asyncio)."""
+
+    def __init__(
+        self,
+        statistics: Statistics,
+        batch_size: Optional[int] = 1000,
+        concurrency: Optional[int] = 16,
+        instrumentation: Optional[bool] = True
+    ) -> None:
+        """Initializes the AsyncRedisDAO Class.
+
+        Args:
+            statistics (Statistics): Database Testing Statistics Object.
+            batch_size (Optional[int]): Number of commands sent in one
+            Pipeline (or keys read with one JSON.MGET). Defaults to 1000.
+            concurrency (Optional[int]): Maximum number of requests in
+            flight. Defaults to 16.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
+        """
+        super().__init__(
+            database_type='Redis (Async)',
+            statistics=statistics,
+            concurrency=concurrency,
+            instrumentation=instrumentation
+        )
+
+        self.__batch_size: int = batch_size
+        self.__port: int = 6379
+        self.__connection: Redis = self.create_connection()
+
+    def create_connection(self, **kwargs) -> Redis:
+        """Creates new asyncio Redis Connection (see get_pool_config, prefix
+        'REDIS'). The pool is sized to the concurrency if not configured.
+
+        Returns:
+            Redis: New Redis Connection.
+        """
+        config = get_pool_config('REDIS', self.__port)
+
+        return Redis(
+            host=config['host'],
+            port=config['port'],
+            max_connections=config['pool_size'] or self.concurrency,
+            socket_connect_timeout=config['connect_timeout'],
+            socket_timeout=config['socket_timeout'],
+            socket_keepalive=config['keepalive'],
+            decode_responses=True
+        )
+
+    async def __keys(self, database_name: str) -> List[str]:
+        # Scans every key with the Database prefix.
+        return [
+            key async for key in self.__connection.scan_iter(
+                f'{database_name}*', count=self.__batch_size
+            )
+        ]
+
+    def __pipeline(self) -> Pipeline:
+        # The JSON module pipeline of redis 4.3 is synchronous even on the
+        # asyncio client, so JSON commands are sent raw through the asyncio
+        # Pipeline instead.
+        return self.__connection.pipeline(transaction=False)
+
+    def __batches(self, keys: List[str]) -> Iterator[List[str]]:
+        # Splits keys into batch-sized lists.
+        for start in range(0, len(keys), self.__batch_size):
+            yield keys[start:start + self.__batch_size]
+
+    async def read_data(self, **kwargs: Any) -> int:
+        """Reads every Document from the Database with a specific ID prefix,
+        JSON.MGET batches run concurrently.
+
+        Args:
+            **kwargs (Any): Keyword Arguments ('database' and 'collection'
+            expected; 'fields' and 'sink' optional, see RedisDAO.read_data).
+
+        Returns:
+            int: Checksum of the read Documents.
+        """
+        database_name = '_'.join(
+            [kwargs['database'], kwargs['collection']]
+        ).lower()
+        fields = kwargs.get('fields')
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'read'
+        ) as timer:
+            batches = await self._bounded(
+                self.__fetch_batch(keys, fields, kwargs['collection'])
+                for keys in self.__batches(await self.__keys(database_name))
+            )
+
+            return await self._consume_async(
+                self.__documents(batches), timer, kwargs.get('sink', 'print')
+            )
+
+    async def __fetch_batch(
+        self,
+        keys: List[str],
+        fields: Optional[List[str]],
+        dataset: str
+    ) -> List[Any]:
+        # JSON.MGET takes a single path, several projected fields are read
+        # with pipelined multi-path JSON.GET calls instead.
+        with self._operation(dataset, 'read'):
+            if fields is None or len(fields) == 1:
+                return await self.__connection.json().mget(
+                    keys,
+                    Path.root_path() if fields is None else f'$.{fields[0]}'
+                )
+
+            pipeline = self.__pipeline()
+
+            for key in keys:
+                pipeline.execute_command(
+                    'JSON.GET', key, *[f'$.{field}' for field in fields]
+                )
+
+            return [
+                None if value is None else json.loads(value)
+                for value in await pipeline.execute()
+            ]
+
+    @staticmethod
+    async def __documents(batches: List[List[Any]]) -> AsyncIterator[Any]:
+        # Flattens fetched batches.
+        for batch in batches:
+            for document in batch:
+                yield document
+
+    async def insert_data(self, **kwargs) -> None:
+        """Inserts key value pair to the Redis database.
+
+        Args:
+            **kwargs (str): Keyword Arguments ('key' and 'data' expected).
+        """
+        await self.__connection.json().set(
+            kwargs['key'], Path.root_path(), kwargs['data']
+        )
+
+    async def update_data(self, **kwargs) -> None:
+        """Sets a field of Documents on the server side, batches run
+        concurrently.
+
+        Args:
+            **kwargs (Union[str, List[str]]): Keyword Arguments ('database',
+            'collection', 'doc_ids', 'key' and 'new_value' expected).
+        """
+        database_name = '_'.join(
+            [kwargs['database'], kwargs['collection']]
+        ).lower()
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'update'
+        ):
+            doc_ids = (
+                kwargs['doc_ids'] or await self.__keys(database_name)
+            )
+
+            await self._bounded(
+                self.__update_batch(
+                    keys,
+                    kwargs['key'],
+                    kwargs['new_value'],
+                    kwargs['collection']
+                )
+                for keys in self.__batches(doc_ids)
+            )
+
+    async def __update_batch(
+        self,
+        keys: List[str],
+        key: str,
+        new_value: Any,
+        dataset: str
+    ) -> None:
+        # Sets the field of every key in one Pipeline.
+        with self._operation(dataset, 'update'):
+            pipeline = self.__pipeline()
+
+            for doc_id in keys:
+                pipeline.execute_command(
+                    'JSON.SET', doc_id, f'$.{key}', json.dumps(new_value)
+                )
+
+            await pipeline.execute()
+
+    async def delete_data(self, **kwargs) -> None:
+        """Removes every Document from Database with specific ID prefix,
+        UNLINK batches run concurrently.
+
+        Args:
+            **kwargs (str): Keyword Arguments ('database' and 'collection'
+            expected).
+        """
+        database_name = '_'.join(
+            [kwargs['database'], kwargs['collection']]
+        ).lower()
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'delete'
+        ):
+            await self._bounded(
+                self.__unlink(keys, kwargs['collection'])
+                for keys in self.__batches(await self.__keys(database_name))
+            )
+
+    async def __unlink(self, keys: List[str], dataset: str) -> None:
+        # Unlinks batch of keys.
+        with self._operation(dataset, 'delete'):
+            await self.__connection.unlink(*keys)
+
+    async def close_connection(self) -> None:
+        """Closes Redis Connection and disconnects its pool."""
+        await self.__connection.close()
+        await self.__connection.connection_pool.disconnect()
+
+    async def populate_database(self, data_folder: str) -> None:
+        """Populates Redis Database from JSON Files in Data Folder, one
+        Pipeline per chunk, Pipelines run concurrently.
+
+        Args:
+            data_folder (str): Data Folder Path.
+        """
+        for file in os.listdir(data_folder):
+            with self._timed(
+                os.getenv('DB_NAME'), file.split('.')[0], 'insert'
+            ) as timer:
+                await self._bounded(
+                    self.__inserts(
+                        os.path.join(data_folder, file),
+                        file.split('.')[0],
+                        timer
+                    )
+                )
+
+    def __inserts(
+        self,
+        file_path: str,
+        collection: str,
+        timer: Timer
+    ) -> Iterator[Awaitable[None]]:
+        # Parses the JSON File lazily, one Pipeline per chunk.
+        for records in timer.iterate(
+            iter_json_chunks(file_path, chunk_size=self.__batch_size),
+            'serialization'
+        ):
+            timer.add_records(len(records))
+
+            yield self.__insert_batch(records, collection)
+
+    async def __insert_batch(
+        self,
+        records: List[dict],
+        collection: str
+    ) -> None:
+        # Sets every Document of a chunk in one Pipeline.
+        with self._operation(collection, 'insert'):
+            pipeline = self.__pipeline()
+
+            for data in records:
+                pipeline.execute_command(
+                    'JSON.SET',
+                    '_'.join(
+                        [os.getenv('DB_NAME'), collection, str(data['id'])]
+                    ).lower(),
+                    Path.root_path(),
+                    json.dumps(data)
+                )
+
+            await pipeline.execute()
@@ -0,0 +1,69 @@
+import threading
+from typing import Optional
+
+
+class BatchSizeTuner:
+
+    """Represents Batch Size Tuner.
+
+    Adapts the batch size from observed batch latencies, so a batch takes
+    about the target latency: large enough to amortize per-request overhead,
+    small enough to keep transactions (and the locks they hold) short.
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        target_latency: Optional[float] = 1.0,
+        min_batch_size: Optional[int] = 500,
+        max_batch_size: Optional[int] = 50000
+    ) -> None:
+        """Initializes the BatchSizeTuner Class.
+
+        Args:
+            batch_size (int): Initial batch size.
+            target_latency (Optional[float]): Desired batch latency (sec).
+            Defaults to 1.0.
+            min_batch_size (Optional[int]): Smallest batch size. Defaults to
+            500.
+            max_batch_size (Optional[int]): Largest batch size. Defaults to
+            50000.
+        """
+        self.__batch_size: int = batch_size
+        self.__target_latency: float = target_latency
+        self.__min_batch_size: int = min_batch_size
+        self.__max_batch_size: int = max_batch_size
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def batch_size(self) -> int:
+        """Returns current batch size.
+
+        Returns:
+            int: Current batch size.
+        """
+        return self.__batch_size
+
+    def observe(self, rows: int, latency: float) -> None:
+        """Updates the batch size from one observed batch.
+
+        Args:
+            rows (int): Number of rows in the batch.
+            latency (float): Batch latency (sec).
+        """
+        if rows == 0 or latency <= 0:
+            return
+
+        ideal_batch_size = rows / latency * self.__target_latency
+
+        with self.__lock:
+            # Moves halfway towards the ideal size to smooth out noise.
+            self.__batch_size = int(
+                min(
+                    max(
+                        (self.__batch_size + ideal_batch_size) / 2,
+                        self.__min_batch_size
+                    ),
+                    self.__max_batch_size
+                )
+            )
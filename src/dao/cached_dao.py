@@ -0,0 +1,308 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from dao.dao import DAO
+from dao.redis_dao import RedisDAO
+from stats.statistics import Statistics
+
+
+WRITE_POLICIES = ['invalidate', 'write_through']
+
+
+class CachedDAO(DAO):
+
+    """Represents read-through caching decorator of another DAO.
+
+    Read results are cached per read call (Database, collection and read
+    options) in an in-process LRU cache with a time to live, optionally
+    backed by Redis as a shared second tier. Writes go to the wrapped DAO
+    and either invalidate or refresh the cached reads of the collection.
+
+    Lookups are recorded as 'cache_hit', 'cache_hit_l2' and 'cache_miss'
+    latencies, so the hit ratio and the latency split between hits and
+    misses end up in Statistics (see Statistics.cache_summary). The wrapped
+    DAO is usually created with instrumentation off, so misses are not
+    reported twice.
+    """
+
+    def __init__(
+        self,
+        dao: DAO,
+        statistics: Statistics,
+        capacity: Optional[int] = 1024,
+        ttl: Optional[float] = 60.0,
+        write_policy: Optional[str] = 'invalidate',
+        redis_dao: Optional[RedisDAO] = None,
+        instrumentation: Optional[bool] = True,
+        l2_ttl: Optional[float] = None
+    ) -> None:
+        """Initializes the CachedDAO Class.
+
+        Args:
+            dao (DAO): Wrapped Data Access Object.
+            statistics (Statistics): Database Testing Statistics Object.
+            capacity (Optional[int]): Maximum number of cached reads in the
+            in-process tier, least recently used reads are evicted first.
+            Defaults to 1024.
+            ttl (Optional[float]): Time to live of cached reads in the
+            in-process tier in seconds. Defaults to 60.0.
+            write_policy (Optional[str]): 'invalidate' drops the cached
+            reads of a written collection, 'write_through' reads them again
+            from the wrapped DAO. Defaults to 'invalidate'.
+            redis_dao (Optional[RedisDAO]): Redis DAO whose Connection Pool
+            backs the second cache tier. Single tier if not set. Defaults to
+            None.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
+            l2_ttl (Optional[float]): Time to live of cached reads in the
+            Redis tier in seconds, usually longer than ttl, so reads expired
+            or evicted from the in-process tier are still served by Redis.
+            Uses ttl if not set. Defaults to None.
+
+        Raises:
+            ValueError: Write policy is unknown.
+        """
+        if write_policy not in WRITE_POLICIES:
+            raise ValueError(f'Unknown write policy: {write_policy}')
+
+        # Type the wrapped DAO was created with, without state dependent
+        # variants such as MongoDB (No Index) before indexes are created.
+        wrapped_type = DAO.database_type.fget(dao)
+
+        super().__init__(
+            database_type=(
+                f'{wrapped_type} (Cached)' if redis_dao is None
+                else f'{wrapped_type} (Cached, Redis)'
+            ),
+            statistics=statistics,
+            instrumentation=instrumentation
+        )
+
+        self.__dao: DAO = dao
+        self.__capacity: int = capacity
+        self.__ttl: float = ttl
+        self.__l2_ttl: float = ttl if l2_ttl is None else l2_ttl
+        self.__write_policy: str = write_policy
+        self.__redis_dao: Optional[RedisDAO] = redis_dao
+        self.__entries: OrderedDict[str, Tuple[float, List[Any]]] = (
+            OrderedDict()
+        )
+        self.__reads: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def dao(self) -> DAO:
+        """Returns wrapped Data Access Object.
+
+        Returns:
+            DAO: Wrapped Data Access Object.
+        """
+        return self.__dao
+
+    def create_connection(self, **kwargs) -> None:
+        """Connections are owned by the wrapped DAO and the Redis DAO."""
+
+    def __key(self, read: Dict[str, Any]) -> str:
+        # Cache key of a read call, the wrapped Database type keeps reads of
+        # different Databases apart in the shared Redis tier.
+        return 'cache:' + hashlib.sha1(
+            json.dumps(
+                [self.__dao.database_type, read], sort_keys=True, default=str
+            ).encode()
+        ).hexdigest()
+
+    def __get_local(self, key: str) -> Optional[List[Any]]:
+        # Returns unexpired Documents from the in-process tier.
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry[0] < time.monotonic():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+
+            return entry[1]
+
+    def __put_local(self, key: str, documents: List[Any]) -> None:
+        # Stores Documents in the in-process tier, evicting the least
+        # recently used reads beyond the capacity.
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.__ttl, documents)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.__capacity:
+                self.__entries.popitem(last=False)
+
+    def __get_remote(self, key: str) -> Optional[List[Any]]:
+        # Returns Documents from the Redis tier, which expires them itself.
+        if self.__redis_dao is None:
+            return None
+
+        value = self.__redis_dao.connection.get(key)
+
+        return None if value is None else json.loads(value)
+
+    def __put_remote(self, key: str, documents: List[Any]) -> None:
+        # Stores Documents in the Redis tier, values that are not JSON types
+        # (e.g. ObjectId) are stored as strings.
+        if self.__redis_dao is None:
+            return
+
+        self.__redis_dao.connection.set(
+            key,
+            json.dumps(documents, default=str),
+            px=int(self.__l2_ttl * 1000)
+        )
+
+    def __load(self, key: str, read: Dict[str, Any]) -> List[Any]:
+        # Reads Documents from the wrapped DAO and caches them in both tiers.
+        documents = []
+
+        self.__dao.read_data(**read, sink=documents.append)
+        self.__put_local(key, documents)
+        self.__put_remote(key, documents)
+        self.__remember(key, read)
+
+        return documents
+
+    def __remember(self, key: str, read: Dict[str, Any]) -> None:
+        # Tracks cached reads per collection, so writes can find them.
+        with self.__lock:
+            self.__reads.setdefault(
+                (read['database'], read.get('collection')), {}
+            )[key] = read
+
+    def read_data(self, **kwargs: Any) -> int:
+        """Reads Documents through the cache, misses are read from the
+        wrapped DAO.
+
+        Args:
+            **kwargs (Any): Keyword Arguments of the wrapped DAO read_data
+            ('database' expected, 'sink' optional, see DAO._consume).
+
+        Returns:
+            int: Checksum of the read Documents.
+        """
+        read = {
+            name: value for name, value in kwargs.items() if name != 'sink'
+        }
+        key = self.__key(read)
+
+        with self._timed(
+            kwargs['database'], kwargs.get('collection'), 'read'
+        ) as timer:
+            start_time = time.perf_counter_ns()
+            action = 'cache_hit'
+            documents = self.__get_local(key)
+
+            if documents is None:
+                action = 'cache_hit_l2'
+                documents = self.__get_remote(key)
+
+                if documents is not None:
+                    self.__put_local(key, documents)
+                    self.__remember(key, read)
+
+            if documents is None:
+                action = 'cache_miss'
+
+                with timer.phase('network'):
+                    documents = self.__load(key, read)
+
+            self._add_latency(
+                kwargs.get('collection'),
+                action,
+                time.perf_counter_ns() - start_time
+            )
+
+            return self._consume(documents, timer, kwargs.get('sink', 'print'))
+
+    def __written(self, database: str, collection: Optional[str]) -> None:
+        # Applies the write policy to the cached reads of a collection, or
+        # of the whole Database if the write names no collection.
+        with self.__lock:
+            datasets = [
+                dataset for dataset in self.__reads
+                if dataset[0] == database
+                and collection in (None, dataset[1])
+            ]
+            reads = {}
+
+            for dataset in datasets:
+                reads.update(self.__reads.pop(dataset))
+
+            for key in reads:
+                self.__entries.pop(key, None)
+
+        if self.__write_policy == 'write_through':
+            for key, read in reads.items():
+                self.__load(key, read)
+
+        elif self.__redis_dao is not None and reads:
+            self.__redis_dao.connection.unlink(*reads)
+
+    def insert_data(self, **kwargs: Any) -> None:
+        """Inserts Documents with the wrapped DAO, see write_policy.
+
+        Args:
+            **kwargs (Any): Keyword Arguments of the wrapped DAO insert_data.
+        """
+        self.__dao.insert_data(**kwargs)
+        self.__written(kwargs.get('database'), kwargs.get('collection'))
+
+    def update_data(self, **kwargs: Any) -> None:
+        """Updates Documents with the wrapped DAO, see write_policy.
+
+        Args:
+            **kwargs (Any): Keyword Arguments of the wrapped DAO update_data.
+        """
+        with self._timed(
+            kwargs.get('database'), kwargs.get('collection'), 'update'
+        ):
+            self.__dao.update_data(**kwargs)
+            self.__written(kwargs.get('database'), kwargs.get('collection'))
+
+    def delete_data(self, **kwargs: Any) -> None:
+        """Removes Documents with the wrapped DAO, see write_policy.
+
+        Args:
+            **kwargs (Any): Keyword Arguments of the wrapped DAO delete_data.
+        """
+        with self._timed(
+            kwargs.get('database'), kwargs.get('collection'), 'delete'
+        ):
+            self.__dao.delete_data(**kwargs)
+            self.__written(kwargs.get('database'), kwargs.get('collection'))
+
+    def clear(self) -> None:
+        """Drops every cached read from both tiers."""
+        with self.__lock:
+            keys = [
+                key for reads in self.__reads.values() for key in reads
+            ]
+            self.__entries.clear()
+            self.__reads.clear()
+
+        if self.__redis_dao is not None and keys:
+            self.__redis_dao.connection.unlink(*keys)
+
+    def close_connection(self) -> None:
+        """Closes the wrapped DAO, the Redis DAO is closed by its owner."""
+        self.__dao.close_connection()
+
+    def populate_database(self, data_folder: str) -> None:
+        """Populates the Database with the wrapped DAO and clears the cache.
+
+        Args:
+            data_folder (str): Data Folder Path.
+        """
+        self.__dao.populate_database(data_folder)
+        self.clear()
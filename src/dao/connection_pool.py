@@ -0,0 +1,145 @@
+import os
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from stats.latency_histogram import LatencyHistogram
+
+
+def get_pool_config(prefix: str, port: int) -> Dict[str, Any]:
+    """Returns connection pool configuration of a Database from environment.
+
+    Read variables are prefixed with the Database name, e.g. MONGODB_HOST,
+    MONGODB_PORT, MONGODB_POOL_SIZE, MONGODB_CONNECT_TIMEOUT,
+    MONGODB_SOCKET_TIMEOUT, MONGODB_POOL_TIMEOUT and MONGODB_KEEPALIVE.
+    Timeouts are in seconds.
+
+    Args:
+        prefix (str): Environment variable prefix ('MONGODB', 'REDIS',
+        'NEO4J' or 'COUCHDB').
+        port (int): Default port.
+
+    Returns:
+        Dict[str, Any]: 'host', 'port', 'pool_size', 'connect_timeout',
+        'socket_timeout', 'pool_timeout' and 'keepalive'. Unset options are
+        None, so the client default is used.
+    """
+    def get(name: str, cast: Callable[[str], Any]) -> Any:
+        value = os.getenv(f'{prefix}_{name}')
+
+        return None if value in (None, '') else cast(value)
+
+    keepalive = get('KEEPALIVE', str)
+
+    return {
+        'host': get('HOST', str) or 'localhost',
+        'port': get('PORT', int) or port,
+        'pool_size': get('POOL_SIZE', int),
+        'connect_timeout': get('CONNECT_TIMEOUT', float),
+        'socket_timeout': get('SOCKET_TIMEOUT', float),
+        'pool_timeout': get('POOL_TIMEOUT', float),
+        'keepalive': (
+            True if keepalive is None
+            else keepalive.lower() in ('1', 'true', 'yes')
+        )
+    }
+
+
+class PoolWaitRecorder:
+
+    """Represents thread-safe recorder of connection pool wait times."""
+
+    def __init__(self) -> None:
+        """Initializes the PoolWaitRecorder Class."""
+        self.__histogram: LatencyHistogram = LatencyHistogram()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def record_ns(self, wait: int) -> None:
+        """Records time spent waiting for a pooled connection.
+
+        Args:
+            wait (int): Wait time in nanoseconds.
+        """
+        with self.__lock:
+            self.__histogram.record_ns(wait)
+
+    def drain(self) -> LatencyHistogram:
+        """Returns recorded wait times and starts a new Histogram.
+
+        Returns:
+            LatencyHistogram: Wait times recorded since the last drain.
+        """
+        with self.__lock:
+            histogram = self.__histogram
+            self.__histogram = LatencyHistogram()
+
+        return histogram
+
+
+# Shared pools keyed by Database and configuration, with reference counts.
+_pools: Dict[Tuple, Tuple[Any, PoolWaitRecorder, int]] = {}
+_pools_lock: threading.Lock = threading.Lock()
+
+
+def acquire_pool(
+    key: Tuple,
+    factory: Callable[[PoolWaitRecorder], Any]
+) -> Tuple[Any, PoolWaitRecorder]:
+    """Returns the shared client of a pool key, creating it on first use.
+
+    Every DAO (and worker thread) of the process configured the same way
+    reuses one client and its connection pool.
+
+    Args:
+        key (Tuple): Pool key, e.g. Database name and configuration.
+        factory (Callable[[PoolWaitRecorder], Any]): Creates the client,
+        wait times are reported to the given recorder.
+
+    Returns:
+        Tuple[Any, PoolWaitRecorder]: Shared client and its wait recorder.
+    """
+    with _pools_lock:
+        if key in _pools:
+            client, recorder, references = _pools[key]
+
+        else:
+            recorder = PoolWaitRecorder()
+            client, references = factory(recorder), 0
+
+        _pools[key] = (client, recorder, references + 1)
+
+    return client, recorder
+
+
+def release_pool(key: Tuple, close: Callable[[Any], None]) -> None:
+    """Releases the shared client of a pool key, the last release closes it.
+
+    Args:
+        key (Tuple): Pool key.
+        close (Callable[[Any], None]): Closes the client.
+    """
+    with _pools_lock:
+        if key not in _pools:
+            return
+
+        client, recorder, references = _pools[key]
+
+        if references > 1:
+            _pools[key] = (client, recorder, references - 1)
+            return
+
+        del _pools[key]
+
+    close(client)
+
+
+def pool_key(prefix: str, config: Dict[str, Any]) -> Tuple:
+    """Returns hashable pool key of a Database configuration.
+
+    Args:
+        prefix (str): Database name, see get_pool_config.
+        config (Dict[str, Any]): Pool configuration.
+
+    Returns:
+        Tuple: Pool key.
+    """
+    return (prefix, os.getpid(), *sorted(config.items()))
@@ -1,34 +1,61 @@
-import json
 import os
-import time
-
-from couchdb import Server
-
-from dao.dao import DAO
+from typing import Dict, Iterator, List, Optional
+
+from couchdb import Database, Document, Server
+from couchdb.http import ResourceConflict, Session
+
+from dao.connection_pool import (
+    acquire_pool,
+    get_pool_config,
+    pool_key,
+    release_pool
+)
+from dao.dao import DAO, Timer
 from stats.statistics import Statistics
+from utils.data_loader import iter_json_chunks
 
 
 class CouchDbDAO(DAO):
 
     """Represents CouchDB Data Access Object."""
 
-    def __init__(self, statistics: Statistics) -> None:
+    def __init__(
+        self,
+        statistics: Statistics,
+        batch_size: Optional[int] = 1000,
+        page_size: Optional[int] = 1000,
+        instrumentation: Optional[bool] = True
+    ) -> None:
         """Initializes the CouchDbDAO Class.
 
         Args:
             statistics (Statistics): Database Testing Statistics Object.
+            batch_size (Optional[int]): Number of Documents sent in one
+            _bulk_docs request. Defaults to 1000.
+            page_size (Optional[int]): Number of Documents fetched in one
+            _all_docs request. Defaults to 1000.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
         """
-        super().__init__()
+        super().__init__(
+            database_type='CouchDB',
+            statistics=statistics,
+            instrumentation=instrumentation
+        )
         
-        self.__database_type: str = 'CouchDB'
+        self.__batch_size: int = batch_size
+        self.__page_size: int = page_size
         self.__connection: Server = self.create_connection(
             username=os.getenv('ASOS_USERNAME'),
             password=os.getenv('PASSWORD')
         )
-        self.__statistics: Statistics = statistics
 
     def create_connection(self, **kwargs) -> Server:
-        """Creates new CouchDB Connection.
+        """Creates new CouchDB Connection, or reuses the shared Server with
+        the same configuration (see get_pool_config, prefix 'COUCHDB').
+
+        The HTTP Session keeps idle connections alive for reuse, its pool
+        is not bounded, so only the host, port and socket timeout apply.
 
         Args:
             **kwargs (str): Keyword Arguments ('username' and 'password'
@@ -37,35 +64,65 @@ class CouchDbDAO(DAO):
         Returns:
             Server: New CouchDB Connection.
         """
-        server = Server()
-        server.resource.credentials = (kwargs['username'], kwargs['password'])
+        config = get_pool_config('COUCHDB', 5984)
+        self.__pool_key = pool_key(
+            'COUCHDB', config | {'username': kwargs['username']}
+        )
+
+        def create_server(recorder) -> Server:
+            server = Server(
+                f"http://{config['host']}:{config['port']}/",
+                session=Session(timeout=config['socket_timeout'])
+            )
+            server.resource.credentials = (
+                kwargs['username'], kwargs['password']
+            )
+
+            return server
+
+        server, _ = acquire_pool(self.__pool_key, create_server)
 
         return server
 
-    def read_data(self, **kwargs) -> None:
+    def read_data(self, **kwargs) -> int:
         """Reads every entry in Database.
 
         Args:
-            **kwargs (str): Keyword Arguments ('database' and 'collection'
-            expected).
+            **kwargs (Union[str, int, List[str]]): Keyword Arguments 
+            ('database' and 'collection' expected; 'fields', 'batch_size' and 
+            'sink' optional). Projected fields are selected on the server 
+            with _find, the batch size overrides the page size. Sink see 
+            DAO._consume.
+
+        Returns:
+            int: Checksum of the read Documents.
         """
         database_name = (
             '_'.join([kwargs['database'], kwargs['collection']]).lower()
         )
-
-        start_time = time.time()
-
-        for _id in self.__connection[database_name]:
-            print(self.__connection[database_name][_id])
-
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='read',
-            time=time.time() - start_time
-        )
-
+        page_size = kwargs.get('batch_size') or self.__page_size
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'read'
+        ) as timer:
+            return self._consume(
+                self._operations(
+                    self.__read_pages(
+                        self.__connection[database_name],
+                        page_size=page_size
+                    ) if kwargs.get('fields') is None
+                    else self.__find_pages(
+                        self.__connection[database_name],
+                        kwargs['fields'],
+                        page_size
+                    ),
+                    timer,
+                    kwargs['collection'],
+                    'read'
+                ),
+                timer,
+                kwargs.get('sink', 'print')
+            )
 
     def insert_data(self, **kwargs) -> None:
         """Inserts Document to Database.
@@ -78,6 +135,31 @@ class CouchDbDAO(DAO):
             '_'.join([kwargs['database'], kwargs['collection']]).lower()
         ].save(kwargs['data'])
 
+    def bulk_insert_data(self, **kwargs) -> Dict[str, int]:
+        """Inserts batch of Documents to Database with one _bulk_docs request.
+
+        Args:
+            **kwargs (Union[str, List[dict]]): Keyword Arguments ('database',
+            'collection' and 'data' expected).
+
+        Returns:
+            Dict[str, int]: Number of inserted, conflicting and failed
+            Documents.
+        """
+        result = {'inserted': 0, 'conflicts': 0, 'errors': 0}
+
+        for success, _, error in self.__connection[
+            '_'.join([kwargs['database'], kwargs['collection']]).lower()
+        ].update(kwargs['data']):
+            if success:
+                result['inserted'] += 1
+            elif isinstance(error, ResourceConflict):
+                result['conflicts'] += 1
+            else:
+                result['errors'] += 1
+
+        return result
+
     def update_data(self, **kwargs) -> None:
         """Updates Documents in Database.
 
@@ -89,83 +171,189 @@ class CouchDbDAO(DAO):
             '_'.join([kwargs['database'], kwargs['collection']]).lower()
         )
 
-        start_time = time.time()
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'update'
+        ) as timer:
+            database = self.__connection[database_name]
+            documents = []
 
-        doc_ids = kwargs['doc_ids']
-        if doc_ids is None or len(doc_ids) == 0:
-            doc_ids = []
-
-            for _id in self.__connection[database_name]:
-                doc_ids.append(_id)
-
-        for doc_id in doc_ids:
-            document = self.__connection[database_name][doc_id]
-            document[kwargs['key']] = kwargs['new_value']
-            self.__connection[database_name].save(document)
-
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='update',
-            time=time.time() - start_time
-        )
+            for document in self.__read_pages(database, kwargs['doc_ids']):
+                document[kwargs['key']] = kwargs['new_value']
+                documents.append(document)
+
+                if len(documents) == self.__batch_size:
+                    self.__write_back(
+                        database, documents, kwargs['collection'], timer
+                    )
+                    documents = []
+
+            if documents:
+                self.__write_back(
+                    database, documents, kwargs['collection'], timer
+                )
 
     def delete_data(self, **kwargs):
-        """Removes every Document from Database.
+        """Removes every Document from Database, a missing Database is
+        created empty.
 
         Args:
             **kwargs (str): Keyword Arguments ('database' and 'collection' 
             expected).
         """
-        start_time = time.time()
         database_name = (
             '_'.join([kwargs['database'], kwargs['collection']]).lower()
         )
 
-        self.__connection.delete(database_name)
-        self.__connection.create(database_name)
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'delete'
+        ), self._operation(kwargs['collection'], 'delete'):
+            # The Database does not exist before the first populate.
+            if database_name in self.__connection:
+                self.__connection.delete(database_name)
 
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='delete',
-            time=time.time() - start_time
-        )
+            self.__connection.create(database_name)
 
     def close_connection(self):
-        """Closes CouchDB Connection."""
+        """Releases CouchDB Connection, the last user of the shared Server
+        closes its pooled HTTP connections."""
+        release_pool(self.__pool_key, self.__close_server)
         self.__connection = None
 
-    def populate_database(self, data_folder: str) -> None:
+    @staticmethod
+    def __close_server(server: Server) -> None:
+        # Closes every idle HTTP connection of the Session pool.
+        connection_pool = server.resource.session.connection_pool
+
+        with connection_pool.lock:
+            for connections in connection_pool.conns.values():
+                for connection in connections:
+                    connection.close()
+
+            connection_pool.conns.clear()
+
+    def __read_pages(
+        self,
+        database: Database,
+        doc_ids: Optional[List[str]] = None,
+        page_size: Optional[int] = None
+    ) -> Iterator[Document]:
+        # Fetches Documents page by page through _all_docs with
+        # include_docs, so every page costs a single request.
+        page_size = page_size or self.__page_size
+
+        if doc_ids is None or len(doc_ids) == 0:
+            for row in database.iterview(
+                '_all_docs', page_size, include_docs=True
+            ):
+                yield row.doc
+
+        else:
+            for page in range(0, len(doc_ids), page_size):
+                for row in database.view(
+                    '_all_docs',
+                    keys=doc_ids[page:page + page_size],
+                    include_docs=True
+                ):
+                    if row.doc is not None:
+                        yield row.doc
+
+    def __find_pages(
+        self,
+        database: Database,
+        fields: List[str],
+        page_size: int
+    ) -> Iterator[dict]:
+        # Fetches projected Documents page by page through _find, the next 
+        # page continues from the bookmark of the previous one.
+        query = {
+            'selector': {'_id': {'$gt': None}},
+            'fields': fields,
+            'limit': page_size
+        }
+
+        while True:
+            _, _, result = database.resource.post_json('_find', body=query)
+
+            if not result['docs']:
+                return
+
+            yield from result['docs']
+
+            query['bookmark'] = result['bookmark']
+
+    def __write_back(
+        self,
+        database: Database,
+        documents: List[Document],
+        dataset: str,
+        timer: Timer
+    ) -> None:
+        # Writes updated Documents back with one _bulk_docs request.
+        with timer.phase('network'), self._operation(dataset, 'update'):
+            database.update(documents)
+
+    def populate_database(
+        self,
+        data_folder: str,
+        bulk: Optional[bool] = False
+    ) -> None:
         """Populates CouchDB Database from JSON Files in Data Folder.
 
         Args:
             data_folder (str): Data Folder Path.
+            bulk (Optional[bool]): Insert Documents in _bulk_docs batches
+            instead of one request per Document. Bulk insert times are
+            recorded as 'CouchDB (Bulk)'. Defaults to False.
         """
-        for file in os.listdir(data_folder):
-            start_time = time.time()
+        database_type = 'CouchDB (Bulk)' if bulk else None
 
+        for file in os.listdir(data_folder):
             database_name = (
                 '_'.join([os.getenv('DB_NAME'), file.split('.')[0]]).lower()
             )
 
-            if database_name not in self.__connection:
-                self.__connection.create(database_name)
-
-            with open(os.path.join(data_folder, file)) as json_file:
-                for line in json_file:
-                    self.insert_data(
-                        database=os.getenv('DB_NAME'),
-                        collection=file.split('.')[0],
-                        data=json.loads(line)
-                    )
-
-            self.__statistics.add_execution_time(
-                database_type=self.__database_type,
-                database=os.getenv('DB_NAME'),
-                dataset=file.split('.')[0],
-                action='insert',
-                time=time.time() - start_time
-            )
+            with self._timed(
+                os.getenv('DB_NAME'),
+                file.split('.')[0],
+                'insert',
+                database_type
+            ) as timer:
+                if database_name not in self.__connection:
+                    self.__connection.create(database_name)
+
+                chunks = timer.iterate(
+                    iter_json_chunks(
+                        os.path.join(data_folder, file),
+                        chunk_size=self.__batch_size
+                    ),
+                    'serialization'
+                )
+
+                if bulk:
+                    for batch, documents in enumerate(chunks):
+                        with timer.phase('network'), self._operation(
+                            file.split('.')[0], 'insert', database_type
+                        ):
+                            result = self.bulk_insert_data(
+                                database=os.getenv('DB_NAME'),
+                                collection=file.split('.')[0],
+                                data=documents
+                            )
+
+                        if result['conflicts'] or result['errors']:
+                            print(
+                                {'dataset': file.split('.')[0], 'batch': batch}
+                                | result
+                            )
+
+                else:
+                    for documents in chunks:
+                        for data in documents:
+                            with timer.phase('network'), self._operation(
+                                file.split('.')[0], 'insert'
+                            ):
+                                self.insert_data(
+                                    database=os.getenv('DB_NAME'),
+                                    collection=file.split('.')[0],
+                                    data=data
+                                )
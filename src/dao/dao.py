@@ -1,8 +1,477 @@
+import time
+import zlib
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union
+)
+
+from dao.connection_pool import PoolWaitRecorder
+from stats.statistics import Statistics
+
+
+T = TypeVar('T')
+
+
+READ_SINKS = ['print', 'null', 'checksum']
+
+
+class Timer:
+
+    """Represents timing of single instrumented DAO call.
+
+    Besides the total time, parts of the call can be attributed to phases
+    ('serialization', 'network' and 'materialization').
+    """
+
+    def __init__(self, enabled: Optional[bool] = True) -> None:
+        """Initializes the Timer Class.
+
+        Args:
+            enabled (Optional[bool]): Measure phases. Defaults to True.
+        """
+        self.__enabled: bool = enabled
+        self.__phases: Dict[str, int] = {}
+        self.__records: int = 0
+
+    @property
+    def phases(self) -> Dict[str, int]:
+        """Returns time spent in each phase.
+
+        Returns:
+            Dict[str, int]: Phase names mapped to nanoseconds.
+        """
+        return self.__phases
+
+    @property
+    def records(self) -> int:
+        """Returns number of records processed by the call.
+
+        Returns:
+            int: Number of processed records.
+        """
+        return self.__records
+
+    def add_records(self, records: int) -> None:
+        """Counts records processed by the call, reported as throughput.
+
+        Args:
+            records (int): Number of processed records.
+        """
+        if self.__enabled:
+            self.__records += records
+
+    def add(self, name: str, duration: int) -> None:
+        """Adds measured duration to a phase.
+
+        Args:
+            name (str): Phase name.
+            duration (int): Duration in nanoseconds.
+        """
+        if self.__enabled:
+            self.__phases[name] = self.__phases.get(name, 0) + duration
+
+    @contextmanager
+    def __measure(self, name: str) -> Iterator[None]:
+        start_time = time.perf_counter_ns()
+
+        try:
+            yield
+
+        finally:
+            self.add(name, time.perf_counter_ns() - start_time)
+
+    def iterate(self, iterable: Iterable[T], name: str) -> Iterator[T]:
+        """Attributes every fetch from the iterable to a phase.
+
+        Args:
+            iterable (Iterable[T]): Iterable, e.g. a streaming file loader.
+            name (str): Phase name.
+
+        Yields:
+            T: Fetched items.
+        """
+        iterator = iter(iterable)
+
+        while True:
+            start_time = time.perf_counter_ns()
+
+            try:
+                item = next(iterator)
+
+            except StopIteration:
+                return
+
+            finally:
+                self.add(name, time.perf_counter_ns() - start_time)
+
+            yield item
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """Attributes the wrapped code to a phase.
+
+        Args:
+            name (str): Phase name.
+
+        Returns:
+            ContextManager[None]: Phase measuring Context Manager.
+        """
+        if not self.__enabled:
+            return nullcontext()
+
+        return self.__measure(name)
 
 
 class DAO(ABC):
 
+    """Represents Data Access Object with shared instrumentation.
+
+    Every CRUD call is timed with a monotonic perf_counter_ns clock and
+    reported to Statistics. Instrumentation can be switched off for
+    zero-overhead runs.
+    """
+
+    def __init__(
+        self,
+        database_type: Optional[str] = None,
+        statistics: Optional[Statistics] = None,
+        instrumentation: Optional[bool] = True
+    ) -> None:
+        """Initializes the DAO Class.
+
+        Args:
+            database_type (Optional[str]): Type of NoSQL Database reported
+            to Statistics. Defaults to None.
+            statistics (Optional[Statistics]): Database Testing Statistics
+            Object. Nothing is recorded if not set. Defaults to None.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
+        """
+        self.__database_type: Optional[str] = database_type
+        self.__statistics: Optional[Statistics] = statistics
+        self.__instrumentation: bool = (
+            instrumentation and statistics is not None
+        )
+        self.__disabled_timer: Timer = Timer(enabled=False)
+
+    @property
+    def database_type(self) -> Optional[str]:
+        """Returns Database type reported to Statistics.
+
+        Returns:
+            Optional[str]: Reported Database type.
+        """
+        return self.__database_type
+
+    @property
+    def instrumentation(self) -> bool:
+        """Returns whether CRUD calls are timed.
+
+        Returns:
+            bool: True if CRUD calls are timed.
+        """
+        return self.__instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation: bool) -> None:
+        """Switches timing of CRUD calls on or off.
+
+        Args:
+            instrumentation (bool): Time CRUD calls.
+        """
+        self.__instrumentation = (
+            instrumentation and self.__statistics is not None
+        )
+
+    @contextmanager
+    def __timed(
+        self,
+        database: str,
+        dataset: str,
+        action: str,
+        database_type: str
+    ) -> Iterator[Timer]:
+        timer = Timer()
+        start_time = time.perf_counter_ns()
+
+        yield timer
+
+        total = time.perf_counter_ns() - start_time
+
+        self.__statistics.add_execution_time(
+            database_type=database_type,
+            database=database,
+            dataset=dataset,
+            action=action,
+            time=total / 1e9
+        )
+
+        for phase, duration in timer.phases.items():
+            self.__statistics.add_execution_time(
+                database_type=database_type,
+                database=database,
+                dataset=dataset,
+                action=action,
+                time=duration / 1e9,
+                phase=phase
+            )
+
+        if timer.records > 0:
+            self.__statistics.add_throughput(
+                database_type=database_type,
+                database=database,
+                dataset=dataset,
+                action=action,
+                records=timer.records,
+                time=total / 1e9
+            )
+
+    def _timed(
+        self,
+        database: str,
+        dataset: str,
+        action: str,
+        database_type: Optional[str] = None
+    ) -> ContextManager[Timer]:
+        """Times the wrapped CRUD call and reports it to Statistics.
+
+        Args:
+            database (str): Name of the NoSQL Database.
+            dataset (str): Name of the Dataset/Collection.
+            action (str): Measured action.
+            database_type (Optional[str]): Reported Database type, e.g. a
+            variant like 'CouchDB (Bulk)'. Defaults to the DAO Database type.
+
+        Returns:
+            ContextManager[Timer]: Timing Context Manager yielding a Timer
+            for phase attribution.
+        """
+        if not self.__instrumentation:
+            return nullcontext(self.__disabled_timer)
+
+        return self.__timed(
+            database,
+            dataset,
+            action,
+            self.__database_type if database_type is None else database_type
+        )
+
+    @contextmanager
+    def __operation(
+        self,
+        dataset: str,
+        action: str,
+        database_type: str
+    ) -> Iterator[None]:
+        start_time = time.perf_counter_ns()
+
+        yield
+
+        self.__statistics.add_latency(
+            database_type=database_type,
+            dataset=dataset,
+            action=action,
+            latency=(time.perf_counter_ns() - start_time) / 1e9
+        )
+
+    def _operation(
+        self,
+        dataset: str,
+        action: str,
+        database_type: Optional[str] = None
+    ) -> ContextManager[None]:
+        """Records latency of single operation (round trip) in Statistics.
+
+        Args:
+            dataset (str): Name of the Dataset/Collection.
+            action (str): Measured action.
+            database_type (Optional[str]): Reported Database type. Defaults
+            to the DAO Database type.
+
+        Returns:
+            ContextManager[None]: Latency recording Context Manager.
+        """
+        if not self.__instrumentation:
+            return nullcontext()
+
+        return self.__operation(
+            dataset,
+            action,
+            self.__database_type if database_type is None else database_type
+        )
+
+    def _add_latency(
+        self,
+        dataset: str,
+        action: str,
+        latency: int,
+        database_type: Optional[str] = None
+    ) -> None:
+        """Records latency measured by the caller, for operations whose
+        action is only known once they are done.
+
+        Args:
+            dataset (str): Name of the Dataset/Collection.
+            action (str): Measured action.
+            latency (int): Latency in nanoseconds.
+            database_type (Optional[str]): Reported Database type. Defaults
+            to the DAO Database type.
+        """
+        if not self.__instrumentation:
+            return
+
+        self.__statistics.add_latency(
+            database_type=(
+                self.__database_type if database_type is None
+                else database_type
+            ),
+            dataset=dataset,
+            action=action,
+            latency=latency / 1e9
+        )
+
+    def _operations(
+        self,
+        iterable: Iterable[T],
+        timer: Timer,
+        dataset: str,
+        action: str,
+        database_type: Optional[str] = None
+    ) -> Iterator[T]:
+        """Records every fetch from the iterable as single operation.
+
+        Fetches are attributed to the 'network' phase.
+
+        Args:
+            iterable (Iterable[T]): Result iterable, e.g. a cursor.
+            timer (Timer): Timer of the surrounding CRUD call.
+            dataset (str): Name of the Dataset/Collection.
+            action (str): Measured action.
+            database_type (Optional[str]): Reported Database type. Defaults
+            to the DAO Database type.
+
+        Yields:
+            T: Fetched items.
+        """
+        iterator = iter(iterable)
+        database_type = (
+            self.__database_type if database_type is None else database_type
+        )
+
+        while True:
+            start_time = time.perf_counter_ns()
+
+            try:
+                item = next(iterator)
+
+            except StopIteration:
+                timer.add('network', time.perf_counter_ns() - start_time)
+                return
+
+            duration = time.perf_counter_ns() - start_time
+            timer.add('network', duration)
+
+            if self.__instrumentation:
+                self.__statistics.add_latency(
+                    database_type=database_type,
+                    dataset=dataset,
+                    action=action,
+                    latency=duration / 1e9
+                )
+
+            yield item
+
+    def _consume(
+        self,
+        documents: Iterable[T],
+        timer: Timer,
+        sink: Optional[Union[str, Callable[[T], None]]] = 'print'
+    ) -> int:
+        """Consumes read Documents into a sink and counts them as records.
+
+        Args:
+            documents (Iterable[T]): Read Documents.
+            timer (Timer): Timer of the surrounding read call.
+            sink (Optional[Union[str, Callable[[T], None]]]): 'print' writes
+            every Document to stdout, 'null' discards them and 'checksum'
+            folds them into a CRC32 checksum. A callable receives every
+            Document, e.g. list.append to collect them. Defaults to 'print'.
+
+        Raises:
+            ValueError: Sink is unknown.
+
+        Returns:
+            int: Checksum of the Documents, 0 unless the sink is 'checksum'.
+        """
+        if not callable(sink) and sink not in READ_SINKS:
+            raise ValueError(f'Unknown read sink: {sink}')
+
+        checksum = 0
+        records = 0
+
+        for document in documents:
+            records += 1
+            checksum = self._sink(document, timer, sink, checksum)
+
+        timer.add_records(records)
+
+        return checksum
+
+    def _sink(
+        self,
+        document: T,
+        timer: Timer,
+        sink: Union[str, Callable[[T], None]],
+        checksum: int
+    ) -> int:
+        """Sends single read Document to a sink, see _consume.
+
+        Args:
+            document (T): Read Document.
+            timer (Timer): Timer of the surrounding read call.
+            sink (Union[str, Callable[[T], None]]): 'print', 'null',
+            'checksum' or a callable.
+            checksum (int): Checksum of the previous Documents.
+
+        Returns:
+            int: Checksum including the Document.
+        """
+        if callable(sink):
+            sink(document)
+
+        elif sink == 'print':
+            with timer.phase('materialization'):
+                print(document)
+
+        elif sink == 'checksum':
+            with timer.phase('materialization'):
+                checksum = zlib.crc32(repr(document).encode(), checksum)
+
+        return checksum
+
+    def _report_pool_waits(self, recorder: PoolWaitRecorder) -> None:
+        """Reports connection pool wait times recorded since the last report
+        to Statistics (dataset 'Pool', action 'pool_wait').
+
+        Args:
+            recorder (PoolWaitRecorder): Wait recorder of the shared pool.
+        """
+        histogram = recorder.drain()
+
+        if self.__statistics is None or histogram.count == 0:
+            return
+
+        self.__statistics.add_latency_histograms(
+            {(self.__database_type, 'Pool', 'pool_wait'): histogram}
+        )
+
     @abstractmethod
     def create_connection(self, **kwargs) -> None:
         pass
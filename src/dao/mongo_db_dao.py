@@ -1,36 +1,219 @@
-import json
 import os
+import random
+import threading
 import time
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 
-from pymongo import errors, MongoClient
+from pymongo import (
+    ASCENDING,
+    DeleteOne,
+    errors,
+    InsertOne,
+    MongoClient,
+    UpdateOne,
+    WriteConcern
+)
+from pymongo.collection import Collection
+from pymongo.monitoring import ConnectionPoolListener
 
+from dao.connection_pool import (
+    acquire_pool,
+    get_pool_config,
+    pool_key,
+    PoolWaitRecorder,
+    release_pool
+)
 from dao.dao import DAO
 from stats.statistics import Statistics
+from utils.data_loader import iter_json_chunks
+
+
+class _PoolWaitListener(ConnectionPoolListener):
+
+    """Represents pool listener which records connection check-out waits."""
+
+    def __init__(self, recorder: PoolWaitRecorder) -> None:
+        """Initializes the _PoolWaitListener Class.
+
+        Args:
+            recorder (PoolWaitRecorder): Wait time recorder.
+        """
+        self.__recorder: PoolWaitRecorder = recorder
+        self.__local: threading.local = threading.local()
+
+    def connection_check_out_started(self, event) -> None:
+        self.__local.start_time = time.perf_counter_ns()
+
+    def connection_checked_out(self, event) -> None:
+        self.__recorder.record_ns(
+            time.perf_counter_ns() - self.__local.start_time
+        )
+
+    def connection_check_out_failed(self, event) -> None:
+        self.connection_checked_out(event)
+
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        pass
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        pass
+
+    def connection_checked_in(self, event) -> None:
+        pass
 
 
 class MongoDbDAO(DAO):
 
-    """Represents MongoDB Data Access Object."""
+    """Represents MongoDB Data Access Object.
 
-    def __init__(self, statistics: Statistics) -> None:
+    Writes can run with a custom write concern and as unordered batches, the
+    variant is reported as Database type, e.g. 'MongoDB (w=majority, j,
+    Unordered)', so durability and throughput can be compared.
+    """
+
+    # Secondary indexes of every dataset in data/json_data, each index is a
+    # list of fields.
+    INDEXES = {
+        'books': [['isbn'], ['pageCount']],
+        'countries-small': [['name']],
+        'covers': [['title']],
+        'data': [['name']],
+        'grades': [['student_id', 'class_id']],
+        'products': [['name'], ['price']],
+        'profiles': [['name']],
+        'restaurant': [['restaurant_id'], ['borough', 'cuisine']],
+        'students': [['name']]
+    }
+
+    # Selective query workloads, either point lookups of a sampled value or 
+    # range queries between neighbouring sampled values of the field.
+    QUERY_WORKLOADS = {
+        'Books by ISBN': {'collection': 'books', 'point': 'isbn'},
+        'Books by Page Count': {'collection': 'books', 'range': 'pageCount'},
+        'Countries by Name': {
+            'collection': 'countries-small', 'point': 'name'
+        },
+        'Covers by Title': {'collection': 'covers', 'point': 'title'},
+        'Grades by Student': {'collection': 'grades', 'point': 'student_id'},
+        'Products by Name': {'collection': 'products', 'point': 'name'},
+        'Products by Price': {'collection': 'products', 'range': 'price'},
+        'Restaurants by ID': {
+            'collection': 'restaurant', 'point': 'restaurant_id'
+        },
+        'Restaurants by Borough': {
+            'collection': 'restaurant', 'point': 'borough'
+        },
+        'Students by Name': {'collection': 'students', 'point': 'name'},
+        'Data by Name': {'collection': 'data', 'point': 'name'}
+    }
+
+    def __init__(
+        self,
+        statistics: Statistics,
+        chunk_size: Optional[int] = 10000,
+        instrumentation: Optional[bool] = True,
+        write_concern: Optional[Dict[str, Any]] = None,
+        ordered: Optional[bool] = True
+    ) -> None:
         """Initializes the MongoDbDAO Class.
 
         Args:
             statistics (Statistics): Database Testing Statistics Object.
+            chunk_size (Optional[int]): Number of Documents read from a JSON
+            File and sent with one insert_many call while populating the
+            Database (and the batch size of insert_data). Defaults to 10000.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
+            write_concern (Optional[Dict[str, Any]]): Write concern options,
+            'w' (0, 1 or 'majority') and 'j' (journaling). Uses the server
+            default if not set. Defaults to None.
+            ordered (Optional[bool]): Send batch writes ordered (stop at the
+            first error) or unordered (the server may apply them in
+            parallel). Defaults to True.
         """
-        super().__init__()
+        super().__init__(
+            database_type=self.__variant(write_concern, ordered, True),
+            statistics=statistics,
+            instrumentation=instrumentation
+        )
 
-        self.__database_type: str = 'MongoDB'
+        self.__write_concern_options: Optional[Dict[str, Any]] = (
+            write_concern
+        )
+        self.__indexed: bool = False
+
+        self.__chunk_size: int = chunk_size
+        self.__write_concern: Optional[WriteConcern] = (
+            None if write_concern is None else WriteConcern(**write_concern)
+        )
+        self.__ordered: bool = ordered
         self.__port: int = 27017
         self.__connection: MongoClient = self.create_connection(
             username=os.getenv('ASOS_USERNAME'),
             password=os.getenv('PASSWORD')
         )
-        self.__statistics: Statistics = statistics
+
+    @staticmethod
+    def __variant(
+        write_concern: Optional[Dict[str, Any]],
+        ordered: bool,
+        indexed: bool
+    ) -> str:
+        # Database type label, e.g. 'MongoDB (w=1, j, Unordered)'.
+        options = []
+
+        if write_concern is not None:
+            if 'w' in write_concern:
+                options.append(f"w={write_concern['w']}")
+
+            if write_concern.get('j'):
+                options.append('j')
+
+        if not ordered:
+            options.append('Unordered')
+
+        if not indexed:
+            options.append('No Index')
+
+        return f"MongoDB ({', '.join(options)})" if options else 'MongoDB'
+
+    @property
+    def database_type(self) -> str:
+        """Returns reported Database type, marked with 'No Index' while the 
+        secondary indexes are dropped.
+
+        Returns:
+            str: Reported Database type.
+        """
+        return self.__variant(
+            self.__write_concern_options, self.__ordered, self.__indexed
+        )
+
+    def __collection(self, database: str, collection: str) -> Collection:
+        # Collection with the configured write concern.
+        return self.__connection[database].get_collection(
+            collection, write_concern=self.__write_concern
+        )
 
     def create_connection(self, **kwargs: str) -> MongoClient:
-        """Creates new MongoDB Connection.
+        """Creates new MongoDB Connection, or reuses the shared client with
+        the same pool configuration (see get_pool_config, prefix
+        'MONGODB').
 
         Args:
             **kwargs (str): Keyword Arguments ('username' and 'password' 
@@ -39,9 +222,31 @@ class MongoDbDAO(DAO):
         Returns:
             MongoClient: New MongoDB Connection.
         """
+        config = get_pool_config('MONGODB', self.__port)
+        self.__pool_key = pool_key('MONGODB', config)
+
+        options = {
+            'maxPoolSize': config['pool_size'],
+            'connectTimeoutMS': config['connect_timeout'],
+            'socketTimeoutMS': config['socket_timeout'],
+            'waitQueueTimeoutMS': config['pool_timeout']
+        }
+
         try:
-            connection = MongoClient(
-                host=f"mongodb://localhost:{self.__port}/",
+            connection, self.__pool_waits = acquire_pool(
+                self.__pool_key,
+                lambda recorder: MongoClient(
+                    host=f"mongodb://{config['host']}:{config['port']}/",
+                    event_listeners=[_PoolWaitListener(recorder)],
+                    **{
+                        option: (
+                            value if option == 'maxPoolSize' 
+                            else value * 1000
+                        )
+                        for option, value in options.items()
+                        if value is not None
+                    }
+                )
             )
 
         except errors.ServerSelectionTimeoutError as err:
@@ -51,78 +256,189 @@ class MongoDbDAO(DAO):
 
         return connection
 
-    def read_data(self, **kwargs: str) -> None:
-        """Reads every entry in Collection.
+    def read_data(self, **kwargs: Any) -> Optional[int]:
+        """Reads every entry in Collection, or runs a selective query 
+        workload, one query per sampled value.
 
         Args:
-            **kwargs (str): Keyword Arguments ('database' and 'collection' 
-            expected).
+            **kwargs (Any): Keyword Arguments ('database' and 'collection' 
+            expected, or 'database' and 'workload', key of QUERY_WORKLOADS; 
+            'samples' and 'values' optional). Full reads also take 'fields' 
+            (projected fields), 'batch_size' (Documents per cursor batch) 
+            and 'sink' (see DAO._consume).
+
+        Returns:
+            Optional[int]: Checksum of a full read.
         """
+        if 'workload' in kwargs:
+            self.__read_workload(**kwargs)
+            return None
+
         collection = self.__connection[kwargs['database']
                                        ][kwargs['collection']]
-        
-        start_time = time.time()
-
-        for entry in collection.find():
-            print(entry)
-
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='read',
-            time=time.time() - start_time
+        cursor = collection.find(
+            {},
+            None if kwargs.get('fields') is None
+            else {field: 1 for field in kwargs['fields']}
         )
 
+        if kwargs.get('batch_size') is not None:
+            cursor = cursor.batch_size(kwargs['batch_size'])
+        
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'read'
+        ) as timer:
+            return self._consume(
+                self._operations(
+                    cursor, timer, kwargs['collection'], 'read'
+                ),
+                timer,
+                kwargs.get('sink', 'print')
+            )
 
     def insert_data(self, **kwargs: Union[str, List[dict]]) -> None:
         """Inserts entries to Collection.
 
+        Documents are sent in batches of chunk size, one insert_many call
+        each.
+
         Args:
             **kwargs (Union[str, List[dict]]): Keyword Arguments ('database',
             'collection' and 'data' expected).
         """
+        data = kwargs['data']
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'insert'
+        ) as timer:
+            for start in range(0, len(data), self.__chunk_size):
+                with self._operation(kwargs['collection'], 'insert'):
+                    self.__insert_many(
+                        kwargs['database'],
+                        kwargs['collection'],
+                        data[start:start + self.__chunk_size]
+                    )
+
+            timer.add_records(len(data))
+
+    def __insert_many(
+        self,
+        database: str,
+        collection: str,
+        data: List[dict]
+    ) -> None:
+        # Inserts Documents with one insert_many call.
         try:
-            start_time = time.time()
-            (
-                self.__connection[kwargs['database']][kwargs['collection']]
-                .insert_many(kwargs['data'])
-            )
-            self.__statistics.add_execution_time(
-                database_type=self.__database_type,
-                database=kwargs['database'],
-                dataset=kwargs['collection'],
-                action='insert',
-                time=time.time() - start_time
+            self.__collection(database, collection).insert_many(
+                data, ordered=self.__ordered
             )
 
         except errors.BulkWriteError as bwe:
             print(bwe.details)
             raise
 
-    def update_data(self, **kwargs: Union[str, List[dict]]) -> None:
-        """Updates entries in Collection.
+    def sample_operations(
+        self,
+        database: str,
+        collection: str,
+        samples: int,
+        key: str,
+        new_value: Any
+    ) -> List[Union[InsertOne, UpdateOne, DeleteOne]]:
+        """Samples mixed write operations for bulk_write_data.
+
+        Half of the sampled Documents are updated, a quarter is deleted and
+        as many new Documents are inserted.
 
         Args:
-            **kwargs (Union[str, List[dict]]): Keyword Arguments ('database',
-            'collection', 'old_values' and 'new_values' expected).
+            database (str): Name of the Database.
+            collection (str): Name of the Collection.
+            samples (int): Number of sampled Documents.
+            key (str): Updated key.
+            new_value (Any): New value.
+
+        Returns:
+            List[Union[InsertOne, UpdateOne, DeleteOne]]: Shuffled write 
+            operations.
         """
-        start_time = time.time()
-        (
-            self.__connection[kwargs['database']][kwargs['collection']]
-            .update_many(
-                kwargs['old_values'],
-                kwargs['new_values']
+        doc_ids = [
+            document['_id'] for document in
+            self.__connection[database][collection].aggregate(
+                [{'$sample': {'size': samples}}, {'$project': {'_id': 1}}]
             )
+        ]
+        updates = len(doc_ids) // 2
+        deletes = len(doc_ids) // 4
+
+        operations = (
+            [
+                UpdateOne({'_id': doc_id}, {'$set': {key: new_value}})
+                for doc_id in doc_ids[:updates]
+            ] +
+            [
+                DeleteOne({'_id': doc_id})
+                for doc_id in doc_ids[updates:updates + deletes]
+            ] +
+            [InsertOne({key: new_value}) for _ in range(deletes)]
         )
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='update',
-            time=time.time() - start_time
+        random.shuffle(operations)
+
+        return operations
+
+    def bulk_write_data(self, **kwargs: Union[str, list]) -> None:
+        """Sends mixed write operations with bulk_write calls.
+
+        Args:
+            **kwargs (Union[str, list]): Keyword Arguments ('database',
+            'collection' and 'operations' expected).
+        """
+        operations = kwargs['operations']
+        collection = self.__collection(
+            kwargs['database'], kwargs['collection']
         )
 
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'bulk_write'
+        ) as timer:
+            for start in range(0, len(operations), self.__chunk_size):
+                with self._operation(kwargs['collection'], 'bulk_write'):
+                    try:
+                        collection.bulk_write(
+                            operations[start:start + self.__chunk_size],
+                            ordered=self.__ordered
+                        )
+
+                    except errors.BulkWriteError as bwe:
+                        print(bwe.details)
+                        raise
+
+            timer.add_records(len(operations))
+
+    def update_data(self, **kwargs: Union[str, List[dict]]) -> None:
+        """Updates entries in Collection, or runs a selective update 
+        workload, one update_many call per sampled value.
+
+        Args:
+            **kwargs (Union[str, List[dict]]): Keyword Arguments ('database',
+            'collection', 'old_values' and 'new_values' expected, or 
+            'database', 'workload', 'key' and 'new_value'; 'samples' and 
+            'values' optional).
+        """
+        if 'workload' in kwargs:
+            self.__update_workload(**kwargs)
+            return
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'update'
+        ), self._operation(kwargs['collection'], 'update'):
+            (
+                self.__collection(kwargs['database'], kwargs['collection'])
+                .update_many(
+                    kwargs['old_values'],
+                    kwargs['new_values']
+                )
+            )
+
     def delete_data(self, **kwargs: str) -> None:
         """Removes every entry from Collection.
 
@@ -130,22 +446,164 @@ class MongoDbDAO(DAO):
             **kwargs (str): Keyword Arguments ('database' and 'collection' 
             expected).
         """
-        start_time = time.time()
-        (
-            self.__connection[kwargs['database']][kwargs['collection']]
-            .delete_many({})
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'delete'
+        ), self._operation(kwargs['collection'], 'delete'):
+            (
+                self.__collection(kwargs['database'], kwargs['collection'])
+                .delete_many({})
+            )
+
+    def sample_values(
+        self,
+        database: str,
+        workload: str,
+        samples: int
+    ) -> List[Any]:
+        """Samples field values of a query workload from the Collection.
+
+        Args:
+            database (str): Name of the Database.
+            workload (str): Key of QUERY_WORKLOADS.
+            samples (int): Maximum number of sampled values.
+
+        Returns:
+            List[Any]: Sampled values.
+        """
+        workload = self.QUERY_WORKLOADS[workload]
+        field = workload.get('point') or workload['range']
+
+        return [
+            document[field] for document in
+            self.__connection[database][workload['collection']].aggregate(
+                [
+                    {'$match': {field: {'$exists': True}}},
+                    {'$sample': {'size': samples}},
+                    {'$project': {'_id': 0, field: 1}}
+                ]
+            )
+        ]
+
+    def __filters(self, **kwargs: Any) -> List[dict]:
+        # Query filters of a workload, point filters or ranges between 
+        # neighbouring sampled values.
+        workload = self.QUERY_WORKLOADS[kwargs['workload']]
+        values = kwargs.get('values')
+
+        if values is None:
+            values = self.sample_values(
+                kwargs['database'],
+                kwargs['workload'],
+                kwargs.get('samples', 100)
+            )
+
+        if 'point' in workload:
+            return [{workload['point']: value} for value in values]
+
+        values = sorted(
+            value for value in values if isinstance(value, (int, float))
         )
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='delete',
-            time=time.time() - start_time
+
+        return [
+            {workload['range']: {'$gte': low, '$lte': high}}
+            for low, high in zip(values, values[1:])
+        ]
+
+    def __read_workload(self, **kwargs: Any) -> None:
+        # Runs selective queries, results are drained without printing.
+        collection = self.__connection[kwargs['database']][
+            self.QUERY_WORKLOADS[kwargs['workload']]['collection']
+        ]
+        filters = self.__filters(**kwargs)
+
+        # Nothing was sampled, the field is missing from the Collection.
+        if not filters:
+            return
+
+        with self._timed(
+            kwargs['database'], kwargs['workload'], 'read',
+            self.database_type
+        ) as timer:
+            for query_filter in filters:
+                with timer.phase('network'), self._operation(
+                    kwargs['workload'], 'read', self.database_type
+                ):
+                    for _ in collection.find(query_filter):
+                        pass
+
+    def __update_workload(self, **kwargs: Any) -> None:
+        # Runs selective updates, one update_many call per filter.
+        collection = self.__collection(
+            kwargs['database'],
+            self.QUERY_WORKLOADS[kwargs['workload']]['collection']
         )
+        filters = self.__filters(**kwargs)
+
+        # Nothing was sampled, the field is missing from the Collection.
+        if not filters:
+            return
+
+        with self._timed(
+            kwargs['database'], kwargs['workload'], 'update',
+            self.database_type
+        ) as timer:
+            for query_filter in filters:
+                with timer.phase('network'), self._operation(
+                    kwargs['workload'], 'update', self.database_type
+                ):
+                    collection.update_many(
+                        query_filter,
+                        {'$set': {kwargs['key']: kwargs['new_value']}}
+                    )
+
+    def create_indexes(self, database: str) -> None:
+        """Creates secondary indexes of every populated dataset and records 
+        the build time of each Collection as 'index' action. Indexes whose 
+        leading field no Document has are skipped.
+
+        Args:
+            database (str): Name of the Database.
+        """
+        collections = self.__connection[database].list_collection_names()
+
+        for collection, indexes in self.INDEXES.items():
+            if collection not in collections:
+                continue
+
+            indexes = [
+                index for index in indexes
+                if self.__connection[database][collection].find_one(
+                    {index[0]: {'$exists': True}}, {'_id': 1}
+                ) is not None
+            ]
+
+            if not indexes:
+                continue
+
+            with self._timed(database, collection, 'index'):
+                for index in indexes:
+                    self.__connection[database][collection].create_index(
+                        [(field, ASCENDING) for field in index]
+                    )
+
+        self.__indexed = True
+
+    def drop_indexes(self, database: str) -> None:
+        """Drops secondary indexes, so workloads run without indexes.
+
+        Args:
+            database (str): Name of the Database.
+        """
+        for collection in self.__connection[database].list_collection_names():
+            self.__connection[database][collection].drop_indexes()
+
+        self.__indexed = False
 
     def close_connection(self):
-        """Closes MongoDB Connection."""
-        self.__connection.close()
+        """Reports pool wait times and releases the MongoDB Connection, the
+        shared client is closed by its last user."""
+        self._report_pool_waits(self.__pool_waits)
+        release_pool(self.__pool_key, lambda client: client.close())
 
     def populate_database(self, data_folder: str) -> None:
         """Populates MongoDB Database from JSON Files in Data Folder.
@@ -154,13 +612,21 @@ class MongoDbDAO(DAO):
             data_folder (str): Data Folder Path.
         """
         for file in os.listdir(data_folder):
-            data = []
-            with open(os.path.join(data_folder, file)) as json_file:
-                for line in json_file:
-                    data.append(json.loads(line))
-
-            self.insert_data(
-                database=os.getenv('DB_NAME'),
-                collection=file.split('.')[0],
-                data=data
-            )
+            with self._timed(
+                os.getenv('DB_NAME'), file.split('.')[0], 'insert'
+            ) as timer:
+                for data in timer.iterate(
+                    iter_json_chunks(
+                        os.path.join(data_folder, file),
+                        chunk_size=self.__chunk_size
+                    ),
+                    'serialization'
+                ):
+                    with timer.phase('network'), self._operation(
+                        file.split('.')[0], 'insert'
+                    ):
+                        self.__insert_many(
+                            os.getenv('DB_NAME'), file.split('.')[0], data
+                        )
+
+                    timer.add_records(len(data))
@@ -1,31 +1,134 @@
 # SOURCE: https://towardsdatascience.com/create-a-graph-database-in-neo4j-using-python-4172d40f89c4
 
-from neo4j import GraphDatabase
+import threading
+from typing import Iterator, List, Optional
+
+from neo4j import GraphDatabase, Record, Session
 
 class Neo4jConnection:
-    
-    def __init__(self, uri):
+
+    """Represents Neo4j Connection with long-lived Sessions.
+
+    Every thread reuses its own Session (Sessions are not thread safe),
+    writes run in managed transactions which the driver retries on
+    transient errors.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        database: Optional[str] = None,
+        max_transaction_retry_time: Optional[float] = 30.0,
+        **driver_config
+    ) -> None:
+        """Initializes the Neo4jConnection Class.
+
+        Args:
+            uri (str): Neo4j URI.
+            database (Optional[str]): Database name. Uses the default
+            Database if not set. Defaults to None.
+            max_transaction_retry_time (Optional[float]): Maximum time (sec)
+            a managed transaction is retried on transient errors. Defaults
+            to 30.0.
+            **driver_config: Driver pool options, e.g.
+            'max_connection_pool_size', 'connection_acquisition_timeout',
+            'connection_timeout' and 'keep_alive'.
+        """
         self.__uri = uri
-        self.__driver = None
-        try:
-            self.__driver = GraphDatabase.driver(self.__uri)
-        except Exception as e:
-            print("Failed to create the driver:", e)
-        
-    def close(self):
+        self.__database = database
+        self.__driver = GraphDatabase.driver(
+            self.__uri,
+            max_transaction_retry_time=max_transaction_retry_time,
+            **driver_config
+        )
+        self.__local = threading.local()
+        self.__sessions: List[Session] = []
+        self.__sessions_lock = threading.Lock()
+
+    def __session(self) -> Session:
+        # Returns long-lived Session of the current thread.
+        session = getattr(self.__local, 'session', None)
+
+        if session is None:
+            assert self.__driver is not None, "Driver not initialized!"
+
+            session = self.__driver.session(database=self.__database)
+            self.__local.session = session
+
+            with self.__sessions_lock:
+                self.__sessions.append(session)
+
+        return session
+
+    def close(self) -> None:
+        """Closes every Session and the Driver."""
+        with self.__sessions_lock:
+            for session in self.__sessions:
+                session.close()
+
+            self.__sessions = []
+
+        self.__local = threading.local()
+
         if self.__driver is not None:
             self.__driver.close()
-        
-    def query(self, query, parameters=None, db=None):
-        assert self.__driver is not None, "Driver not initialized!"
-        session = None
-        response = None
-        try: 
-            session = self.__driver.session(database=db) if db is not None else self.__driver.session() 
-            response = list(session.run(query, parameters))
-        except Exception as e:
-            print("Query failed:", e)
-        finally: 
-            if session is not None:
-                session.close()
-        return response
\ No newline at end of file
+            self.__driver = None
+
+    def query(self, query, parameters=None, db=None) -> List[Record]:
+        """Runs query in an auto-commit transaction (e.g. schema changes).
+
+        Args:
+            query (str): Cypher query.
+            parameters (Optional[dict]): Query parameters. Defaults to None.
+            db (Optional[str]): Database name, runs in a short-lived Session
+            if set. Defaults to None.
+
+        Returns:
+            List[Record]: Query result.
+        """
+        if db is not None:
+            with self.__driver.session(database=db) as session:
+                return list(session.run(query, parameters))
+
+        return list(self.__session().run(query, parameters))
+
+    def write(self, query, parameters=None) -> List[Record]:
+        """Runs query in a managed write transaction with retries.
+
+        Args:
+            query (str): Cypher query.
+            parameters (Optional[dict]): Query parameters. Defaults to None.
+
+        Returns:
+            List[Record]: Query result.
+        """
+        return self.__session().execute_write(
+            lambda tx: list(tx.run(query, parameters))
+        )
+
+    def read(self, query, parameters=None) -> List[Record]:
+        """Runs query in a managed read transaction with retries.
+
+        Args:
+            query (str): Cypher query.
+            parameters (Optional[dict]): Query parameters. Defaults to None.
+
+        Returns:
+            List[Record]: Query result.
+        """
+        return self.__session().execute_read(
+            lambda tx: list(tx.run(query, parameters))
+        )
+
+    def stream(self, query, parameters=None) -> Iterator[Record]:
+        """Streams query result record by record instead of materializing
+        it, so large reads are consumed with bounded memory.
+
+        Args:
+            query (str): Cypher query.
+            parameters (Optional[dict]): Query parameters. Defaults to None.
+
+        Yields:
+            Record: Result record.
+        """
+        yield from self.__session().run(query, parameters)
@@ -1,25 +1,208 @@
 # SOURCE: https://towardsdatascience.com/create-a-graph-database-in-neo4j-using-python-4172d40f89c4
 
 import os
+import posixpath
+import shlex
+import subprocess
 import time
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 import pandas as pd
 
+from dao.batch_size_tuner import BatchSizeTuner
+from dao.connection_pool import (
+	acquire_pool,
+	get_pool_config,
+	pool_key,
+	release_pool
+)
 from dao.dao import DAO
 from dao.neo4j_connection import Neo4jConnection
 from stats.statistics import Statistics
-from utils.archive_utils import load_and_clean_archive_data
+from utils.archive_utils import load_archive_tables
 
 
 class Neo4jDAO(DAO):
 
 	"""Represents Neo4j Data Access Object."""
 
-	def __init__(self) -> None:
-		"""Initializes the Neo4jDAO Class."""
-		super().__init__()
+	# Read workloads, every sampled key is looked up through the uniqueness 
+	# constraint (index) of its label.
+	READ_WORKLOADS = {
+		'Co-Authors': {
+			'sample': 'MATCH (a:Author) RETURN a.name AS key LIMIT $samples',
+			'query': '''
+				MATCH (:Author {name: $key})-[:AUTHORED]->(:Paper)
+					<-[:AUTHORED]-(co:Author)
+				RETURN DISTINCT co.name AS name
+				'''
+		},
+		'Papers by Category': {
+			'sample': '''
+				MATCH (c:Category) RETURN c.category AS key LIMIT $samples
+				''',
+			'query': '''
+				MATCH (:Category {category: $key})<-[:IN_CATEGORY]-(p:Paper)
+				RETURN p.id AS id, p.title AS title
+				'''
+		},
+		'Author Degree': {
+			'sample': 'MATCH (a:Author) RETURN a.name AS key LIMIT $samples',
+			'query': '''
+				MATCH (a:Author {name: $key})
+				RETURN a.name AS name, 
+					COUNT { (a)-[:AUTHORED]->(:Paper) } AS degree
+				'''
+		}
+	}
+
+	# Property update workloads, sampled keys are updated in one batch.
+	UPDATE_WORKLOADS = {
+		'Papers': {
+			'sample': 'MATCH (p:Paper) RETURN p.id AS key LIMIT $samples',
+			'query': '''
+				UNWIND $rows AS row
+				MATCH (p:Paper {id: row.key})
+				SET p += row.properties
+				'''
+		},
+		'Authors': {
+			'sample': 'MATCH (a:Author) RETURN a.name AS key LIMIT $samples',
+			'query': '''
+				UNWIND $rows AS row
+				MATCH (a:Author {name: row.key})
+				SET a += row.properties
+				'''
+		}
+	}
+
+	# Queries of the parallel ingestion, nodes and relationships are created 
+	# in separate phases.
+	AUTHOR_NODES_QUERY = '''
+		UNWIND $rows AS row
+		MERGE (:Author {name: row.author})
+		RETURN count(*) AS total
+		'''
 
+	PAPER_NODES_QUERY = '''
+		UNWIND $rows AS row
+		MERGE (p:Paper {id: row.id}) ON CREATE SET p.title = row.title
+		RETURN count(*) AS total
+		'''
+
+	IN_CATEGORY_QUERY = '''
+		UNWIND $rows AS row
+		MATCH (p:Paper {id: row.id})
+		MATCH (c:Category {category: row.category})
+		MERGE (p)-[:IN_CATEGORY]->(c)
+		RETURN count(*) AS total
+		'''
+
+	AUTHORED_QUERY = '''
+		UNWIND $rows AS row
+		MATCH (p:Paper {id: row.id})
+		MATCH (a:Author {name: row.author})
+		MERGE (a)-[:AUTHORED]->(p)
+		RETURN count(*) AS total
+		'''
+
+	# Offline bulk import files, LOAD CSV headers and neo4j-admin headers.
+	IMPORT_FILES = {
+		'categories.csv': (['category'], ['category:ID(Category)']),
+		'authors.csv': (['name'], ['name:ID(Author)']),
+		'papers.csv': (['id', 'title'], ['id:ID(Paper)', 'title']),
+		'in_category.csv': (
+			['id', 'category'], [':START_ID(Paper)', ':END_ID(Category)']
+		),
+		'authored.csv': (
+			['name', 'id'], [':START_ID(Author)', ':END_ID(Paper)']
+		)
+	}
+
+	# LOAD CSV queries of the bulk import, rows are committed in periodic 
+	# transactions. Nodes are created (not merged), the Graph is expected to 
+	# be empty.
+	LOAD_CSV_QUERIES = {
+		'Categories': [
+			'''
+			LOAD CSV WITH HEADERS FROM 'file:///categories.csv' AS row
+			CALL {
+				WITH row
+				CREATE (:Category {category: row.category})
+			} IN TRANSACTIONS OF $rows ROWS
+			'''
+		],
+		'Authors': [
+			'''
+			LOAD CSV WITH HEADERS FROM 'file:///authors.csv' AS row
+			CALL {
+				WITH row
+				CREATE (:Author {name: row.name})
+			} IN TRANSACTIONS OF $rows ROWS
+			'''
+		],
+		'Papers': [
+			'''
+			LOAD CSV WITH HEADERS FROM 'file:///papers.csv' AS row
+			CALL {
+				WITH row
+				CREATE (:Paper {id: row.id, title: row.title})
+			} IN TRANSACTIONS OF $rows ROWS
+			''',
+			'''
+			LOAD CSV WITH HEADERS FROM 'file:///in_category.csv' AS row
+			CALL {
+				WITH row
+				MATCH (p:Paper {id: row.id})
+				MATCH (c:Category {category: row.category})
+				CREATE (p)-[:IN_CATEGORY]->(c)
+			} IN TRANSACTIONS OF $rows ROWS
+			''',
+			'''
+			LOAD CSV WITH HEADERS FROM 'file:///authored.csv' AS row
+			CALL {
+				WITH row
+				MATCH (a:Author {name: row.name})
+				MATCH (p:Paper {id: row.id})
+				CREATE (a)-[:AUTHORED]->(p)
+			} IN TRANSACTIONS OF $rows ROWS
+			'''
+		]
+	}
+
+	def __init__(
+		self,
+		statistics: Optional[Statistics] = None,
+		batch_size: Optional[int] = 5000,
+		instrumentation: Optional[bool] = True
+	) -> None:
+		"""Initializes the Neo4jDAO Class.
+
+		Args:
+			statistics (Optional[Statistics]): Database Testing Statistics 
+			Object. A single-iteration Statistics Object is created, displayed 
+			and exported after every insert if not set. Defaults to None.
+			batch_size (Optional[int]): Initial batch size of the parallel 
+			ingestion, it is tuned from observed batch latencies. Defaults to 
+			5000.
+			instrumentation (Optional[bool]): Time CRUD calls. Defaults to 
+			True.
+		"""
+		self.__statistics: Statistics = (
+			Statistics(iterations=1) if statistics is None else statistics
+		)
+		self.__export_statistics: bool = statistics is None
+
+		super().__init__(
+			database_type='Neo4j',
+			statistics=self.__statistics,
+			instrumentation=instrumentation
+		)
+
+		self.__batch_size: int = batch_size
+		self.__indexed: bool = True
+		self.__tables: Dict[str, pd.DataFrame] = {}
 		self.__port: int = 7687
 		self.__connection = self.create_connection(
 			username=os.getenv('ASOS_USERNAME'),
@@ -27,59 +210,176 @@ class Neo4jDAO(DAO):
 		)
 
 	def create_connection(self, **kwargs):
-		"""Creates new Neo4j Connection.
+		"""Creates new Neo4j Connection, or reuses the shared Connection with 
+		the same pool configuration (see get_pool_config, prefix 'NEO4J'). 
+		The driver does not expose pool wait times, so none are reported.
 
         Returns:
             Neo4jConnection: New Neo4j Connection.
         """
-		return Neo4jConnection(
-			uri=f'neo4j://localhost:{self.__port}/',
+		config = get_pool_config('NEO4J', self.__port)
+		self.__pool_key = pool_key('NEO4J', config)
+
+		options = {
+			'max_connection_pool_size': config['pool_size'],
+			'connection_acquisition_timeout': config['pool_timeout'],
+			'connection_timeout': config['connect_timeout'],
+			'keep_alive': config['keepalive']
+		}
+
+		connection, _ = acquire_pool(
+			self.__pool_key,
+			lambda recorder: Neo4jConnection(
+				uri=f"neo4j://{config['host']}:{config['port']}/",
+				**{
+					option: value for option, value in options.items()
+					if value is not None
+				}
+			)
 		)
 
-	def read_data(self, **kwargs):
-		"""Reads every entry in Graph."""
-		pass
+		return connection
 
-	def insert_data(self, **kwargs):
-		"""Inserts data to Graph."""
-		statistics = Statistics(iterations=1)
+	@property
+	def database_type(self) -> str:
+		"""Returns reported Database type, 'Neo4j (No Index)' while the 
+		uniqueness constraints are dropped.
 
-		start_time = time.time()
-		self.__add_categories(self.__categories)
-		statistics.add_execution_time(
-			database_type='Neo4j',
-			database='Default',
-			dataset='Categories',
-			action='insert',
-			time=time.time() - start_time
+		Returns:
+			str: Reported Database type.
+		"""
+		return 'Neo4j' if self.__indexed else 'Neo4j (No Index)'
+
+	def sample_keys(self, workload: str, samples: int) -> List[str]:
+		"""Samples keys of a read or update workload from the Graph.
+
+		Args:
+			workload (str): Key of READ_WORKLOADS or UPDATE_WORKLOADS.
+			samples (int): Maximum number of sampled keys.
+
+		Returns:
+			List[str]: Sampled keys.
+		"""
+		result = self.__connection.read(
+			(self.READ_WORKLOADS | self.UPDATE_WORKLOADS)[workload]['sample'],
+			parameters={'samples': samples}
 		)
 
-		start_time = time.time()
-		self.__add_authors(self.__authors)
-		statistics.add_execution_time(
-			database_type='Neo4j',
-			database='Default',
-			dataset='Authors',
-			action='insert',
-			time=time.time() - start_time
+		return [record['key'] for record in result]
+
+	def read_data(self, **kwargs):
+		"""Runs read workload over the Graph, one query per sampled key.
+
+		Args:
+			**kwargs (Union[str, int, List[str]]): Keyword Arguments 
+			('workload' expected, key of READ_WORKLOADS; 'samples', 'keys' 
+			and 'sink' optional, sink see DAO._consume, defaults to 'null').
+
+		Returns:
+			int: Checksum of the read records.
+		"""
+		workload = self.READ_WORKLOADS[kwargs['workload']]
+		checksum = 0
+		keys = kwargs.get('keys') or self.sample_keys(
+			kwargs['workload'], kwargs.get('samples', 100)
 		)
 
-		start_time = time.time()
-		self.__add_papers(self.__data)
-		statistics.add_execution_time(
-			database_type='Neo4j',
-			database='Default',
-			dataset='Papers',
-			action='insert',
-			time=time.time() - start_time
-		)			
+		with self._timed(
+			'Default', kwargs['workload'], 'read', self.database_type
+		) as timer:
+			for key in keys:
+				checksum ^= self._consume(
+					self._operations(
+						self.__connection.stream(
+							workload['query'], parameters={'key': key}
+						),
+						timer,
+						kwargs['workload'],
+						'read',
+						self.database_type
+					),
+					timer,
+					kwargs.get('sink', 'null')
+				)
+
+		return checksum
+
+	def insert_data(self, **kwargs):
+		"""Inserts data to Graph.
+
+		Args:
+			**kwargs (int): Keyword Arguments ('workers' optional). With more 
+			than one worker, batches run in parallel on worker Sessions and 
+			the times are recorded as 'Neo4j (Parallel)'.
+		"""
+		workers = kwargs.get('workers') or 1
+		database_type = 'Neo4j (Parallel)' if workers > 1 else 'Neo4j'
+
+		with self._timed('Default', 'Categories', 'insert', database_type):
+			self.__add_categories(self.__categories, database_type)
+
+		with self._timed(
+			'Default', 'Authors', 'insert', database_type
+		) as timer:
+			if workers > 1:
+				with timer.phase('nodes'):
+					self.__run_parallel(
+						self.AUTHOR_NODES_QUERY,
+						self.__authors,
+						workers,
+						'Authors',
+						database_type
+					)
+
+			else:
+				self.__add_authors(self.__authors)
+
+		with self._timed(
+			'Default', 'Papers', 'insert', database_type
+		) as timer:
+			if workers > 1:
+				self.__add_papers_parallel(self.__data, workers, timer)
+
+			else:
+				self.__add_papers(self.__data)
 		
-		statistics.display_statistics()
-		statistics.export_plots()
+		if self.__export_statistics:
+			self.__statistics.display_statistics()
+			self.__statistics.export_plots()
 
 	def update_data(self, **kwargs):
-		"""Updates data in Graph."""
-		pass
+		"""Runs property update workload over the Graph in one batch.
+
+		Args:
+			**kwargs (Union[str, int, List[str]]): Keyword Arguments 
+			('workload' expected, key of UPDATE_WORKLOADS, 'key' and 
+			'new_value' expected; 'samples' and 'keys' optional).
+		"""
+		workload = self.UPDATE_WORKLOADS[kwargs['workload']]
+		keys = kwargs.get('keys') or self.sample_keys(
+			kwargs['workload'], kwargs.get('samples', 100)
+		)
+
+		with self._timed(
+			'Default', kwargs['workload'], 'update', self.database_type
+		) as timer:
+			with timer.phase('network'), self._operation(
+				kwargs['workload'], 'update', self.database_type
+			):
+				self.__connection.write(
+					workload['query'],
+					parameters={
+						'rows': [
+							{
+								'key': key,
+								'properties': {
+									kwargs['key']: kwargs['new_value']
+								}
+							}
+							for key in keys
+						]
+					}
+				)
 
 	def delete_data(self, **kwargs):
 		"""Deletes every data in every Graph."""
@@ -88,26 +388,45 @@ class Neo4jDAO(DAO):
 				DETACH DELETE n
 				'''
 
-		self.__connection.query(query)
+		with self._timed('Default', 'Graph', 'delete', self.database_type):
+			self.__connection.write(query)
+
+	def create_indexes(self) -> None:
+		"""Creates uniqueness constraints (and their backing indexes) and 
+		records the build time as 'index' action."""
+		with self._timed('Default', 'Graph', 'index'):
+			self.__create_tables()
+
+		self.__indexed = True
+
+	def drop_indexes(self) -> None:
+		"""Drops uniqueness constraints, so workloads run without indexes."""
+		self.__connection.query('DROP CONSTRAINT papers IF EXISTS')
+		self.__connection.query('DROP CONSTRAINT authors IF EXISTS')
+		self.__connection.query('DROP CONSTRAINT categories IF EXISTS')
+
+		self.__indexed = False
 
 	def close_connection(self):
-		"""Closes Neo4j Connection."""
-		self.__connection.close()
+		"""Releases Neo4j Connection, the shared Connection is closed by its 
+		last user."""
+		release_pool(self.__pool_key, lambda connection: connection.close())
 		self.__connection = None
 
 	def __create_tables(self) -> None:
-		self.__connection.query('CREATE CONSTRAINT papers IF NOT EXISTS ON (p:Paper) ASSERT p.id IS UNIQUE')
-		self.__connection.query('CREATE CONSTRAINT authors IF NOT EXISTS ON (a:Author) ASSERT a.name IS UNIQUE')
-		self.__connection.query('CREATE CONSTRAINT categories IF NOT EXISTS ON (c:Category) ASSERT c.category IS UNIQUE')
+		self.__connection.query('CREATE CONSTRAINT papers IF NOT EXISTS FOR (p:Paper) REQUIRE p.id IS UNIQUE')
+		self.__connection.query('CREATE CONSTRAINT authors IF NOT EXISTS FOR (a:Author) REQUIRE a.name IS UNIQUE')
+		self.__connection.query('CREATE CONSTRAINT categories IF NOT EXISTS FOR (c:Category) REQUIRE c.category IS UNIQUE')
 
-	def __add_categories(self, categories):
+	def __add_categories(self, categories, database_type = None):
         # Adds category nodes to the Neo4j graph.
 		query = '''
 				UNWIND $rows AS row
 				MERGE (c:Category {category: row.category})
 				RETURN count(*) as total
 				'''
-		return self.__connection.query(query, parameters = {'rows':categories.to_dict('records')})
+		with self._operation('Categories', 'insert', database_type):
+			return self.__connection.write(query, parameters = {'rows':categories.to_dict('records')})
 
 
 	def __add_authors(self, rows, batch_size=10000):
@@ -117,7 +436,7 @@ class Neo4jDAO(DAO):
 				MERGE (:Author {name: row.author})
 				RETURN count(*) as total
 				'''
-		return self.__insert_data(query, rows, batch_size)
+		return self.__insert_data(query, rows, batch_size, 'Authors')
 
 	def __add_papers(self, rows, batch_size=5000):
 		# Adds paper nodes and (:Author)--(:Paper) and 
@@ -142,71 +461,306 @@ class Neo4jDAO(DAO):
 		RETURN count(distinct p) as total
 		'''
 		
-		return self.__insert_data(query, rows, batch_size)
+		return self.__insert_data(query, rows, batch_size, 'Papers')
 
 
-	def __insert_data(self, query, rows, batch_size = 10000):
+	def __insert_data(self, query, rows, batch_size = 10000, dataset = None):
 		# Function to handle the updating the Neo4j database in batch mode.
+		# Every batch is recorded as single insert operation.
 		
 		total = 0
 		batch = 0
-		start = time.time()
+		start = time.perf_counter()
 		result = None
 		
 		while batch * batch_size < len(rows):
 
-			res = self.__connection.query(
-				query, 
-				parameters = {'rows': rows[batch*batch_size:(batch+1)*batch_size].to_dict('records')}
-			)
+			with self._operation(dataset, 'insert'):
+				res = self.__connection.write(
+					query, 
+					parameters = {'rows': rows[batch*batch_size:(batch+1)*batch_size].to_dict('records')}
+				)
 			total += res[0]['total']
 			batch += 1
 			result = {"total":total, 
 					"batches":batch, 
-					"time":time.time()-start}
+					"time":time.perf_counter()-start}
 			print(result)
 
 		return result
 
-	def __process_data(
-		self, 
-		data: pd.DataFrame
-	) -> Tuple[pd.DataFrame, pd.DataFrame]:
-		categories = pd.DataFrame(data[['category_list']])
-		categories.rename(
-			columns={'category_list':'category'},
-			inplace=True
-		)
-		categories = (
-			categories.explode('category').drop_duplicates(subset=['category'])
-		)
+	def __run_partition(
+		self,
+		query: str,
+		rows: pd.DataFrame,
+		tuner: BatchSizeTuner,
+		dataset: str,
+		database_type: str
+	) -> int:
+		# Runs query over one partition in auto-tuned batches on the 
+		# Session of the current worker thread.
+		total = 0
+		start = 0
+
+		while start < len(rows):
+			batch = rows.iloc[start:start + tuner.batch_size]
+			batch_start_time = time.perf_counter()
+
+			with self._operation(dataset, 'insert', database_type):
+				result = self.__connection.write(
+					query, parameters={'rows': batch.to_dict('records')}
+				)
+
+			tuner.observe(len(batch), time.perf_counter() - batch_start_time)
+			total += result[0]['total']
+			start += len(batch)
+
+		return total
+
+	def __run_parallel(
+		self,
+		query: str,
+		rows: pd.DataFrame,
+		workers: int,
+		dataset: str,
+		database_type: str,
+		partition_key: Optional[str] = None
+	) -> int:
+		# Splits rows into one partition per worker and runs them in 
+		# parallel. Partitioning by key gives every worker a disjoint set of 
+		# key nodes, so workers do not contend for their locks.
+		if partition_key is None:
+			partitions = [rows.iloc[worker::workers] for worker in range(workers)]
+
+		else:
+			rows = rows.sort_values(partition_key)
+			worker_ids = (
+				pd.util.hash_pandas_object(rows[partition_key], index=False)
+				% workers
+			)
+			partitions = [
+				rows[(worker_ids == worker).to_numpy()] 
+				for worker in range(workers)
+			]
+
+		tuner = BatchSizeTuner(self.__batch_size)
+
+		with ThreadPoolExecutor(max_workers=workers) as executor:
+			totals = executor.map(
+				lambda partition: self.__run_partition(
+					query, partition, tuner, dataset, database_type
+				),
+				partitions
+			)
 
-		authors = pd.DataFrame(data[['cleaned_authors_list']])
-		authors.rename(
-			columns={'cleaned_authors_list':'author'},
-			inplace=True
+			total = sum(totals)
+
+		print(
+			{'dataset': dataset, 'total': total, 'batch_size': tuner.batch_size}
 		)
-		authors=authors.explode('author').drop_duplicates(subset=['author'])
 
-		return categories, authors
+		return total
+
+	def __add_papers_parallel(self, rows, workers, timer):
+		# Adds paper nodes first and relationships afterwards. Category 
+		# relationships are partitioned by category and authorship by author, 
+		# so the shared Category and Author nodes are only locked by one 
+		# worker. Rare deadlocks on Paper nodes are retried by the managed 
+		# write transactions.
+		with timer.phase('nodes'):
+			self.__run_parallel(
+				self.PAPER_NODES_QUERY,
+				rows[['id', 'title']],
+				workers,
+				'Papers',
+				'Neo4j (Parallel)'
+			)
+
+		with timer.phase('in_category'):
+			self.__run_parallel(
+				self.IN_CATEGORY_QUERY,
+				self.__relationships('in_category', 'categories', 'category'),
+				workers,
+				'Papers',
+				'Neo4j (Parallel)',
+				partition_key='category'
+			)
+
+		with timer.phase('authored'):
+			self.__run_parallel(
+				self.AUTHORED_QUERY,
+				self.__relationships('authored', 'authors', 'author'),
+				workers,
+				'Papers',
+				'Neo4j (Parallel)',
+				partition_key='author'
+			)
+
+	def __write_import_files(
+		self,
+		import_folder: str,
+		admin: bool
+	) -> None:
+		# Writes node and relationship CSV Files of the cleaned data.
+		os.makedirs(import_folder, exist_ok=True)
+
+		frames = {
+			'categories.csv': self.__categories,
+			'authors.csv': self.__authors,
+			'papers.csv': self.__data[['id', 'title']],
+			'in_category.csv': self.__relationships(
+				'in_category', 'categories', 'category'
+			),
+			'authored.csv': self.__relationships(
+				'authored', 'authors', 'author'
+			)[['author', 'id']]
+		}
+
+		for file, (headers, admin_headers) in self.IMPORT_FILES.items():
+			frames[file].to_csv(
+				os.path.join(import_folder, file),
+				header=admin_headers if admin else headers,
+				index=False
+			)
 
-	def populate_database(self, data_folder: str) -> None:
+	def __load_csv(self, import_folder: str, rows: int) -> None:
+		# Loads CSV Files with LOAD CSV, one insert time per dataset and one 
+		# for the whole Graph (including writing the CSV Files).
+		database_type = 'Neo4j (Bulk Import)'
+
+		with self._timed(
+			'Default', 'Graph', 'insert', database_type
+		) as graph_timer:
+			with graph_timer.phase('serialization'):
+				self.__write_import_files(import_folder, admin=False)
+
+			for dataset, queries in self.LOAD_CSV_QUERIES.items():
+				with graph_timer.phase('network'), self._timed(
+					'Default', dataset, 'insert', database_type
+				):
+					for query in queries:
+						with self._operation(dataset, 'insert', database_type):
+							self.__connection.query(
+								query, parameters={'rows': rows}
+							)
+
+	def __admin_import(self, import_folder: str) -> None:
+		# Imports CSV Files with neo4j-admin into an empty, stopped Database.
+		with self._timed(
+			'Default', 'Graph', 'insert', 'Neo4j (Admin Import)'
+		) as timer:
+			with timer.phase('serialization'):
+				self.__write_import_files(import_folder, admin=True)
+
+			# neo4j-admin may run inside the Neo4j container, where the 
+			# import folder is mounted under another path.
+			admin_folder = os.getenv('NEO4J_ADMIN_IMPORT_FOLDER')
+			paths = {
+				file: (
+					os.path.join(import_folder, f'{file}.csv')
+					if admin_folder is None
+					else posixpath.join(admin_folder, f'{file}.csv')
+				)
+				for file in [
+					'categories',
+					'authors',
+					'papers',
+					'in_category',
+					'authored'
+				]
+			}
+
+			command = shlex.split(
+				os.getenv('NEO4J_ADMIN_COMMAND', 'neo4j-admin')
+			) + [
+				'database',
+				'import',
+				'full',
+				'--overwrite-destination',
+				'--multiline-fields=true',
+				f"--nodes=Category={paths['categories']}",
+				f"--nodes=Author={paths['authors']}",
+				f"--nodes=Paper={paths['papers']}",
+				f"--relationships=IN_CATEGORY={paths['in_category']}",
+				f"--relationships=AUTHORED={paths['authored']}",
+				os.getenv('NEO4J_DATABASE', 'neo4j')
+			]
+
+			with timer.phase('network'):
+				subprocess.run(command, check=True)
+
+	def __relationships(
+		self,
+		relationships: str,
+		nodes: str,
+		name: str
+	) -> pd.DataFrame:
+		# Resolves interned relationship IDs to paper ids and node names.
+		table = self.__tables[relationships]
+
+		return pd.DataFrame({
+			'id': self.__data['id'].to_numpy()[table['paper_id'].to_numpy()],
+			name: self.__tables[nodes][name].to_numpy()[
+				table[f'{name}_id'].to_numpy()
+			]
+		})
+
+	def populate_database(
+		self,
+		data_folder: str,
+		workers: Optional[int] = None,
+		lines: Optional[int] = 100000,
+		import_mode: Optional[str] = None,
+		import_rows: Optional[int] = 10000
+	) -> None:
 		"""Populates Neo4j Database from JSON Files in Data Folder.
 
-        Args:
-            data_folder (str): Data Folder Path.
-        """
+		Args:
+			data_folder (str): Data Folder Path.
+			workers (Optional[int]): Number of parallel ingestion workers. 
+			Batches are sent one after another if not set. Defaults to None.
+			lines (Optional[int]): Number of lines loaded from each file, the 
+			whole snapshot is loaded if set to None. Defaults to 100000.
+			import_mode (Optional[str]): Offline bulk import instead of online 
+			MERGE. 'load_csv' writes node and relationship CSV Files to the 
+			Neo4j import folder (NEO4J_IMPORT_FOLDER) and loads them with LOAD 
+			CSV (recorded as 'Neo4j (Bulk Import)'). 'admin' imports them with 
+			neo4j-admin (NEO4J_ADMIN_COMMAND) into an empty, stopped Database 
+			(recorded as 'Neo4j (Admin Import)'), with the import folder as 
+			seen by neo4j-admin (NEO4J_ADMIN_IMPORT_FOLDER, the host folder if 
+			not set). Defaults to None.
+			import_rows (Optional[int]): Rows committed per LOAD CSV 
+			transaction. Defaults to 10000.
+		"""
+		import_folder = os.getenv(
+			'NEO4J_IMPORT_FOLDER',
+			os.path.join(os.getcwd(), 'data', 'neo4j_import')
+		)
+
 		for file in os.listdir(data_folder):
 			self.__create_tables()
-			self.__data = load_and_clean_archive_data(
+			self.__indexed = True
+			self.__tables = load_archive_tables(
 				file_path=os.path.join(
 					data_folder,
 					file
 				),
-				lines=100000
-			)		
-			self.__categories, self.__authors = self.__process_data(
-				data=self.__data
+				lines=lines
 			)
+			self.__data = self.__tables['papers'].drop(columns='paper_id')
+			self.__categories = self.__tables['categories'][['category']]
+			self.__authors = self.__tables['authors'][['author']]
 			
-			self.insert_data()
+			if import_mode == 'load_csv':
+				self.__load_csv(import_folder, import_rows)
+
+			elif import_mode == 'admin':
+				self.__admin_import(import_folder)
+
+			else:
+				self.insert_data(workers=workers)
+				continue
+
+			if self.__export_statistics:
+				self.__statistics.display_statistics()
+				self.__statistics.export_plots()
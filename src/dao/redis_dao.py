@@ -1,65 +1,220 @@
-import json
 import os
 import time
+from typing import Any, Iterator, List, Optional
 
-from redis import Redis
+from redis import BlockingConnectionPool, Redis
+from redis.client import Pipeline
 from redis.commands.json.path import Path
 
-from dao.dao import DAO
+from dao.connection_pool import (
+    acquire_pool,
+    get_pool_config,
+    pool_key,
+    PoolWaitRecorder,
+    release_pool
+)
+from dao.dao import DAO, Timer
 from stats.statistics import Statistics
+from utils.data_loader import iter_json_chunks
+
+class _TimedConnectionPool(BlockingConnectionPool):
+
+    """Represents blocking Connection Pool which records check-out waits."""
+
+    def __init__(self, recorder: PoolWaitRecorder, **kwargs) -> None:
+        """Initializes the _TimedConnectionPool Class.
+
+        Args:
+            recorder (PoolWaitRecorder): Wait time recorder.
+            **kwargs: BlockingConnectionPool and Connection options.
+        """
+        self.__recorder: PoolWaitRecorder = recorder
+
+        super().__init__(**kwargs)
+
+    def get_connection(self, command_name, *keys, **options):
+        start_time = time.perf_counter_ns()
+
+        try:
+            return super().get_connection(command_name, *keys, **options)
+
+        finally:
+            self.__recorder.record_ns(time.perf_counter_ns() - start_time)
+
 
 class RedisDAO(DAO):
 
     """Represents Redis Database Access Object."""
 
-    def __init__(self, statistics: Statistics) -> None:
+    def __init__(
+        self,
+        statistics: Statistics,
+        pipeline_size: Optional[int] = None,
+        instrumentation: Optional[bool] = True
+    ) -> None:
         """Initializes the RedisDAO Class.
         
         Args:
             statistics (Statistics): Database Testing Statistics Object.
+            pipeline_size (Optional[int]): Number of commands buffered in a
+            Pipeline before it is flushed. Every command is sent in its own
+            round trip if not set. Defaults to None.
+            instrumentation (Optional[bool]): Time CRUD calls. Defaults to
+            True.
         """
-        super().__init__()
+        super().__init__(
+            database_type=(
+                'Redis' if pipeline_size is None else 'Redis (Pipeline)'
+            ),
+            statistics=statistics,
+            instrumentation=instrumentation
+        )
 
-        self.__database_type: str = 'Redis'
+        self.__pipeline_size: Optional[int] = pipeline_size
         self.__port: int = 6379
         self.__connection: Redis = self.create_connection()
-        self.__statistics: Statistics = statistics
+
+    @property
+    def connection(self) -> Redis:
+        """Returns Redis Connection backed by the shared Connection Pool.
+
+        Returns:
+            Redis: Redis Connection.
+        """
+        return self.__connection
 
     def create_connection(self, **kwargs):
-        """Creates new Redis Connection.
+        """Creates new Redis Connection, or reuses the shared Connection Pool
+        with the same configuration (see get_pool_config, prefix 'REDIS').
 
         Returns:
             Redis: New Redis Connection.
         """
-        return Redis(
-            host='localhost',
-            port=self.__port,
-            decode_responses=True
+        config = get_pool_config('REDIS', self.__port)
+        self.__pool_key = pool_key('REDIS', config)
+
+        connection_pool, self.__pool_waits = acquire_pool(
+            self.__pool_key,
+            lambda recorder: _TimedConnectionPool(
+                recorder,
+                host=config['host'],
+                port=config['port'],
+                max_connections=config['pool_size'] or 50,
+                timeout=config['pool_timeout'] or 20,
+                socket_connect_timeout=config['connect_timeout'],
+                socket_timeout=config['socket_timeout'],
+                socket_keepalive=config['keepalive'],
+                decode_responses=True
+            )
         )
 
-    def read_data(self, **kwargs):
+        return Redis(connection_pool=connection_pool)
+
+    def read_data(self, **kwargs) -> int:
         """Reads every Document from the Database with a specific ID prefix.
 
         Args:
-            **kwargs (str): Keyword Arguments ('database' and 'collection' 
-            expected).
+            **kwargs (Union[str, int, List[str]]): Keyword Arguments 
+            ('database' and 'collection' expected; 'fields', 'batch_size' and 
+            'sink' optional). With a batch size, keys are scanned and 
+            fetched in batches with JSON.MGET (or pipelined JSON.GET for 
+            several projected fields). Every Document is fetched with its 
+            own JSON.GET if not set. Sink see DAO._consume.
+
+        Returns:
+            int: Checksum of the read Documents.
         """
         database_name = '_'.join(
             [kwargs['database'], kwargs['collection']]
         ).lower()
+        fields = kwargs.get('fields')
+        batch_size = kwargs.get('batch_size')
+
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'read'
+        ) as timer:
+            if batch_size is None:
+                documents = self.__read_documents(
+                    database_name, fields, kwargs['collection'], timer
+                )
+
+            else:
+                documents = self.__read_batches(
+                    database_name,
+                    fields,
+                    batch_size,
+                    kwargs['collection'],
+                    timer
+                )
+
+            return self._consume(
+                documents, timer, kwargs.get('sink', 'print')
+            )
 
-        start_time = time.time()
+    def __read_documents(
+        self,
+        database_name: str,
+        fields: Optional[List[str]],
+        dataset: str,
+        timer: Timer
+    ) -> Iterator[Any]:
+        # Fetches Documents one JSON.GET round trip at a time.
+        paths = (
+            [Path.root_path()] if fields is None
+            else [f'$.{field}' for field in fields]
+        )
 
         for key in self.__connection.scan_iter(f'{database_name}*'):
-            print(self.__connection.json().get(key))
-
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='read',
-            time=time.time() - start_time
-        )
+            with timer.phase('network'), self._operation(dataset, 'read'):
+                document = self.__connection.json().get(key, *paths)
+
+            yield document
+
+    def __read_batches(
+        self,
+        database_name: str,
+        fields: Optional[List[str]],
+        batch_size: int,
+        dataset: str,
+        timer: Timer
+    ) -> Iterator[Any]:
+        # Fetches Documents batch by batch, one round trip per batch.
+        keys = []
+
+        for key in self.__connection.scan_iter(
+            f'{database_name}*', count=batch_size
+        ):
+            keys.append(key)
+
+            if len(keys) == batch_size:
+                yield from self.__fetch_batch(keys, fields, dataset, timer)
+                keys = []
+
+        if keys:
+            yield from self.__fetch_batch(keys, fields, dataset, timer)
+
+    def __fetch_batch(
+        self,
+        keys: List[str],
+        fields: Optional[List[str]],
+        dataset: str,
+        timer: Timer
+    ) -> List[Any]:
+        # JSON.MGET takes a single path, several projected fields are read 
+        # with pipelined multi-path JSON.GET calls instead.
+        with timer.phase('network'), self._operation(dataset, 'read'):
+            if fields is None or len(fields) == 1:
+                return self.__connection.json().mget(
+                    keys,
+                    Path.root_path() if fields is None else f'$.{fields[0]}'
+                )
+
+            pipeline = self.__connection.json().pipeline(transaction=False)
+
+            for key in keys:
+                pipeline.get(key, *[f'$.{field}' for field in fields])
+
+            return pipeline.execute()
 
     def insert_data(self, **kwargs):
         """Inserts key value pair to the Redis database.
@@ -82,30 +237,48 @@ class RedisDAO(DAO):
             [kwargs['database'], kwargs['collection']]
         ).lower()
 
-        start_time = time.time()
-
-        doc_ids = kwargs['doc_ids']
-        if doc_ids is None or len(doc_ids) == 0:
-            doc_ids = []
-
-            for doc_id in self.__connection.scan_iter(f"{database_name}*"):
-                doc_ids.append(doc_id)
-
-        for doc_id in doc_ids:
-            document = self.__connection.json().get(doc_id)
-            document[kwargs['key']] = kwargs['new_value']
-
-            self.__connection.json().set(
-                doc_id, Path.root_path(), document
-            )
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'update'
+        ) as timer:
+            doc_ids = kwargs['doc_ids']
+            if doc_ids is None or len(doc_ids) == 0:
+                doc_ids = []
+
+                for doc_id in self.__connection.scan_iter(
+                    f"{database_name}*"
+                ):
+                    doc_ids.append(doc_id)
+
+            if self.__pipeline_size is None:
+                for doc_id in doc_ids:
+                    with timer.phase('network'), self._operation(
+                        kwargs['collection'], 'update'
+                    ):
+                        document = self.__connection.json().get(doc_id)
+                        document[kwargs['key']] = kwargs['new_value']
+
+                        self.__connection.json().set(
+                            doc_id, Path.root_path(), document
+                        )
+
+            else:
+                # Sets only the updated field on the server side instead of
+                # fetching and re-writing the whole Document.
+                pipeline = self.__connection.json().pipeline(
+                    transaction=False
+                )
+
+                for doc_id in doc_ids:
+                    pipeline.set(
+                        doc_id, f"$.{kwargs['key']}", kwargs['new_value']
+                    )
+                    self.__flush(
+                        pipeline, kwargs['collection'], 'update', timer
+                    )
 
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='update',
-            time=time.time() - start_time
-        )
+                self.__flush(
+                    pipeline, kwargs['collection'], 'update', timer, force=True
+                )
 
     def delete_data(self, **kwargs):
         """Removes every Document from Database with specific ID prefix.
@@ -118,26 +291,64 @@ class RedisDAO(DAO):
             [kwargs['database'], kwargs['collection']]
         ).lower()
 
-        start_time = time.time()
-
-        for key in self.__connection.keys(f'{database_name}*'):
-            self.__connection.delete(key)
-
-        self.__statistics.add_execution_time(
-            database_type=self.__database_type,
-            database=kwargs['database'],
-            dataset=kwargs['collection'],
-            action='delete',
-            time=time.time() - start_time
-        )
+        with self._timed(
+            kwargs['database'], kwargs['collection'], 'delete'
+        ) as timer:
+            if self.__pipeline_size is None:
+                for key in self.__connection.keys(f'{database_name}*'):
+                    with timer.phase('network'), self._operation(
+                        kwargs['collection'], 'delete'
+                    ):
+                        self.__connection.delete(key)
+
+            else:
+                pipeline = self.__connection.pipeline(transaction=False)
+                keys = []
+
+                for key in self.__connection.scan_iter(
+                    f'{database_name}*', count=self.__pipeline_size
+                ):
+                    keys.append(key)
+
+                    # Every UNLINK already carries a full batch of keys, so
+                    # it is sent at once instead of buffering pipeline_size
+                    # of them.
+                    if len(keys) == self.__pipeline_size:
+                        pipeline.unlink(*keys)
+                        keys = []
+                        self.__flush(
+                            pipeline,
+                            kwargs['collection'],
+                            'delete',
+                            timer,
+                            force=True
+                        )
+
+                if keys:
+                    pipeline.unlink(*keys)
+
+                self.__flush(
+                    pipeline, kwargs['collection'], 'delete', timer, force=True
+                )
         
     def close_connection(self):
-        """Closes Redis connection.
-        
-        No need to close the database, Redis handles closing the database 
-        automatically for the client.
-        """
-        pass
+        """Reports pool wait times and releases the Redis Connection Pool,
+        the shared pool is disconnected by its last user."""
+        self._report_pool_waits(self.__pool_waits)
+        release_pool(self.__pool_key, lambda pool: pool.disconnect())
+
+    def __flush(
+        self,
+        pipeline: Pipeline,
+        dataset: str,
+        action: str,
+        timer: Timer,
+        force: Optional[bool] = False
+    ) -> None:
+        # Sends buffered commands once the Pipeline reaches its size limit.
+        if len(pipeline) >= self.__pipeline_size or (force and len(pipeline)):
+            with timer.phase('network'), self._operation(dataset, action):
+                pipeline.execute()
 
     def populate_database(self, data_folder: str) -> None:
         """Populates Redis Database from JSON Files in Data Folder.
@@ -146,31 +357,52 @@ class RedisDAO(DAO):
             data_folder (str): Data Folder Path.
         """
         for file in os.listdir(data_folder):
-            start_time = time.time()
-
-            with open(os.path.join(data_folder, file)) as json_file:
-                for line in json_file:
-                    data=json.loads(line)
-
-                    key = '_'.join(
-                        [
-                            os.getenv('DB_NAME'),
-                            file.split('.')[0],
-                            str(data['id'])
-                        ]
-                    ).lower()
-
-                    self.insert_data(
-                        database=os.getenv('DB_NAME'),
-                        collection=file.split('.')[0],
-                        key=key,
-                        data=data
+            with self._timed(
+                os.getenv('DB_NAME'), file.split('.')[0], 'insert'
+            ) as timer:
+                pipeline = (
+                    None if self.__pipeline_size is None
+                    else self.__connection.json().pipeline(transaction=False)
+                )
+
+                for records in timer.iterate(
+                    iter_json_chunks(
+                        os.path.join(data_folder, file),
+                        chunk_size=self.__pipeline_size or 1000
+                    ),
+                    'serialization'
+                ):
+                    for data in records:
+                        key = '_'.join(
+                            [
+                                os.getenv('DB_NAME'),
+                                file.split('.')[0],
+                                str(data['id'])
+                            ]
+                        ).lower()
+
+                        if pipeline is None:
+                            with timer.phase('network'), self._operation(
+                                file.split('.')[0], 'insert'
+                            ):
+                                self.insert_data(
+                                    database=os.getenv('DB_NAME'),
+                                    collection=file.split('.')[0],
+                                    key=key,
+                                    data=data
+                                )
+
+                        else:
+                            pipeline.set(key, Path.root_path(), data)
+                            self.__flush(
+                                pipeline, file.split('.')[0], 'insert', timer
+                            )
+
+                if pipeline is not None:
+                    self.__flush(
+                        pipeline,
+                        file.split('.')[0],
+                        'insert',
+                        timer,
+                        force=True
                     )
-
-            self.__statistics.add_execution_time(
-                database_type=self.__database_type,
-                database=os.getenv('DB_NAME'),
-                dataset=file.split('.')[0],
-                action='insert',
-                time=time.time() - start_time
-            )
@@ -1,23 +1,45 @@
+import os
+
 from dotenv import load_dotenv
 
 from stats.statistics import Statistics
-from utils.utils import (
-	run_couchdb,
-	run_mongodb,
-	run_neo4j,
-	run_redis
-)
+from utils.utils import run_benchmarks, run_load, run_scenario, run_sweep
 
 
 if __name__ == '__main__':
 	load_dotenv()
 	iterations = 50
+	concurrent = os.getenv('RUN_MODE', 'isolated').lower() == 'concurrent'
+
+	statistics = Statistics(
+		iterations,
+		run_mode='concurrent' if concurrent else 'isolated'
+	)
+
+	if os.getenv('SCENARIO_FILE'):
+		run_scenario(statistics, os.getenv('SCENARIO_FILE'))
+
+	elif os.getenv('SWEEP_SIZES'):
+		run_sweep(
+			statistics,
+			iterations,
+			sizes=[int(size) for size in os.getenv('SWEEP_SIZES').split(',')],
+			concurrent=concurrent,
+			synthetic=os.getenv('SWEEP_DATA', 'sample').lower() == 'synthetic'
+		)
 
-	statistics = Statistics(iterations)
+	elif os.getenv('LOAD_DATABASES'):
+		for database_type in os.getenv('LOAD_DATABASES').split(','):
+			run_load(
+				statistics,
+				database_type.strip(),
+				concurrency_levels=[
+					int(level)
+					for level in os.getenv('LOAD_CONCURRENCY').split(',')
+				] if os.getenv('LOAD_CONCURRENCY') else None
+			)
 
-	run_couchdb(statistics, iterations)
-	run_neo4j()
-	run_mongodb(statistics, iterations)
-	run_redis(statistics, iterations)
+	else:
+		run_benchmarks(statistics, iterations, concurrent=concurrent)
 
 	statistics()
@@ -0,0 +1,172 @@
+import math
+from typing import Dict, List, Optional
+
+
+class LatencyHistogram:
+
+	"""Represents log-bucketed (HDR-style) Latency Histogram.
+
+	Latencies are recorded in nanoseconds. Values below the sub-bucket count
+	are stored exactly, larger values fall into logarithmic buckets which are
+	split into linear sub-buckets, so the relative error of every reported
+	value is bounded by 2 / sub-bucket count.
+	"""
+
+	def __init__(self, sub_bucket_bits: Optional[int] = 7) -> None:
+		"""Initializes the LatencyHistogram Class.
+
+		Args:
+			sub_bucket_bits (Optional[int]): Number of bits used for linear
+			sub-buckets. Defaults to 7 (128 sub-buckets, ~1.6 % error).
+		"""
+		self.__sub_bucket_bits: int = sub_bucket_bits
+		self.__sub_bucket_count: int = 1 << sub_bucket_bits
+		self.__half_sub_bucket_count: int = self.__sub_bucket_count >> 1
+		self.__counts: List[int] = [0] * self.__sub_bucket_count
+		self.__count: int = 0
+		self.__min: int = 0
+		self.__max: int = 0
+
+	@property
+	def count(self) -> int:
+		"""Returns number of recorded values.
+
+		Returns:
+			int: Number of recorded values.
+		"""
+		return self.__count
+
+	def __index(self, value: int) -> int:
+		# Maps value to its bucket index.
+		if value < self.__sub_bucket_count:
+			return value
+
+		shift = value.bit_length() - self.__sub_bucket_bits
+
+		return (
+			self.__sub_bucket_count +
+			(shift - 1) * self.__half_sub_bucket_count +
+			(value >> shift) - self.__half_sub_bucket_count
+		)
+
+	def __highest_value(self, index: int) -> int:
+		# Maps bucket index to the highest value stored in the bucket.
+		if index < self.__sub_bucket_count:
+			return index
+
+		shift, offset = divmod(
+			index - self.__sub_bucket_count,
+			self.__half_sub_bucket_count
+		)
+		shift += 1
+
+		return ((offset + self.__half_sub_bucket_count + 1) << shift) - 1
+
+	def record(self, latency: float) -> None:
+		"""Records single latency.
+
+		Args:
+			latency (float): Latency in seconds.
+		"""
+		self.record_ns(int(latency * 1e9))
+
+	def record_ns(self, latency: int) -> None:
+		"""Records single latency in nanoseconds.
+
+		Args:
+			latency (int): Latency in nanoseconds.
+		"""
+		latency = max(latency, 0)
+		index = self.__index(latency)
+
+		if index >= len(self.__counts):
+			self.__counts.extend([0] * (index + 1 - len(self.__counts)))
+
+		self.__counts[index] += 1
+
+		if self.__count == 0 or latency < self.__min:
+			self.__min = latency
+
+		if latency > self.__max:
+			self.__max = latency
+
+		self.__count += 1
+
+	def merge(self, other: 'LatencyHistogram') -> None:
+		"""Adds every value recorded by another Histogram.
+
+		Args:
+			other (LatencyHistogram): Histogram with the same sub-bucket
+			count.
+		"""
+		if other.count == 0:
+			return
+
+		if len(other.__counts) > len(self.__counts):
+			self.__counts.extend(
+				[0] * (len(other.__counts) - len(self.__counts))
+			)
+
+		for index, count in enumerate(other.__counts):
+			self.__counts[index] += count
+
+		if self.__count == 0 or other.__min < self.__min:
+			self.__min = other.__min
+
+		self.__max = max(self.__max, other.__max)
+		self.__count += other.count
+
+	def percentile(self, percentile: float) -> float:
+		"""Returns latency at given percentile.
+
+		Args:
+			percentile (float): Percentile between 0 and 100.
+
+		Returns:
+			float: Latency in seconds, NaN if nothing was recorded.
+		"""
+		if self.__count == 0:
+			return math.nan
+
+		target = max(math.ceil(percentile / 100 * self.__count), 1)
+		total = 0
+
+		for index, count in enumerate(self.__counts):
+			total += count
+
+			if total >= target:
+				return (
+					min(max(self.__highest_value(index), self.__min), self.__max)
+					/ 1e9
+				)
+
+		return self.__max / 1e9
+
+	def summary(
+		self,
+		percentiles: Optional[List[float]] = None
+	) -> Dict[str, float]:
+		"""Returns count, percentiles and maximum of recorded latencies.
+
+		Args:
+			percentiles (Optional[List[float]]): Reported percentiles.
+			Defaults to [50, 90, 99, 99.9].
+
+		Returns:
+			Dict[str, float]: Count, percentiles (e.g. 'p99.9') and 'max' in
+			seconds.
+		"""
+		percentiles = (
+			[50, 90, 99, 99.9] if percentiles is None else percentiles
+		)
+
+		summary = {'count': self.__count}
+
+		for percentile in percentiles:
+			summary[f'p{percentile:g}'] = self.percentile(percentile)
+
+		summary['max'] = (
+			self.__max / 1e9 if self.__count > 0 else math.nan
+		)
+
+		return summary
@@ -1,9 +1,15 @@
 import os
-from typing import Optional
+import threading
+from array import array
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 
+from stats.latency_histogram import LatencyHistogram
+
 
 class Statistics:
 
@@ -14,7 +20,8 @@ class Statistics:
 		iterations: int,
 		export_folder_path: Optional[str] = os.path.join(
 			os.getcwd(), 'data', 'output'
-		)
+		),
+		run_mode: Optional[str] = 'isolated'
 	) -> None:
 		"""Initializes the Statistics Class.
 
@@ -23,13 +30,35 @@ class Statistics:
 			export_folder_path (Optional[str]): Database Testing Statistics 
 			result export folder path. Defaults to os.path.join(os.getcwd(), 
 			'data', 'output').
+			run_mode (Optional[str]): Whether the Database suites were run 
+			'isolated' (one after another) or 'concurrent'. Recorded with 
+			every execution time. Defaults to 'isolated'.
 		"""
 		self.__iterations: int = iterations 
+		self.__run_mode: str = run_mode
 		self.__export_folder_path: str = export_folder_path
+		self.__execution_time_columns: Dict[str, Union[List[str], array]] = {
+			'database_type': [],
+			'database': [],
+			'dataset': [],
+			'action': [],
+			'time': array('d'),
+			'phase': [],
+			'run_mode': []
+		}
+		self.__execution_times_lock: threading.Lock = threading.Lock()
 		self.__execution_times: pd.DataFrame = None
+		self.__latency_histograms: Dict[
+			Tuple[str, str, str], LatencyHistogram
+		] = {}
+		self.__latency_histograms_lock: threading.Lock = threading.Lock()
+		self.__load_results: pd.DataFrame = None
+		self.__throughputs: List[dict] = []
+		self.__throughputs_lock: threading.Lock = threading.Lock()
+		self.__scaling: List[dict] = []
 
 		if not os.path.exists(self.__export_folder_path):
-			os.mkdir(self.__export_folder_path)
+			os.makedirs(self.__export_folder_path)
 
 	def add_execution_time(
 		self,
@@ -37,67 +66,582 @@ class Statistics:
 		database: str,
 		dataset: str,
 		action: str,
+		time: float,
+		phase: Optional[str] = 'total'
+	) -> None:
+		"""Adds new Execution Time value.
+
+		Values are appended to in-memory columns, the DataFrame is only built 
+		when it is needed by an export.
+
+		Args:
+			database_type (str): Type of NoSQL Database.
+			database (str): Name of the NoSQL Database.
+			dataset (str): Name of the Dataset/Collection in NoSQL Database.
+			action (str): Measured action.
+			time (float): Execution Time.
+			phase (Optional[str]): Part of the action the time is attributed 
+			to ('serialization', 'network', 'materialization'). Defaults to 
+			'total'.
+		"""
+		columns = self.__execution_time_columns
+
+		with self.__execution_times_lock:
+			columns['database_type'].append(database_type)
+			columns['database'].append(database)
+			columns['dataset'].append(dataset)
+			columns['action'].append(action)
+			columns['time'].append(time)
+			columns['phase'].append(phase)
+			columns['run_mode'].append(self.__run_mode)
+			self.__execution_times = None
+
+	@property
+	def execution_times(self) -> Optional[pd.DataFrame]:
+		"""Returns every recorded execution time.
+
+		Returns:
+			Optional[pd.DataFrame]: Recorded execution times, None if nothing 
+			was recorded yet.
+		"""
+		with self.__execution_times_lock:
+			if (
+				self.__execution_times is None and 
+				len(self.__execution_time_columns['time']) > 0
+			):
+				self.__execution_times = pd.DataFrame(
+					{
+						column: (
+							np.frombuffer(values, dtype=np.float64).copy()
+							if isinstance(values, array) else values.copy()
+						)
+						for column, values in 
+						self.__execution_time_columns.items()
+					}
+				)
+
+			return self.__execution_times
+
+	@property
+	def sample_count(self) -> int:
+		"""Returns number of recorded execution times, used as a marker to 
+		select the execution times recorded after it.
+
+		Returns:
+			int: Number of recorded execution times.
+		"""
+		with self.__execution_times_lock:
+			return len(self.__execution_time_columns['time'])
+
+	@staticmethod
+	def __steady_state_start(times: np.ndarray) -> int:
+		# Marginal Standard Error Rule: drops the leading samples which 
+		# minimize the squared standard error of the remaining mean, searched 
+		# over the first half of the samples.
+		count = np.arange(len(times), 0, -1)
+		sums = np.cumsum(times[::-1])[::-1]
+		squares = np.cumsum(times[::-1] ** 2)[::-1]
+		errors = (squares / count - (sums / count) ** 2) / count
+
+		return int(np.argmin(errors[:len(times) // 2 + 1]))
+
+	def confidence_intervals(
+		self,
+		confidence: Optional[float] = 0.95,
+		since: Optional[int] = 0
+	) -> Optional[pd.DataFrame]:
+		"""Returns confidence intervals of the mean execution time of every 
+		Database type, dataset and action.
+
+		Leading samples before the steady state (e.g. cold caches, Database 
+		creation) are detected and dropped before the interval is computed.
+
+		Args:
+			confidence (Optional[float]): Confidence level. Defaults to 0.95.
+			since (Optional[int]): Only use execution times recorded after 
+			this marker, see sample_count. Defaults to 0.
+
+		Returns:
+			Optional[pd.DataFrame]: Sample count, dropped transient samples, 
+			mean, lower and upper bound (sec) and precision (half width 
+			relative to the mean), None if nothing was recorded.
+		"""
+		execution_times = self.execution_times
+
+		if execution_times is None:
+			return None
+
+		execution_times = execution_times.iloc[since:]
+		execution_times = execution_times[execution_times['phase'] == 'total']
+
+		if execution_times.empty:
+			return None
+
+		z = NormalDist().inv_cdf((1 + confidence) / 2)
+		rows = []
+
+		for (database_type, dataset, action), samples in (
+			execution_times.groupby(
+				['database_type', 'dataset', 'action'], sort=True
+			)
+		):
+			times = samples['time'].to_numpy()
+			transient = self.__steady_state_start(times)
+			steady = times[transient:]
+			mean = steady.mean()
+			half_width = (
+				z * steady.std(ddof=1) / np.sqrt(len(steady))
+				if len(steady) > 1 else np.nan
+			)
+
+			rows.append(
+				{
+					'database_type': database_type,
+					'dataset': dataset,
+					'action': action,
+					'samples': len(times),
+					'transient': transient,
+					'mean': mean,
+					'lower': mean - half_width,
+					'upper': mean + half_width,
+					'precision': half_width / mean if mean > 0 else np.nan,
+					'run_mode': self.__run_mode
+				}
+			)
+
+		return pd.DataFrame(rows)
+
+	def converged(
+		self,
+		precision: float,
+		since: Optional[int] = 0,
+		confidence: Optional[float] = 0.95,
+		min_samples: Optional[int] = 5
+	) -> bool:
+		"""Returns whether every action reached the target precision.
+
+		Args:
+			precision (float): Target half width of the confidence interval 
+			relative to the mean, e.g. 0.05.
+			since (Optional[int]): Only use execution times recorded after 
+			this marker, see sample_count. Defaults to 0.
+			confidence (Optional[float]): Confidence level. Defaults to 0.95.
+			min_samples (Optional[int]): Minimal number of steady state 
+			samples of every action. Defaults to 5.
+
+		Returns:
+			bool: True if every Database type, dataset and action recorded 
+			after the marker is precise enough.
+		"""
+		intervals = self.confidence_intervals(confidence, since)
+
+		if intervals is None:
+			return False
+
+		return bool(
+			(
+				(intervals['samples'] - intervals['transient'] >= min_samples)
+				& (intervals['precision'] <= precision)
+			).all()
+		)
+
+	def add_execution_times(self, execution_times: pd.DataFrame) -> None:
+		"""Adds execution times recorded by another Statistics Object.
+
+		Args:
+			execution_times (pd.DataFrame): Recorded execution times.
+		"""
+		if execution_times is None or execution_times.empty:
+			return
+
+		# Missing columns get the same defaults as add_execution_time.
+		defaults = {'phase': 'total', 'run_mode': self.__run_mode}
+
+		with self.__execution_times_lock:
+			for column, values in self.__execution_time_columns.items():
+				values.extend(
+					execution_times[column].tolist()
+					if column in execution_times
+					else [defaults.get(column)] * len(execution_times)
+				)
+
+			self.__execution_times = None
+
+	def add_throughput(
+		self,
+		database_type: str,
+		database: str,
+		dataset: str,
+		action: str,
+		records: int,
 		time: float
 	) -> None:
-		"""Adds new Insert Time value to DataFrame.
+		"""Adds number of records processed by an action in given time.
 
 		Args:
 			database_type (str): Type of NoSQL Database.
 			database (str): Name of the NoSQL Database.
 			dataset (str): Name of the Dataset/Collection in NoSQL Database.
+			action (str): Measured action.
+			records (int): Number of processed records.
 			time (float): Execution Time.
 		"""
-		data = {
-			'database_type': database_type,
-			'database': database,
-			'dataset': dataset,
-			'action': action,
-			'time': time
-		}
+		with self.__throughputs_lock:
+			self.__throughputs.append(
+				{
+					'database_type': database_type,
+					'database': database,
+					'dataset': dataset,
+					'action': action,
+					'records': records,
+					'time': time,
+					'run_mode': self.__run_mode
+				}
+			)
 
-		if self.__execution_times is None:
-			self.__execution_times = pd.DataFrame(
-				data,
-				index=[0]
-			)
-		else:
-			self.__execution_times = pd.concat(
-				[
-					self.__execution_times,
-					pd.DataFrame(
-						data,
-						index=[0]
-					)
-				],
-				axis=0,
-				ignore_index=True
+	@property
+	def throughputs(self) -> Optional[pd.DataFrame]:
+		"""Returns every recorded throughput.
+
+		Returns:
+			Optional[pd.DataFrame]: Processed records, time (sec) and records 
+			per second, None if nothing was recorded yet.
+		"""
+		with self.__throughputs_lock:
+			if not self.__throughputs:
+				return None
+
+			throughputs = pd.DataFrame(self.__throughputs)
+
+		return throughputs.assign(
+			records_per_sec=throughputs['records'] / throughputs['time']
+		)
+
+	def add_throughputs(self, throughputs: Optional[pd.DataFrame]) -> None:
+		"""Adds throughputs recorded by another Statistics Object.
+
+		Args:
+			throughputs (Optional[pd.DataFrame]): Recorded throughputs.
+		"""
+		if throughputs is None or throughputs.empty:
+			return
+
+		with self.__throughputs_lock:
+			self.__throughputs.extend(
+				throughputs.drop(columns='records_per_sec').to_dict('records')
+			)
+
+	def add_latency(
+		self,
+		database_type: str,
+		dataset: str,
+		action: str,
+		latency: float
+	) -> None:
+		"""Records latency of single operation in its Latency Histogram.
+
+		Args:
+			database_type (str): Type of NoSQL Database.
+			dataset (str): Name of the Dataset/Collection in NoSQL Database.
+			action (str): Measured action.
+			latency (float): Operation latency in seconds.
+		"""
+		key = (database_type, dataset, action)
+
+		with self.__latency_histograms_lock:
+			histogram = self.__latency_histograms.get(key)
+
+			if histogram is None:
+				histogram = self.__latency_histograms[key] = LatencyHistogram()
+
+			histogram.record(latency)
+
+	@property
+	def latency_histograms(
+		self
+	) -> Dict[Tuple[str, str, str], LatencyHistogram]:
+		"""Returns every Latency Histogram.
+
+		Returns:
+			Dict[Tuple[str, str, str], LatencyHistogram]: Latency Histograms 
+			keyed by Database type, dataset and action.
+		"""
+		return self.__latency_histograms
+
+	def add_latency_histograms(
+		self,
+		latency_histograms: Dict[Tuple[str, str, str], LatencyHistogram]
+	) -> None:
+		"""Merges Latency Histograms recorded by another Statistics Object.
+
+		Args:
+			latency_histograms (Dict[Tuple[str, str, str], LatencyHistogram]): 
+			Latency Histograms keyed by Database type, dataset and action.
+		"""
+		with self.__latency_histograms_lock:
+			for key, histogram in latency_histograms.items():
+				self.__latency_histograms.setdefault(
+					key, LatencyHistogram()
+				).merge(histogram)
+
+	@property
+	def latency_percentiles(self) -> Optional[pd.DataFrame]:
+		"""Returns per-operation latency percentiles.
+
+		Returns:
+			Optional[pd.DataFrame]: Operation count, p50, p90, p99, p99.9 and 
+			max latency (sec) for every Database type, dataset and action, 
+			None if no latency was recorded.
+		"""
+		if not self.__latency_histograms:
+			return None
+
+		return pd.DataFrame(
+			[
+				{
+					'database_type': database_type,
+					'dataset': dataset,
+					'action': action,
+					'run_mode': self.__run_mode
+				} | histogram.summary()
+				for (database_type, dataset, action), histogram in sorted(
+					self.__latency_histograms.items()
+				)
+			]
+		)
+
+	@property
+	def cache_summary(self) -> Optional[pd.DataFrame]:
+		"""Returns hit ratio and hit/miss latencies of cached DAOs.
+
+		Returns:
+			Optional[pd.DataFrame]: Hits (both tiers), misses, hit ratio and 
+			p50 latency (sec) of hits and misses for every cached Database 
+			type and dataset, None if no cached read was recorded.
+		"""
+		lookups = {}
+
+		for (database_type, dataset, action), histogram in sorted(
+			self.__latency_histograms.items()
+		):
+			if action in ('cache_hit', 'cache_hit_l2', 'cache_miss'):
+				lookups.setdefault((database_type, dataset), {})[action] = (
+					histogram
+				)
+
+		if not lookups:
+			return None
+
+		rows = []
+
+		for (database_type, dataset), histograms in lookups.items():
+			counts = {
+				action: histograms[action].count if action in histograms else 0
+				for action in ('cache_hit', 'cache_hit_l2', 'cache_miss')
+			}
+			hits = counts['cache_hit'] + counts['cache_hit_l2']
+
+			rows.append(
+				{
+					'database_type': database_type,
+					'dataset': dataset,
+					'hits': hits,
+					'l2_hits': counts['cache_hit_l2'],
+					'misses': counts['cache_miss'],
+					'hit_ratio': hits / (hits + counts['cache_miss']),
+					'hit_p50': (
+						histograms['cache_hit'].percentile(50)
+						if 'cache_hit' in histograms else np.nan
+					),
+					'l2_hit_p50': (
+						histograms['cache_hit_l2'].percentile(50)
+						if 'cache_hit_l2' in histograms else np.nan
+					),
+					'miss_p50': (
+						histograms['cache_miss'].percentile(50)
+						if 'cache_miss' in histograms else np.nan
+					),
+					'run_mode': self.__run_mode
+				}
+			)
+
+		return pd.DataFrame(rows)
+
+	def add_scaling(self, size: int, statistics: 'Statistics') -> None:
+		"""Summarizes a run at single dataset size into the scaling curves.
+
+		Args:
+			size (int): Number of records in every dataset of the run.
+			statistics (Statistics): Statistics Object of the run.
+		"""
+		rows = {}
+		throughputs = statistics.throughputs
+
+		if throughputs is not None:
+			for (database_type, action), samples in throughputs.groupby(
+				['database_type', 'action']
+			):
+				rows.setdefault((database_type, action), {})[
+					'records_per_sec'
+				] = samples['records'].sum() / samples['time'].sum()
+
+		histograms = {}
+
+		for (database_type, _, action), histogram in (
+			statistics.latency_histograms.items()
+		):
+			histograms.setdefault(
+				(database_type, action), LatencyHistogram()
+			).merge(histogram)
+
+		for key, histogram in histograms.items():
+			rows.setdefault(key, {}).update(
+				p50=histogram.percentile(50), p99=histogram.percentile(99)
 			)
 
+		self.__scaling.extend(
+			{
+				'database_type': database_type,
+				'action': action,
+				'size': size,
+				'records_per_sec': np.nan,
+				'p50': np.nan,
+				'p99': np.nan,
+				'run_mode': self.__run_mode
+			} | values
+			for (database_type, action), values in sorted(rows.items())
+		)
+
+	@property
+	def scaling(self) -> Optional[pd.DataFrame]:
+		"""Returns throughput and latency of every Database type and action 
+		at every dataset size, see add_scaling.
+
+		Returns:
+			Optional[pd.DataFrame]: Records per second and p50/p99 operation 
+			latency (sec) per size, None if no sweep was run.
+		"""
+		if not self.__scaling:
+			return None
+
+		return pd.DataFrame(self.__scaling)
+
+	def add_load_results(
+		self,
+		database_type: str,
+		results: pd.DataFrame
+	) -> None:
+		"""Adds Load Generator results (throughput and latency percentiles 
+		per concurrency level).
+
+		Args:
+			database_type (str): Type of NoSQL Database.
+			results (pd.DataFrame): Load Generator results.
+		"""
+		results = results.assign(
+			database_type=database_type,
+			run_mode=self.__run_mode
+		)
+
+		self.__load_results = pd.concat(
+			[self.__load_results, results],
+			axis=0,
+			ignore_index=True
+		)
+
+	def __total_execution_times(self) -> Optional[pd.DataFrame]:
+		execution_times = self.execution_times
+
+		if execution_times is None:
+			return None
+
+		return execution_times[execution_times['phase'] == 'total']
+
+	@property
+	def phase_breakdown(self) -> Optional[pd.DataFrame]:
+		"""Returns average time spent in each phase of every action.
+
+		Returns:
+			Optional[pd.DataFrame]: Average phase times (sec) per Database 
+			type and action, None if no phase was recorded.
+		"""
+		execution_times = self.execution_times
+
+		if execution_times is None:
+			return None
+
+		phases = execution_times[execution_times['phase'] != 'total']
+
+		if phases.empty:
+			return None
+
+		return phases.pivot_table(
+			index=['database_type', 'action'],
+			columns='phase',
+			values='time',
+			aggfunc='mean'
+		).reset_index()
+
 	def __display_statistics(
 		self, 
 		database_type: str, 
 		dataset: str, 
 		action: str
 	) -> None:
+		execution_times = self.__total_execution_times()
+
 		print(
-			self.__execution_times[
-				(self.__execution_times['database_type'] == database_type) &
-				(self.__execution_times['dataset'] == dataset) &
-				(self.__execution_times['action'] == action)
+			execution_times[
+				(execution_times['database_type'] == database_type) &
+				(execution_times['dataset'] == dataset) &
+				(execution_times['action'] == action)
 			].describe().transpose(),
 			end='\n\n'
 		)
 
 	def display_statistics(self) -> None:
 		"""Displays basic statistics and distribution of execution times."""
+		if self.__load_results is not None:
+			print(self.__load_results.to_string(index=False), end='\n\n')
+
+		latency_percentiles = self.latency_percentiles
+
+		if latency_percentiles is not None:
+			print(latency_percentiles.to_string(index=False), end='\n\n')
+
+		phase_breakdown = self.phase_breakdown
+
+		if phase_breakdown is not None:
+			print(phase_breakdown.to_string(index=False), end='\n\n')
+
+		cache_summary = self.cache_summary
+
+		if cache_summary is not None:
+			print(cache_summary.to_string(index=False), end='\n\n')
+
+		confidence_intervals = self.confidence_intervals()
+
+		if confidence_intervals is not None:
+			print(confidence_intervals.to_string(index=False), end='\n\n')
+
+		scaling = self.scaling
+
+		if scaling is not None:
+			print(scaling.to_string(index=False), end='\n\n')
+
+		execution_times = self.__total_execution_times()
+
+		if execution_times is None:
+			return
+
 		for database_type in sorted(
-			list(self.__execution_times['database_type'].unique())
+			list(execution_times['database_type'].unique())
 		):
 			for dataset in sorted(
-				list(self.__execution_times['dataset'].unique())
+				list(execution_times['dataset'].unique())
 			):
 				for action in sorted(
-					list(self.__execution_times['action'].unique())
+					list(execution_times['action'].unique())
 				):
 					print(f"{database_type} {dataset.split('.')[0]} {action}")
 					self.__display_statistics(
@@ -107,9 +651,11 @@ class Statistics:
 					)
 
 	def __export_plot(self, action:str) -> None:
+		execution_times = self.__total_execution_times()
+
 		selected_data = (
-			self.__execution_times[self.__execution_times['action'] == action]
-				.groupby(['database_type', 'dataset']).mean()
+			execution_times[execution_times['action'] == action]
+				.groupby(['database_type', 'dataset'])['time'].mean()
 		).reset_index().sort_values(['dataset', 'time'], ascending=False)
 
 		fig = px.bar(
@@ -125,7 +671,8 @@ class Statistics:
 		fig.update_layout(
 			title=(
 				f'NoSQL Databases - {action.capitalize()}' 
-				f'({self.__iterations} Iterations)'
+				f'({self.__iterations} Iterations, '
+				f'{self.__run_mode.capitalize()})'
 			),
 			xaxis_title='Avg. Time (sec)',
 			yaxis_title='Dataset',
@@ -142,7 +689,7 @@ class Statistics:
 		)
 
 		if not os.path.exists(html_export_path):
-			os.mkdir(html_export_path)
+			os.makedirs(html_export_path)
 
 		fig.write_html(
 			os.path.join(
@@ -152,15 +699,300 @@ class Statistics:
 
 		fig.show()
 
+	def __export_load_plot(self) -> None:
+		selected_data = self.__load_results[
+			self.__load_results['operation'] == 'all'
+		]
+
+		fig = px.line(
+			selected_data,
+			x='concurrency',
+			y='throughput',
+			color='database_type',
+			markers=True,
+			log_x=True,
+			hover_data=['p50', 'p90', 'p99', 'max']
+		)
+
+		fig.update_layout(
+			title='NoSQL Databases - Throughput under Load',
+			xaxis_title='Concurrent Workers',
+			yaxis_title='Throughput (ops/sec)',
+			legend_title='Database Type',
+			font=dict(
+				size=18,
+			), 
+			title_x=0.5
+		)
+
+		html_export_path = os.path.join(
+			self.__export_folder_path, 'plots', 'html'
+		)
+
+		if not os.path.exists(html_export_path):
+			os.makedirs(html_export_path)
+
+		fig.write_html(
+			os.path.join(
+				html_export_path, 'NoSQL_Databases_-_Load.html'
+			)
+		)
+
+		fig.show()
+
+	def __export_throughput_plot(
+		self,
+		throughputs: pd.DataFrame,
+		action: str
+	) -> None:
+		selected_data = (
+			throughputs[throughputs['action'] == action]
+				.groupby(['database_type', 'dataset'])['records_per_sec']
+				.mean()
+		).reset_index().sort_values(
+			['dataset', 'records_per_sec'], ascending=False
+		)
+
+		fig = px.bar(
+			selected_data,
+			x='records_per_sec',
+			y='dataset',
+			color='database_type',
+			orientation='h',
+			log_x=True,
+			barmode='group',
+		)
+
+		fig.update_layout(
+			title=(
+				f'NoSQL Databases - {action.capitalize()} Throughput '
+				f'({self.__iterations} Iterations, '
+				f'{self.__run_mode.capitalize()})'
+			),
+			xaxis_title='Avg. Throughput (records/sec)',
+			yaxis_title='Dataset',
+			legend_title='Database Type',
+			font=dict(
+				size=18,
+			), 
+			title_x=0.5
+		)
+
+		html_export_path = os.path.join(
+			self.__export_folder_path, 'plots', 'html'
+		)
+
+		if not os.path.exists(html_export_path):
+			os.makedirs(html_export_path)
+
+		fig.write_html(
+			os.path.join(
+				html_export_path,
+				f'NoSQL_Databases_-_{action.capitalize()}_Throughput_'
+				f'{self.__iterations}.html'
+			)
+		)
+
+		fig.show()
+
+	def __export_scaling_plot(
+		self,
+		scaling: pd.DataFrame,
+		metric: str,
+		axis_title: str
+	) -> None:
+		fig = px.line(
+			scaling.dropna(subset=[metric]),
+			x='size',
+			y=metric,
+			color='database_type',
+			facet_col='action',
+			facet_col_wrap=3,
+			markers=True,
+			log_x=True,
+			log_y=True
+		)
+
+		fig.update_layout(
+			title=(
+				f'NoSQL Databases - {axis_title} vs. Dataset Size '
+				f'({self.__iterations} Iterations, '
+				f'{self.__run_mode.capitalize()})'
+			),
+			legend_title='Database Type',
+			font=dict(
+				size=18,
+			), 
+			title_x=0.5
+		)
+		fig.update_xaxes(title='Records per Dataset')
+		fig.update_yaxes(title=axis_title)
+
+		html_export_path = os.path.join(
+			self.__export_folder_path, 'plots', 'html'
+		)
+
+		if not os.path.exists(html_export_path):
+			os.makedirs(html_export_path)
+
+		fig.write_html(
+			os.path.join(
+				html_export_path,
+				f'NoSQL_Databases_-_Scaling_{metric}_'
+				f'{self.__iterations}.html'
+			)
+		)
+
+		fig.show()
+
+	def __export_latency_plot(
+		self,
+		latency_percentiles: pd.DataFrame,
+		action: str
+	) -> None:
+		selected_data = latency_percentiles[
+			latency_percentiles['action'] == action
+		].melt(
+			id_vars=['database_type', 'dataset'],
+			value_vars=['p50', 'p90', 'p99', 'p99.9', 'max'],
+			var_name='percentile',
+			value_name='latency'
+		)
+
+		fig = px.bar(
+			selected_data,
+			x='latency',
+			y='dataset',
+			color='database_type',
+			facet_col='percentile',
+			orientation='h',
+			log_x=True,
+			barmode='group',
+		)
+
+		fig.update_layout(
+			title=(
+				f'NoSQL Databases - {action.capitalize()} Latency ' 
+				f'({self.__iterations} Iterations, '
+				f'{self.__run_mode.capitalize()})'
+			),
+			yaxis_title='Dataset',
+			legend_title='Database Type',
+			font=dict(
+				size=18,
+			), 
+			title_x=0.5
+		)
+
+		html_export_path = os.path.join(
+			self.__export_folder_path, 'plots', 'html'
+		)
+
+		if not os.path.exists(html_export_path):
+			os.makedirs(html_export_path)
+
+		fig.write_html(
+			os.path.join(
+				html_export_path,
+				f'NoSQL_Databases_-_{action.capitalize()}_Latency_'
+				f'{self.__iterations}.html'
+			)
+		)
+
+		fig.show()
+
+	def __export_phase_plot(self, phase_breakdown: pd.DataFrame) -> None:
+		selected_data = phase_breakdown.melt(
+			id_vars=['database_type', 'action'],
+			var_name='phase',
+			value_name='time'
+		)
+
+		fig = px.bar(
+			selected_data,
+			x='time',
+			y='database_type',
+			color='phase',
+			facet_col='action',
+			orientation='h',
+			barmode='stack',
+		)
+
+		fig.update_layout(
+			title=(
+				'NoSQL Databases - Phase Breakdown '
+				f'({self.__iterations} Iterations, '
+				f'{self.__run_mode.capitalize()})'
+			),
+			yaxis_title='Database Type',
+			legend_title='Phase',
+			font=dict(
+				size=18,
+			), 
+			title_x=0.5
+		)
+
+		html_export_path = os.path.join(
+			self.__export_folder_path, 'plots', 'html'
+		)
+
+		if not os.path.exists(html_export_path):
+			os.makedirs(html_export_path)
+
+		fig.write_html(
+			os.path.join(
+				html_export_path,
+				f'NoSQL_Databases_-_Phases_{self.__iterations}.html'
+			)
+		)
+
+		fig.show()
+
 	def export_plots(self) -> None:
 		"""Exports every Execution Time Plot for each action."""
-		for action in sorted(list(self.__execution_times['action'].unique())):
+		if self.__load_results is not None:
+			self.__export_load_plot()
+
+		latency_percentiles = self.latency_percentiles
+
+		if latency_percentiles is not None:
+			for action in sorted(latency_percentiles['action'].unique()):
+				self.__export_latency_plot(latency_percentiles, action)
+
+		phase_breakdown = self.phase_breakdown
+
+		if phase_breakdown is not None:
+			self.__export_phase_plot(phase_breakdown)
+
+		throughputs = self.throughputs
+
+		if throughputs is not None:
+			for action in sorted(throughputs['action'].unique()):
+				self.__export_throughput_plot(throughputs, action)
+
+		scaling = self.scaling
+
+		if scaling is not None:
+			self.__export_scaling_plot(
+				scaling, 'records_per_sec', 'Throughput (records/sec)'
+			)
+			self.__export_scaling_plot(scaling, 'p50', 'p50 Latency (sec)')
+			self.__export_scaling_plot(scaling, 'p99', 'p99 Latency (sec)')
+
+		execution_times = self.__total_execution_times()
+
+		if execution_times is None:
+			return
+
+		for action in sorted(list(execution_times['action'].unique())):
 			self.__export_plot(action=action)
 
 	def export_data_to_csv(self) -> None:
 		"""Exports each Time DataFrame to separate CSV File."""
-		if self.__execution_times is not None:
-			self.__execution_times.to_csv(
+		execution_times = self.execution_times
+
+		if execution_times is not None:
+			execution_times.to_csv(
 				os.path.join(
 					self.__export_folder_path,
 					f'NoSQL_Databases_Execution_Times_{self.__iterations}.csv'
@@ -168,6 +1000,71 @@ class Statistics:
 				index=False
 			)
 
+		latency_percentiles = self.latency_percentiles
+
+		if latency_percentiles is not None:
+			latency_percentiles.to_csv(
+				os.path.join(
+					self.__export_folder_path,
+					f'NoSQL_Databases_Latencies_{self.__iterations}.csv'
+				),
+				index=False
+			)
+
+		throughputs = self.throughputs
+
+		if throughputs is not None:
+			throughputs.to_csv(
+				os.path.join(
+					self.__export_folder_path,
+					f'NoSQL_Databases_Throughputs_{self.__iterations}.csv'
+				),
+				index=False
+			)
+
+		confidence_intervals = self.confidence_intervals()
+
+		if confidence_intervals is not None:
+			confidence_intervals.to_csv(
+				os.path.join(
+					self.__export_folder_path,
+					'NoSQL_Databases_Confidence_Intervals_'
+					f'{self.__iterations}.csv'
+				),
+				index=False
+			)
+
+		scaling = self.scaling
+
+		if scaling is not None:
+			scaling.to_csv(
+				os.path.join(
+					self.__export_folder_path,
+					f'NoSQL_Databases_Scaling_{self.__iterations}.csv'
+				),
+				index=False
+			)
+
+		cache_summary = self.cache_summary
+
+		if cache_summary is not None:
+			cache_summary.to_csv(
+				os.path.join(
+					self.__export_folder_path,
+					f'NoSQL_Databases_Cache_{self.__iterations}.csv'
+				),
+				index=False
+			)
+
+		if self.__load_results is not None:
+			self.__load_results.to_csv(
+				os.path.join(
+					self.__export_folder_path,
+					'NoSQL_Databases_Load.csv'
+				),
+				index=False
+			)
+
 	def __call__(self) -> None:
 		"""Makes the Statistics Class callable and triggers all exports."""
 		self.export_plots()
@@ -1,84 +1,278 @@
 # SOURCE: https://towardsdatascience.com/create-a-graph-database-in-neo4j-using-python-4172d40f89c4
 
-import json
-from typing import List
+import hashlib
+import os
+from typing import Dict, Iterator, Optional
 
 import pandas as pd
 
+from utils.data_loader import iter_json_chunks
 
-def load_archive_data_to_dataframe(file_path: str, lines: int) -> pd.DataFrame:
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+ARCHIVE_FIELDS = ['id', 'title', 'authors_parsed', 'categories']
+
+ARCHIVE_TABLES = ['papers', 'authors', 'categories', 'authored', 'in_category']
+
+ARCHIVE_LIST_COLUMNS = ['cleaned_authors_list', 'category_list']
+
+
+def iter_archive_data_chunks(
+    file_path: str,
+    lines: Optional[int] = None,
+    chunk_size: Optional[int] = 10000
+) -> Iterator[pd.DataFrame]:
+    """Streams ArXive Data as DataFrame chunks with only the needed columns.
+
+    Args:
+        file_path (str): Input file path.
+        lines (Optional[int]): Number of lines to load. Loads the whole file 
+        if not set. Defaults to None.
+        chunk_size (Optional[int]): Number of lines in one chunk. Defaults 
+        to 10000.
+
+    Yields:
+        pd.DataFrame: Loaded data chunk.
+    """
+    for chunk in iter_json_chunks(
+        file_path,
+        chunk_size=chunk_size,
+        fields=ARCHIVE_FIELDS,
+        limit=lines
+    ):
+        yield pd.DataFrame.from_records(chunk, columns=ARCHIVE_FIELDS)
+
+
+def load_archive_data_to_dataframe(
+    file_path: str,
+    lines: Optional[int] = None
+) -> pd.DataFrame:
     """Loads ArXive Data to DataFrame.
 
+    Only the columns used by the Graph are kept while parsing.
+
     Args:
         file_path (str): Input file path.
-        lines (int): Number of lines to load.
+        lines (Optional[int]): Number of lines to load. Loads the whole file 
+        if not set. Defaults to None.
 
     Returns:
         pd.DataFrame: Loaded data.
     """
-    metadata  = []
-    with open(file_path, 'r') as archive_file:		
-        for index, line in enumerate(archive_file):
-            metadata.append(json.loads(line))
-            if index == lines - 1: break
-                
-    return pd.DataFrame(metadata)
+    chunks = list(iter_archive_data_chunks(file_path=file_path, lines=lines))
+
+    if not chunks:
+        return pd.DataFrame(columns=ARCHIVE_FIELDS)
+
+    return pd.concat(chunks, ignore_index=True)
 
 
-def get_author_list(line: str) -> List[str]:
-    """Cleans author DataFrame column, creating a list of authors in the row.
+def _explode_authors(authors_parsed: pd.Series) -> pd.Series:
+    # One 'First Last' name per row, indexed by the paper row.
+    authors = authors_parsed.explode().dropna()
+
+    return authors.str[1] + ' ' + authors.str[0]
+
+
+def _to_lists(values: pd.Series, index: pd.Index) -> pd.Series:
+    # Groups exploded values back into one list per paper row. Grouping by
+    # a categorical of every paper row keeps the papers without values as
+    # empty groups, which aggregate to empty lists.
+    return values.groupby(
+        pd.Categorical(values.index, categories=index), observed=False
+    ).agg(list).set_axis(index)
+
+
+def clean_archive_data(df: pd.DataFrame) -> pd.DataFrame:
+    """Cleans ArXive Data, creating author and category lists.
+
+    Author names are built with vectorized string operations on the exploded
+    author column instead of row by row.
 
     Args:
-        line (str): Author DataFrame column value.
+        df (pd.DataFrame): Loaded data.
 
     Returns:
-        List[str]: Separated Author values.
+        pd.DataFrame: Cleaned data.
     """
-    return [e[1] + ' ' + e[0] for e in line]
+    df['cleaned_authors_list'] = _to_lists(
+        _explode_authors(df['authors_parsed']), df.index
+    )
+    df['category_list'] = df['categories'].fillna('').str.split()
+
+    return df.drop(['authors_parsed', 'categories'], axis=1)
 
 
-def get_category_list(line: str) -> List[str]:
-    """Cleans category DataFrame column, creating a list of categories in the 
-    row.
+def load_and_clean_archive_data(
+    file_path: str,
+    lines: Optional[int] = None
+) -> pd.DataFrame:
+    """Loads ArXive Data to DataFrame and cleans it.
 
     Args:
-        line (str): Category DataFrame column value.
+        file_path (str): Input file path.
+        lines (Optional[int]): Number of lines to load. Loads the whole file 
+        if not set. Defaults to None.
 
     Returns:
-        List[str]: Separated Category values.
+        pd.DataFrame: Loaded and cleaned data.
     """
-    return list(line.split(" "))
+    return clean_archive_data(
+        load_archive_data_to_dataframe(file_path=file_path, lines=lines)
+    )
 
 
-def load_and_clean_archive_data(file_path: str, lines: int) -> pd.DataFrame:
-    """Loads ArXive Data to DataFrame and cleans it.
+def build_archive_tables(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Builds interned Graph tables from cleaned ArXive Data.
+
+    Authors and categories are interned once with pd.factorize (hash based,
+    no Python-level explode and drop_duplicates), relationships reference
+    them by integer ID.
+
+    Args:
+        df (pd.DataFrame): Cleaned data.
+
+    Returns:
+        Dict[str, pd.DataFrame]: 'papers' (cleaned data with 'paper_id'),
+        'authors' ('author_id', 'author'), 'categories' ('category_id',
+        'category'), 'authored' ('paper_id', 'author_id') and 'in_category'
+        ('paper_id', 'category_id') tables.
+    """
+    papers = df.reset_index(drop=True)
+    papers.insert(0, 'paper_id', papers.index)
+
+    tables = {'papers': papers}
+
+    for column, name, nodes, key, relationships in [
+        (
+            'cleaned_authors_list', 'author', 'authors', 'author_id',
+            'authored'
+        ),
+        (
+            'category_list', 'category', 'categories', 'category_id',
+            'in_category'
+        )
+    ]:
+        values = papers[column].explode().dropna()
+        codes, uniques = pd.factorize(values)
+
+        tables[nodes] = pd.DataFrame(
+            {key: range(len(uniques)), name: uniques}
+        )
+        tables[relationships] = pd.DataFrame(
+            {'paper_id': values.index.to_numpy(), key: codes}
+        ).drop_duplicates()
+
+    return tables
+
+
+def _tables_cache_folder(
+    file_path: str,
+    cache_folder: str,
+    lines: Optional[int]
+) -> str:
+    # Cache folder name changes with the source file and loaded lines.
+    file_stat = os.stat(file_path)
+    key = hashlib.sha1(
+        repr(
+            (
+                os.path.abspath(file_path),
+                file_stat.st_size,
+                file_stat.st_mtime_ns,
+                lines
+            )
+        ).encode()
+    ).hexdigest()
+
+    return os.path.join(
+        cache_folder, f'{os.path.basename(file_path)}.{key}.parquet'
+    )
+
+
+def _read_cached_tables(tables_folder: str) -> Dict[str, pd.DataFrame]:
+    # Reads Parquet tables, list columns come back as arrays.
+    tables = {
+        table: pd.read_parquet(os.path.join(tables_folder, f'{table}.parquet'))
+        for table in ARCHIVE_TABLES
+    }
+
+    for column in ARCHIVE_LIST_COLUMNS:
+        tables['papers'][column] = tables['papers'][column].map(list)
+
+    return tables
+
+
+def _write_cached_tables(
+    tables: Dict[str, pd.DataFrame],
+    tables_folder: str
+) -> None:
+    # Writes Parquet tables to a temporary folder which is renamed at once.
+    temporary_folder = f'{tables_folder}.{os.getpid()}.tmp'
+    os.makedirs(temporary_folder, exist_ok=True)
+
+    for table in ARCHIVE_TABLES:
+        tables[table].to_parquet(
+            os.path.join(temporary_folder, f'{table}.parquet'),
+            index=False
+        )
+
+    try:
+        os.replace(temporary_folder, tables_folder)
+
+    except OSError:
+        # Another process has already cached the same tables.
+        for table in ARCHIVE_TABLES:
+            os.remove(os.path.join(temporary_folder, f'{table}.parquet'))
+
+        os.rmdir(temporary_folder)
+
+
+def load_archive_tables(
+    file_path: str,
+    lines: Optional[int] = None,
+    cache_folder: Optional[str] = None
+) -> Dict[str, pd.DataFrame]:
+    """Loads ArXive Data as interned Graph tables, see build_archive_tables.
+
+    With a cache folder (and pyarrow installed), the tables are stored as
+    Parquet files on the first pass and later passes read them instead of
+    parsing and cleaning the JSON again.
 
     Args:
         file_path (str): Input file path.
-        lines (int): Number of lines to load.
+        lines (Optional[int]): Number of lines to load. Loads the whole file 
+        if not set. Defaults to None.
+        cache_folder (Optional[str]): Parquet cache folder. Uses the 
+        ARCHIVE_CACHE_FOLDER environment variable if not set, caching is 
+        disabled if it is not set either. Defaults to None.
 
     Returns:
-        pd.DataFrame: Loaded and cleaned data.
+        Dict[str, pd.DataFrame]: Interned Graph tables.
     """
-    df = load_archive_data_to_dataframe(file_path=file_path, lines=lines)
-
-    df['cleaned_authors_list'] = df['authors_parsed'].map(get_author_list)
-    df['category_list'] = df['categories'].map(get_category_list)
-
-    return df.drop(
-        [
-            'submitter', 
-            'authors', 
-            'comments', 
-            'journal-ref', 
-            'doi', 
-            'report-no', 
-            'license', 
-            'versions', 
-            'update_date', 
-            'abstract', 
-            'authors_parsed', 
-            'categories'
-        ],
-        axis=1
+    cache_folder = (
+        os.getenv('ARCHIVE_CACHE_FOLDER') if cache_folder is None
+        else cache_folder
+    )
+
+    if not cache_folder or pyarrow is None:
+        return build_archive_tables(
+            load_and_clean_archive_data(file_path=file_path, lines=lines)
+        )
+
+    tables_folder = _tables_cache_folder(file_path, cache_folder, lines)
+
+    if os.path.isdir(tables_folder):
+        return _read_cached_tables(tables_folder)
+
+    tables = build_archive_tables(
+        load_and_clean_archive_data(file_path=file_path, lines=lines)
     )
+
+    os.makedirs(cache_folder, exist_ok=True)
+    _write_cached_tables(tables, tables_folder)
+
+    return tables
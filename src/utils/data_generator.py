@@ -0,0 +1,383 @@
+import json
+import math
+import os
+import random
+import shutil
+import string
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+
+VALUE_SIZE_DISTRIBUTIONS = ['fixed', 'uniform', 'lognormal']
+
+DOCUMENT_SHAPE = {
+    'fields': 10,
+    'depth': 1,
+    'array_length': 4,
+    'value_size': 16,
+    'size_distribution': 'lognormal'
+}
+
+GRAPH_SHAPE = {
+    'authors': None,
+    'categories': 150,
+    'authors_per_paper': 3,
+    'categories_per_paper': 2,
+    'exponent': 1.1
+}
+
+
+def _shard_generator(seed: Optional[int], shard: int) -> random.Random:
+    # Every shard has its own generator, so the output does not depend on
+    # the number of workers.
+    return random.Random(None if seed is None else f'{seed}:{shard}')
+
+
+def _value_size(generator: random.Random, shape: Dict[str, Any]) -> int:
+    # Draws length of a string value around the mean value size.
+    if shape['size_distribution'] == 'fixed':
+        return shape['value_size']
+
+    if shape['size_distribution'] == 'uniform':
+        return generator.randint(1, 2 * shape['value_size'] - 1)
+
+    sigma = 1.0
+    mu = math.log(shape['value_size']) - sigma ** 2 / 2
+
+    return max(1, int(generator.lognormvariate(mu, sigma)))
+
+
+def _string(generator: random.Random, size: int) -> str:
+    # Random ASCII string of given size.
+    return ''.join(generator.choices(string.ascii_letters, k=size))
+
+
+def _value(
+    generator: random.Random,
+    field: int,
+    depth: int,
+    shape: Dict[str, Any]
+) -> Any:
+    # Field types rotate, so every Document has the same schema.
+    kind = field % 6
+
+    if kind == 0:
+        return generator.randint(0, 2 ** 31)
+
+    if kind == 1:
+        return generator.random() * 1000
+
+    if kind == 2:
+        return generator.random() < 0.5
+
+    if kind == 3:
+        return [
+            _string(generator, _value_size(generator, shape))
+            for _ in range(generator.randint(0, 2 * shape['array_length']))
+        ]
+
+    if kind == 4 and depth > 1:
+        return _fields(
+            generator, max(1, shape['fields'] // 2), depth - 1, shape
+        )
+
+    return _string(generator, _value_size(generator, shape))
+
+
+def _fields(
+    generator: random.Random,
+    fields: int,
+    depth: int,
+    shape: Dict[str, Any]
+) -> Dict[str, Any]:
+    # Nested object with generated fields.
+    return {
+        f'field_{field}': _value(generator, field, depth, shape)
+        for field in range(fields)
+    }
+
+
+def generate_documents(
+    start: int,
+    count: int,
+    seed: Optional[int] = None,
+    shard: Optional[int] = 0,
+    **shape: Any
+) -> Iterator[Dict[str, Any]]:
+    """Streams synthetic Documents.
+
+    Every Document has a unique 'id' and the 'name' and 'address' strings
+    used by the update workloads, next to the generated fields.
+
+    Args:
+        start (int): 'id' of the first Document.
+        count (int): Number of Documents.
+        seed (Optional[int]): Random seed, output is random if not set.
+        Defaults to None.
+        shard (Optional[int]): Shard number mixed into the seed. Defaults
+        to 0.
+        **shape (Any): Document shape, see DOCUMENT_SHAPE: 'fields' (number
+        of generated fields), 'depth' (nesting depth of object fields),
+        'array_length' (mean array length), 'value_size' (mean string
+        length) and 'size_distribution' ('fixed', 'uniform' or
+        'lognormal').
+
+    Raises:
+        ValueError: Size distribution is unknown.
+
+    Yields:
+        Dict[str, Any]: Generated Document.
+    """
+    shape = DOCUMENT_SHAPE | shape
+
+    if shape['size_distribution'] not in VALUE_SIZE_DISTRIBUTIONS:
+        raise ValueError(
+            f"Unknown size distribution: {shape['size_distribution']}"
+        )
+
+    generator = _shard_generator(seed, shard)
+
+    for index in range(start, start + count):
+        yield {
+            'id': index,
+            'name': _string(generator, _value_size(generator, shape)),
+            'address': _string(generator, _value_size(generator, shape))
+        } | _fields(generator, shape['fields'], shape['depth'], shape)
+
+
+def _power_law_rank(
+    generator: random.Random,
+    count: int,
+    exponent: float
+) -> int:
+    # Draws rank in [0, count) with probability decaying as a power law of
+    # the rank, by inverting the continuous power-law distribution.
+    if exponent == 1:
+        rank = (count + 1) ** generator.random()
+
+    else:
+        rank = (
+            ((count + 1) ** (1 - exponent) - 1) * generator.random() + 1
+        ) ** (1 / (1 - exponent))
+
+    return min(int(rank), count) - 1
+
+
+def _distinct_ranks(
+    generator: random.Random,
+    count: int,
+    exponent: float,
+    mean: int
+) -> List[int]:
+    # Draws 1 + geometric number of distinct power-law ranks.
+    size = 1
+
+    while size < count and generator.random() > 1 / mean:
+        size += 1
+
+    ranks = set()
+
+    while len(ranks) < size:
+        ranks.add(_power_law_rank(generator, count, exponent))
+
+    return sorted(ranks)
+
+
+def generate_papers(
+    start: int,
+    count: int,
+    seed: Optional[int] = None,
+    shard: Optional[int] = 0,
+    **shape: Any
+) -> Iterator[Dict[str, Any]]:
+    """Streams synthetic arXiv papers for the Neo4j Graph.
+
+    Authors and categories are drawn with power-law popularity, so author
+    and category degrees follow a power law like in the arXiv dump.
+
+    Args:
+        start (int): Number of the first paper.
+        count (int): Number of papers.
+        seed (Optional[int]): Random seed, output is random if not set.
+        Defaults to None.
+        shard (Optional[int]): Shard number mixed into the seed. Defaults
+        to 0.
+        **shape (Any): Graph shape, see GRAPH_SHAPE: 'authors' (author
+        pool, half the number of papers if not set), 'categories'
+        (category pool), 'authors_per_paper' and 'categories_per_paper'
+        (means) and 'exponent' (power-law exponent). 'papers' (total
+        number of papers) sizes the default author pool.
+
+    Yields:
+        Dict[str, Any]: Paper in the arXiv format ('id', 'title',
+        'authors_parsed' and 'categories').
+    """
+    shape = GRAPH_SHAPE | shape
+    authors = shape['authors'] or max(1, shape.get('papers', count) // 2)
+    generator = _shard_generator(seed, shard)
+
+    for index in range(start, start + count):
+        yield {
+            'id': f'synthetic.{index:08d}',
+            'title': _string(generator, 64),
+            'authors_parsed': [
+                [f'Author{rank}', f'First{rank}', '']
+                for rank in _distinct_ranks(
+                    generator,
+                    authors,
+                    shape['exponent'],
+                    shape['authors_per_paper']
+                )
+            ],
+            'categories': ' '.join(
+                f'synthetic.C{rank}'
+                for rank in _distinct_ranks(
+                    generator,
+                    shape['categories'],
+                    shape['exponent'],
+                    shape['categories_per_paper']
+                )
+            )
+        }
+
+
+GENERATORS = {
+    'documents': generate_documents,
+    'papers': generate_papers
+}
+
+
+def _write_shard(
+    kind: str,
+    part_path: str,
+    start: int,
+    count: int,
+    seed: Optional[int],
+    shard: int,
+    shape: Dict[str, Any]
+) -> str:
+    # Writes one shard as line-delimited JSON part file.
+    with open(part_path, 'w', encoding='utf-8') as part_file:
+        for record in GENERATORS[kind](start, count, seed, shard, **shape):
+            part_file.write(json.dumps(record) + '\n')
+
+    return part_path
+
+
+def write_synthetic_data(
+    output_path: str,
+    records: int,
+    kind: Optional[str] = 'documents',
+    seed: Optional[int] = 0,
+    workers: Optional[int] = None,
+    shard_size: Optional[int] = 100000,
+    **shape: Any
+) -> str:
+    """Writes synthetic line-delimited JSON File, shards are generated in
+    parallel worker processes and appended in order.
+
+    The output only depends on the seed, the shard size and the shape, not
+    on the number of workers.
+
+    Args:
+        output_path (str): Output file path.
+        records (int): Number of records.
+        kind (Optional[str]): 'documents' (see generate_documents) or
+        'papers' (see generate_papers). Defaults to 'documents'.
+        seed (Optional[int]): Random seed. Defaults to 0.
+        workers (Optional[int]): Number of worker processes. Defaults to the
+        number of CPUs.
+        shard_size (Optional[int]): Records generated by one task. Defaults
+        to 100000.
+        **shape (Any): Document or Graph shape.
+
+    Raises:
+        ValueError: Kind is unknown.
+
+    Returns:
+        str: Output file path.
+    """
+    if kind not in GENERATORS:
+        raise ValueError(f'Unknown synthetic data kind: {kind}')
+
+    shape = ({'papers': records} | shape) if kind == 'papers' else shape
+    starts = range(0, records, shard_size)
+    temporary_path = f'{output_path}.{os.getpid()}.tmp'
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        part_paths = executor.map(
+            _write_shard,
+            [kind] * len(starts),
+            [f'{temporary_path}.{shard}' for shard in range(len(starts))],
+            starts,
+            [min(shard_size, records - start) for start in starts],
+            [seed] * len(starts),
+            range(len(starts)),
+            [shape] * len(starts)
+        )
+
+        try:
+            with open(temporary_path, 'wb') as output_file:
+                for part_path in part_paths:
+                    with open(part_path, 'rb') as part_file:
+                        shutil.copyfileobj(part_file, output_file)
+
+                    os.remove(part_path)
+
+            os.replace(temporary_path, output_path)
+
+        finally:
+            for shard in range(len(starts)):
+                if os.path.exists(f'{temporary_path}.{shard}'):
+                    os.remove(f'{temporary_path}.{shard}')
+
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    return output_path
+
+
+def write_synthetic_folder(
+    output_folder: str,
+    records: int,
+    seed: Optional[int] = 0,
+    workers: Optional[int] = None,
+    **shape: Any
+) -> str:
+    """Writes synthetic Data Folder in the layout the DAOs read: a 'data'
+    dataset in json_data and an arXiv-like dump in archive. Existing Files
+    are reused.
+
+    Args:
+        output_folder (str): Output Folder Path.
+        records (int): Number of records in every File.
+        seed (Optional[int]): Random seed. Defaults to 0.
+        workers (Optional[int]): Number of worker processes. Defaults to the
+        number of CPUs.
+        **shape (Any): Document shape, see generate_documents.
+
+    Returns:
+        str: Output Folder Path.
+    """
+    files = {
+        'documents': os.path.join(output_folder, 'json_data', 'data.json'),
+        'papers': os.path.join(
+            output_folder, 'archive', 'arxiv-metadata-oai-snapshot.json'
+        )
+    }
+
+    for kind, output_path in files.items():
+        if os.path.exists(output_path):
+            continue
+
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        write_synthetic_data(
+            output_path,
+            records,
+            kind=kind,
+            seed=seed,
+            workers=workers,
+            **(shape if kind == 'documents' else {})
+        )
+
+    return output_folder
@@ -0,0 +1,283 @@
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Callable, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+JSON_BACKENDS = {
+    'json': json.loads,
+    'orjson': None if orjson is None else orjson.loads,
+    'ujson': None if ujson is None else ujson.loads
+}
+
+
+def get_json_loads(backend: Optional[str] = None) -> Callable[[str], Any]:
+    """Returns JSON parsing function of the selected backend.
+
+    Args:
+        backend (Optional[str]): JSON backend ('orjson', 'ujson' or 'json').
+        Uses the JSON_BACKEND environment variable, or the fastest installed
+        backend if it is not set either. Defaults to None.
+
+    Raises:
+        ValueError: Selected backend is unknown or not installed.
+
+    Returns:
+        Callable[[str], Any]: JSON parsing function.
+    """
+    backend = os.getenv('JSON_BACKEND') if backend is None else backend
+
+    if backend is None:
+        for backend in ['orjson', 'ujson', 'json']:
+            if JSON_BACKENDS[backend] is not None:
+                return JSON_BACKENDS[backend]
+
+    if JSON_BACKENDS.get(backend) is None:
+        raise ValueError(f'JSON backend not available: {backend}')
+
+    return JSON_BACKENDS[backend]
+
+
+def _parse_json_chunks(
+    file_path: str,
+    chunk_size: int,
+    fields: Optional[List[str]],
+    limit: Optional[int],
+    loads: Callable[[str], Any]
+) -> Iterator[List[dict]]:
+    # Parses line-delimited JSON File chunk by chunk, blank lines are
+    # skipped and do not count towards the limit.
+    chunk = []
+    records = 0
+
+    with open(file_path, 'rb') as json_file:
+        for line in json_file:
+            if limit is not None and records == limit:
+                break
+
+            if not line.strip():
+                continue
+
+            records += 1
+            record = loads(line)
+
+            if fields is not None:
+                record = {field: record.get(field) for field in fields}
+
+            chunk.append(record)
+
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _cache_path(
+    file_path: str,
+    cache_folder: str,
+    chunk_size: int,
+    fields: Optional[List[str]],
+    limit: Optional[int]
+) -> str:
+    # Cache file name changes with the source file and loading options.
+    file_stat = os.stat(file_path)
+    key = hashlib.sha1(
+        repr(
+            (
+                os.path.abspath(file_path),
+                file_stat.st_size,
+                file_stat.st_mtime_ns,
+                chunk_size,
+                fields,
+                limit
+            )
+        ).encode()
+    ).hexdigest()
+
+    return os.path.join(
+        cache_folder, f'{os.path.basename(file_path)}.{key}.pickle'
+    )
+
+
+def _read_cached_chunks(cache_path: str) -> Iterator[List[dict]]:
+    # Streams chunks pickled one after another in the cache file.
+    with open(cache_path, 'rb') as cache_file:
+        while True:
+            try:
+                yield pickle.load(cache_file)
+
+            except EOFError:
+                return
+
+
+def iter_json_chunks(
+    file_path: str,
+    chunk_size: Optional[int] = 1000,
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    backend: Optional[str] = None,
+    cache_folder: Optional[str] = None
+) -> Iterator[List[dict]]:
+    """Streams line-delimited JSON File as fixed-size chunks of records.
+
+    Only one chunk is held in memory at a time, so memory use is bounded by
+    the chunk size regardless of the file size. With a cache folder, parsed
+    chunks are stored in a binary (pickle) cache on the first pass and
+    later passes read the cache instead of parsing the JSON again.
+
+    Args:
+        file_path (str): Input file path.
+        chunk_size (Optional[int]): Maximum number of records in one chunk.
+        Defaults to 1000.
+        fields (Optional[List[str]]): Fields kept in every record, other
+        fields are dropped right after parsing. Keeps every field if not
+        set. Defaults to None.
+        limit (Optional[int]): Maximum number of records read. Reads the
+        whole file if not set. Defaults to None.
+        backend (Optional[str]): JSON backend, see get_json_loads. Defaults
+        to None.
+        cache_folder (Optional[str]): Binary cache folder. Uses the
+        JSON_CACHE_FOLDER environment variable if not set, caching is
+        disabled if it is not set either. Defaults to None.
+
+    Yields:
+        List[dict]: Chunk of parsed records.
+    """
+    cache_folder = (
+        os.getenv('JSON_CACHE_FOLDER') if cache_folder is None
+        else cache_folder
+    )
+    chunks = _parse_json_chunks(
+        file_path, chunk_size, fields, limit, get_json_loads(backend)
+    )
+
+    if not cache_folder:
+        yield from chunks
+        return
+
+    cache_path = _cache_path(
+        file_path, cache_folder, chunk_size, fields, limit
+    )
+
+    if os.path.exists(cache_path):
+        yield from _read_cached_chunks(cache_path)
+        return
+
+    os.makedirs(cache_folder, exist_ok=True)
+    temporary_path = f'{cache_path}.{os.getpid()}.tmp'
+
+    try:
+        with open(temporary_path, 'wb') as cache_file:
+            for chunk in chunks:
+                pickle.dump(chunk, cache_file, pickle.HIGHEST_PROTOCOL)
+                yield chunk
+
+        os.replace(temporary_path, cache_path)
+
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
+
+def write_json_sample(
+    file_path: str,
+    output_path: str,
+    records: int,
+    backend: Optional[str] = None
+) -> None:
+    """Writes line-delimited JSON File with an exact number of records.
+
+    The first records of the input are copied as they are. Smaller inputs
+    are repeated, repeated records get a unique 'id' (suffixed with the
+    copy number) and lose their '_id', so every record is inserted as a new
+    Document. The input is streamed, so any size can be written.
+
+    Args:
+        file_path (str): Input file path.
+        output_path (str): Output file path.
+        records (int): Number of written records.
+        backend (Optional[str]): JSON backend, see get_json_loads. Defaults
+        to None.
+
+    Raises:
+        ValueError: Input file has no records.
+    """
+    loads = get_json_loads(backend)
+    written = 0
+    copy = 0
+
+    with open(output_path, 'wb') as output_file:
+        while written < records:
+            with open(file_path, 'rb') as json_file:
+                for line in json_file:
+                    if written == records:
+                        break
+
+                    if not line.strip():
+                        continue
+
+                    if copy > 0:
+                        record = loads(line)
+                        record.pop('_id', None)
+                        record['id'] = f"{record.get('id', written)}_{copy}"
+                        line = json.dumps(record, default=str).encode()
+
+                    output_file.write(line.rstrip(b'\r\n') + b'\n')
+                    written += 1
+
+            if written == 0:
+                raise ValueError(f'No records in {file_path}')
+
+            copy += 1
+
+
+def write_sample_folder(
+    data_folder: str,
+    output_folder: str,
+    records: int
+) -> str:
+    """Writes every File of Data Folder with an exact number of records, see
+    write_json_sample. Existing samples are reused.
+
+    Args:
+        data_folder (str): Data Folder Path.
+        output_folder (str): Output Folder Path.
+        records (int): Number of records in every File.
+
+    Returns:
+        str: Output Folder Path.
+    """
+    os.makedirs(output_folder, exist_ok=True)
+
+    for file in sorted(os.listdir(data_folder)):
+        output_path = os.path.join(output_folder, file)
+
+        if os.path.exists(output_path):
+            continue
+
+        temporary_path = f'{output_path}.{os.getpid()}.tmp'
+
+        try:
+            write_json_sample(
+                os.path.join(data_folder, file), temporary_path, records
+            )
+            os.replace(temporary_path, output_path)
+
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    return output_folder
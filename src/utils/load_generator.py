@@ -0,0 +1,231 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class LoadGenerator:
+
+    """Represents Concurrent Client Load Generator."""
+
+    def __init__(
+        self,
+        operations: Dict[str, Callable[[], Any]],
+        mix: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None
+    ) -> None:
+        """Initializes the LoadGenerator Class.
+
+        Args:
+            operations (Dict[str, Callable[[], Any]]): Operation names mapped
+            to callables executing one operation against the Database.
+            mix (Optional[Dict[str, float]]): Operation names mapped to their
+            relative weights. Every operation has the same weight if not set.
+            Defaults to None.
+            seed (Optional[int]): Random seed of the operation choice.
+            Defaults to None.
+        """
+        mix = {name: 1.0 for name in operations} if mix is None else mix
+
+        self.__operations: Dict[str, Callable[[], Any]] = operations
+        self.__names: List[str] = list(mix)
+        self.__weights: List[float] = [mix[name] for name in self.__names]
+        self.__seed: Optional[int] = seed
+
+    def __work(
+        self,
+        worker: int,
+        operations: Optional[int],
+        duration: Optional[float],
+        warmup: int,
+        started: threading.Barrier,
+        clock: Dict[str, float]
+    ) -> List[Tuple[str, float]]:
+        # Executes randomly chosen operations and measures their latency.
+        # Warm-up operations run first and are not measured, measuring
+        # starts once every worker is warmed up.
+        generator = random.Random(
+            None if self.__seed is None else self.__seed + worker
+        )
+        latencies = []
+
+        try:
+            for name in generator.choices(
+                self.__names, weights=self.__weights, k=warmup
+            ):
+                self.__operations[name]()
+
+        except BaseException:
+            # Releases the workers waiting at the barrier, which would
+            # otherwise wait for this worker forever.
+            started.abort()
+            raise
+
+        started.wait()
+
+        deadline = None if duration is None else clock['start'] + duration
+        names = (
+            iter(
+                lambda: generator.choices(
+                    self.__names, weights=self.__weights
+                )[0],
+                None
+            )
+            if operations is None
+            else generator.choices(
+                self.__names, weights=self.__weights, k=operations
+            )
+        )
+
+        for name in names:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+            start_time = time.perf_counter()
+            self.__operations[name]()
+            latencies.append((name, time.perf_counter() - start_time))
+
+        return latencies
+
+    def run(
+        self,
+        concurrency: int,
+        operations: Optional[int] = None,
+        duration: Optional[float] = None,
+        warmup: Optional[int] = 0
+    ) -> pd.DataFrame:
+        """Runs the operation mix with concurrent workers.
+
+        Args:
+            concurrency (int): Number of concurrent workers.
+            operations (Optional[int]): Number of operations executed by each
+            worker, unbounded if not set. Defaults to None.
+            duration (Optional[float]): Seconds after which workers stop,
+            unbounded if not set. Defaults to None.
+            warmup (Optional[int]): Number of unmeasured operations executed
+            by each worker before the measured ones. Defaults to 0.
+
+        Raises:
+            ValueError: Neither operation count nor duration is set.
+            Exception: Error raised by an operation of any worker.
+
+        Returns:
+            pd.DataFrame: Throughput (ops/sec) and latency percentiles (sec)
+            for every operation and for the whole mix ('all').
+        """
+        if operations is None and duration is None:
+            raise ValueError('Operation count or duration expected')
+
+        clock = {}
+        started = threading.Barrier(
+            concurrency,
+            action=lambda: clock.update(start=time.perf_counter())
+        )
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(
+                    self.__work,
+                    worker,
+                    operations,
+                    duration,
+                    warmup,
+                    started,
+                    clock
+                )
+                for worker in range(concurrency)
+            ]
+
+        # A failed warm-up breaks the barrier of the other workers, its own
+        # error is raised instead of theirs.
+        errors = [
+            error for error in (future.exception() for future in futures)
+            if error is not None
+        ]
+
+        for error in errors:
+            if not isinstance(error, threading.BrokenBarrierError):
+                raise error
+
+        if errors:
+            raise errors[0]
+
+        results = [future.result() for future in futures]
+
+        elapsed = time.perf_counter() - clock['start']
+
+        latencies = pd.DataFrame(
+            [sample for result in results for sample in result],
+            columns=['operation', 'latency']
+        )
+
+        rows = []
+
+        for name, samples in [('all', latencies)] + list(
+            latencies.groupby('operation')
+        ):
+            values = samples['latency'].to_numpy()
+
+            # No operation may finish within a short duration.
+            p50, p90, p99, mean, maximum = (
+                [np.nan] * 5 if len(values) == 0
+                else [
+                    *np.percentile(values, [50, 90, 99]),
+                    values.mean(),
+                    values.max()
+                ]
+            )
+
+            rows.append(
+                {
+                    'concurrency': concurrency,
+                    'operation': name,
+                    'operations': len(values),
+                    'throughput': len(values) / elapsed,
+                    'mean': mean,
+                    'p50': p50,
+                    'p90': p90,
+                    'p99': p99,
+                    'max': maximum
+                }
+            )
+
+        return pd.DataFrame(rows)
+
+    def __call__(
+        self,
+        concurrency_levels: List[int],
+        operations: Optional[int] = None,
+        duration: Optional[float] = None,
+        warmup: Optional[int] = 0
+    ) -> pd.DataFrame:
+        """Runs the operation mix for every concurrency level.
+
+        Args:
+            concurrency_levels (List[int]): Numbers of concurrent workers.
+            operations (Optional[int]): Number of operations executed by each
+            worker, see run. Defaults to None.
+            duration (Optional[float]): Seconds after which workers stop, see
+            run. Defaults to None.
+            warmup (Optional[int]): Number of unmeasured operations executed
+            by each worker. Defaults to 0.
+
+        Returns:
+            pd.DataFrame: Results of every concurrency level.
+        """
+        return pd.concat(
+            [
+                self.run(
+                    concurrency=concurrency,
+                    operations=operations,
+                    duration=duration,
+                    warmup=warmup
+                )
+                for concurrency in concurrency_levels
+            ],
+            ignore_index=True
+        )
@@ -0,0 +1,168 @@
+"""YAML workload scenarios run by utils.run_scenario.
+
+Scenarios run against the document stores (CouchDB, MongoDB and Redis),
+which all hold the same JSON datasets, so one mix of reads, inserts and
+updates over named datasets means the same work on each of them. Neo4j is
+excluded: it holds the arXiv Graph instead of the JSON datasets and only
+supports its own Cypher read and update workloads, so a dataset mix has no
+equivalent there. Concurrent Neo4j load is run by utils.run_load.
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+
+SCENARIO_DATABASES = ['CouchDB', 'MongoDB', 'Redis']
+SCENARIO_OPERATIONS = ['read', 'insert', 'update']
+KEY_DISTRIBUTIONS = ['uniform', 'zipfian']
+
+SCENARIO_DEFAULTS = {
+    'name': 'scenario',
+    'databases': SCENARIO_DATABASES,
+    'data_folder': None,
+    'datasets': None,
+    'iterations': 1,
+    'mix': None,
+    'read_write_ratio': None,
+    'distribution': 'uniform',
+    'zipf_exponent': 0.99,
+    'concurrency': [1],
+    'operations': None,
+    'duration': None,
+    'warmup': 0,
+    'update': {'key': 'address', 'value': 'Scenario_{iteration}'},
+    'insert': {'name': 'Scenario', 'address': 'Scenario'},
+    'seed': None
+}
+
+
+def load_scenario(file_path: str, data_folder: str) -> Dict[str, Any]:
+    """Loads and validates a YAML workload specification.
+
+    A scenario names the Databases it runs against, the datasets (files of
+    the data folder, every file if not set), the operation mix ('mix', or
+    'read_write_ratio' split evenly between inserts and updates), the
+    distribution of operations over datasets ('uniform' or 'zipfian' with
+    'zipf_exponent', the first dataset being the hottest), the concurrency
+    levels, the operation count per worker and/or the duration in seconds,
+    and the number of unmeasured warm-up operations per worker. Missing
+    options fall back to SCENARIO_DEFAULTS.
+
+    Args:
+        file_path (str): YAML File Path.
+        data_folder (str): Data Folder used if the scenario names none.
+
+    Raises:
+        ValueError: Scenario is invalid.
+
+    Returns:
+        Dict[str, Any]: Scenario with defaults filled in.
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        scenario = SCENARIO_DEFAULTS | (yaml.safe_load(file) or {})
+
+    unknown = set(scenario) - set(SCENARIO_DEFAULTS)
+
+    if unknown:
+        raise ValueError(f'Unknown scenario options: {sorted(unknown)}')
+
+    for database in scenario['databases']:
+        if database not in SCENARIO_DATABASES:
+            raise ValueError(f'Unsupported Database Type: {database}')
+
+    if scenario['distribution'] not in KEY_DISTRIBUTIONS:
+        raise ValueError(
+            f"Unknown key distribution: {scenario['distribution']}"
+        )
+
+    if scenario['data_folder'] is None:
+        scenario['data_folder'] = data_folder
+
+    if scenario['operations'] is None and scenario['duration'] is None:
+        raise ValueError('Operation count or duration expected')
+
+    if scenario['mix'] is None:
+        ratio = (
+            0.8 if scenario['read_write_ratio'] is None
+            else scenario['read_write_ratio']
+        )
+        scenario['mix'] = {
+            'read': ratio,
+            'insert': (1 - ratio) / 2,
+            'update': (1 - ratio) / 2
+        }
+
+    for operation in scenario['mix']:
+        if operation not in SCENARIO_OPERATIONS:
+            raise ValueError(f'Unknown operation: {operation}')
+
+    if scenario['datasets'] is None:
+        scenario['datasets'] = [
+            file.split('.')[0]
+            for file in sorted(os.listdir(scenario['data_folder']))
+        ]
+
+    if isinstance(scenario['concurrency'], int):
+        scenario['concurrency'] = [scenario['concurrency']]
+
+    return scenario
+
+
+def key_weights(
+    keys: List[str],
+    distribution: Optional[str] = 'uniform',
+    exponent: Optional[float] = 0.99
+) -> Dict[str, float]:
+    """Returns relative access weights of keys.
+
+    Args:
+        keys (List[str]): Keys, ordered from the hottest to the coldest.
+        distribution (Optional[str]): 'uniform' or 'zipfian'. Defaults to
+        'uniform'.
+        exponent (Optional[float]): Zipfian exponent, higher values skew
+        accesses towards the first keys. Defaults to 0.99.
+
+    Raises:
+        ValueError: Distribution is unknown.
+
+    Returns:
+        Dict[str, float]: Keys mapped to weights summing up to 1.
+    """
+    if distribution == 'uniform':
+        weights = [1.0] * len(keys)
+
+    elif distribution == 'zipfian':
+        weights = [1 / rank ** exponent for rank in range(1, len(keys) + 1)]
+
+    else:
+        raise ValueError(f'Unknown key distribution: {distribution}')
+
+    total = sum(weights)
+
+    return {key: weight / total for key, weight in zip(keys, weights)}
+
+
+def scenario_mix(scenario: Dict[str, Any]) -> Dict[str, float]:
+    """Returns weights of every operation on every dataset, named
+    '<operation>:<dataset>', see LoadGenerator.
+
+    Args:
+        scenario (Dict[str, Any]): Scenario, see load_scenario.
+
+    Returns:
+        Dict[str, float]: Operation names mapped to their weights.
+    """
+    weights = key_weights(
+        scenario['datasets'],
+        scenario['distribution'],
+        scenario['zipf_exponent']
+    )
+
+    return {
+        f'{operation}:{dataset}': share * weight
+        for operation, share in scenario['mix'].items()
+        for dataset, weight in weights.items()
+        if share > 0
+    }
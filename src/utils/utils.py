@@ -1,36 +1,140 @@
+import asyncio
 import os
-from typing import Optional
+import random
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import pandas as pd
+
+from dao.async_couchdb_dao import AsyncCouchDbDAO
+from dao.async_dao import AsyncDAO
+from dao.async_mongo_db_dao import AsyncMongoDbDAO
+from dao.async_redis_dao import AsyncRedisDAO
+from dao.cached_dao import CachedDAO
 from dao.couchdb_dao import CouchDbDAO
+from dao.dao import DAO
 from dao.mongo_db_dao import MongoDbDAO
 from dao.neo4j_dao import Neo4jDAO
 from dao.redis_dao import RedisDAO
+from stats.latency_histogram import LatencyHistogram
 from stats.statistics import Statistics
+from utils.data_generator import write_synthetic_folder
+from utils.data_loader import write_sample_folder
+from utils.load_generator import LoadGenerator
+from utils.scenario import load_scenario, scenario_mix
+
+
+def data_folder(name: str) -> str:
+	"""Returns path of a Data Folder.
+
+	Args:
+		name (str): Name of the Data Folder ('json_data' or 'archive').
+
+	Returns:
+		str: Data Folder Path inside DATA_FOLDER (environment), defaults to 
+		'data' in the working directory.
+	"""
+	return os.path.join(
+		os.getenv('DATA_FOLDER') or os.path.join(os.getcwd(), 'data'), name
+	)
+
+
+def archive_lines() -> Optional[int]:
+	"""Returns number of loaded arXiv records.
+
+	Returns:
+		Optional[int]: ARCHIVE_LINES (environment), 100000 if not set. None 
+		(the whole snapshot) if set to 0 or 'all'.
+	"""
+	lines = os.getenv('ARCHIVE_LINES') or '100000'
+
+	if lines.lower() == 'all' or int(lines) == 0:
+		return None
+
+	return int(lines)
+
+
+def benchmark_iterations(
+	statistics: Statistics,
+	daos: List[DAO],
+	iterations: int
+) -> Iterator[int]:
+	"""Yields iteration numbers of a benchmark loop.
+
+	The first WARMUP_ITERATIONS iterations (environment, defaults to 0) run 
+	with the instrumentation of the DAOs switched off, so cold caches, 
+	connection setup and Database creation are not recorded. They come on 
+	top of the measured iterations. If TARGET_PRECISION is set (e.g. 0.05), 
+	the loop stops early once the confidence interval of every action timed 
+	since the warm-up is that precise, see Statistics.converged.
+
+	Args:
+		statistics (Statistics): Database Testing Statistics Object.
+		daos (List[DAO]): DAOs timed in the loop.
+		iterations (int): Maximal number of measured iterations.
+
+	Yields:
+		int: Iteration number.
+	"""
+	warmup = int(os.getenv('WARMUP_ITERATIONS') or 0)
+	precision = os.getenv('TARGET_PRECISION')
+	instrumentation = [dao.instrumentation for dao in daos]
+
+	for dao in daos:
+		dao.instrumentation = False
+
+	yield from range(warmup)
+
+	for dao, enabled in zip(daos, instrumentation):
+		dao.instrumentation = enabled
+
+	since = statistics.sample_count
+
+	for iteration in range(warmup, warmup + iterations):
+		yield iteration
+
+		if precision and statistics.converged(float(precision), since=since):
+			print(f'Converged after {iteration - warmup + 1} iterations')
+			return
 
 
 def run_couchdb(
 	statistics: Statistics,
-	iterations: Optional[int] = 10
+	iterations: Optional[int] = 10,
+	bulk: Optional[bool] = True
 ) -> None:
 	"""Run basic CouchDB DAO Functionalities.
 
 	Args:
 		statistics (Statistics): Database Testing Statistics Object.
 		iterations (Optional[int]): Number of repetition. Defaults to 10.
+		bulk (Optional[bool]): Additionally populate the Database with 
+		_bulk_docs batches in every iteration, so both insert paths are 
+		compared in the same run. Its Database resets are not recorded, so 
+		CouchDB is not reported with twice as many deletes as the other 
+		Databases. Defaults to True.
 	"""
 	couchdb_dao = CouchDbDAO(statistics)
+	reset_dao = (
+		CouchDbDAO(statistics, instrumentation=False) if bulk else None
+	)
 
-	counchdb_path = os.path.join(os.getcwd(), 'data', 'json_data')
+	counchdb_path = data_folder('json_data')
 	collections = sorted(os.listdir(counchdb_path))
 
-	for iteration in range(iterations):
+	for iteration in benchmark_iterations(
+		statistics, [couchdb_dao], iterations
+	):
 		couchdb_dao.populate_database(data_folder=counchdb_path)
 
 		for collection in collections:
 			print(collection.split('.')[0])
 			couchdb_dao.read_data(
 				database=os.getenv('DB_NAME'),
-				collection=collection.split('.')[0]
+				collection=collection.split('.')[0],
+				sink='null'
 			)
 
 			if collection == 'data.json':
@@ -48,40 +152,108 @@ def run_couchdb(
 				collection=collection.split('.')[0]
 			)
 
+		if bulk:
+			couchdb_dao.populate_database(
+				data_folder=counchdb_path,
+				bulk=True
+			)
+
+			for collection in collections:
+				reset_dao.delete_data(
+					database=os.getenv('DB_NAME'),
+					collection=collection.split('.')[0]
+				)
+
 	couchdb_dao.close_connection()
 
+	if reset_dao is not None:
+		reset_dao.close_connection()
+
 
 def run_mongodb(
 	statistics: Statistics,
-	iterations: Optional[int] = 10
+	iterations: Optional[int] = 10,
+	write_concern: Optional[Dict[str, Any]] = None,
+	ordered: Optional[bool] = True,
+	read: Optional[bool] = True,
+	bulk_write_samples: Optional[int] = 1000
 ) -> None:
 	"""Run basic MongoDB DAO Functionalities.
 
 	Args:
 		statistics (Statistics): Database Testing Statistics Object.
 		iterations (Optional[int]): Number of repetition. Defaults to 10.
+		write_concern (Optional[Dict[str, Any]]): Write concern options ('w' 
+		and 'j'), see MongoDbDAO. Defaults to None.
+		ordered (Optional[bool]): Send batch writes ordered. Defaults to 
+		True.
+		read (Optional[bool]): Run the read workload and the selective query 
+		and update workloads (with and without secondary indexes, recorded as 
+		'MongoDB (No Index)'). Reads do not depend on the write concern. 
+		Defaults to True.
+		bulk_write_samples (Optional[int]): Number of Documents sampled for 
+		the mixed bulk_write workload. Defaults to 1000.
 	"""
-	mongodb_dao = MongoDbDAO(statistics)
+	mongodb_dao = MongoDbDAO(
+		statistics,
+		write_concern=write_concern,
+		ordered=ordered
+	)
 
-	mongodb_path = os.path.join(os.getcwd(), 'data', 'json_data')
+	mongodb_path = data_folder('json_data')
 	collections = sorted(os.listdir(mongodb_path))
 
-	for iteration in range(iterations):
+	for iteration in benchmark_iterations(
+		statistics, [mongodb_dao], iterations
+	):
 		for collection in collections:
 			mongodb_dao.delete_data(
 				database=os.getenv('DB_NAME'),
 				collection=collection.split('.')[0]
 			)
 
+		mongodb_dao.drop_indexes(database=os.getenv('DB_NAME'))
 		mongodb_dao.populate_database(
 			data_folder=mongodb_path
 		)
 
-		for collection in collections:
-			mongodb_dao.read_data(
-				database=os.getenv('DB_NAME'),
-				collection=collection.split('.')[0]
-			)
+		if read:
+			for collection in collections:
+				mongodb_dao.read_data(
+					database=os.getenv('DB_NAME'),
+					collection=collection.split('.')[0],
+					sink='null'
+				)
+
+			# Both passes query the same sampled values, so they only differ 
+			# in the indexes.
+			values = {
+				workload: mongodb_dao.sample_values(
+					os.getenv('DB_NAME'), workload, samples=100
+				)
+				for workload in MongoDbDAO.QUERY_WORKLOADS
+			}
+
+			for indexed in [True, False]:
+				if indexed:
+					mongodb_dao.create_indexes(database=os.getenv('DB_NAME'))
+
+				else:
+					mongodb_dao.drop_indexes(database=os.getenv('DB_NAME'))
+
+				for workload in MongoDbDAO.QUERY_WORKLOADS:
+					mongodb_dao.read_data(
+						database=os.getenv('DB_NAME'),
+						workload=workload,
+						values=values[workload]
+					)
+					mongodb_dao.update_data(
+						database=os.getenv('DB_NAME'),
+						workload=workload,
+						values=values[workload],
+						key='updated',
+						new_value=f'Docker_{iteration}'
+					)
 
 		update_mapping = {
 			'data': {
@@ -98,38 +270,127 @@ def run_mongodb(
 				new_values=value['new_values']
 			)
 
+			mongodb_dao.bulk_write_data(
+				database=os.getenv('DB_NAME'),
+				collection=key,
+				operations=mongodb_dao.sample_operations(
+					database=os.getenv('DB_NAME'),
+					collection=key,
+					samples=bulk_write_samples,
+					key='address',
+					new_value=f'Docker_{iteration}'
+				)
+			)
+
 	mongodb_dao.close_connection()
 
 
-def run_neo4j() -> None:
-	"""Run basic Neo4j DAO Functionalities."""
-	neo4j_path = os.path.join(os.getcwd(), 'data', 'archive')
+def run_neo4j(
+	statistics: Statistics,
+	iterations: Optional[int] = 10,
+	workers: Optional[int] = None,
+	import_mode: Optional[str] = None,
+	lines: Optional[int] = None
+) -> None:
+	"""Run basic Neo4j DAO Functionalities.
 
-	neo4j_dao = Neo4jDAO()
+	Read and update workloads run twice per iteration, once backed by the 
+	uniqueness constraint indexes and once with the indexes dropped 
+	(recorded as 'Neo4j (No Index)'). The extra ingestion strategies are 
+	opt-in, each of them deletes and populates the whole Graph once more 
+	in every iteration, which roughly adds the duration of another 
+	populate per iteration and strategy.
 
-	neo4j_dao.populate_database(
-		data_folder=neo4j_path
-	)
+	Args:
+		statistics (Statistics): Database Testing Statistics Object.
+		iterations (Optional[int]): Number of repetition. Defaults to 10.
+		workers (Optional[int]): Additionally populate the Graph with 
+		parallel ingestion workers in every iteration, so both insert paths 
+		are compared in the same run. Uses NEO4J_WORKERS (environment) if 
+		not set, skipped if that is not set either. Defaults to None.
+		import_mode (Optional[str]): Additionally populate the Graph with the 
+		offline bulk import ('load_csv' or 'admin') in every iteration, 
+		reported next to the online MERGE insert times. Uses 
+		NEO4J_IMPORT_MODE (environment) if not set, skipped if that is not 
+		set either. Defaults to None.
+		lines (Optional[int]): Number of loaded arXiv records, 0 loads the 
+		whole snapshot. Uses archive_lines if not set. Defaults to None.
+	"""
+	neo4j_path = data_folder('archive')
+	lines = archive_lines() if lines is None else lines or None
+	workers = workers or int(os.getenv('NEO4J_WORKERS') or 0) or None
+	import_mode = import_mode or os.getenv('NEO4J_IMPORT_MODE') or None
+
+	neo4j_dao = Neo4jDAO(statistics)
+
+	for iteration in benchmark_iterations(
+		statistics, [neo4j_dao], iterations
+	):
+		neo4j_dao.delete_data()
+
+		neo4j_dao.populate_database(
+			data_folder=neo4j_path,
+			lines=lines
+		)
+
+		for indexed in [True, False]:
+			if not indexed:
+				neo4j_dao.drop_indexes()
+
+			for workload in Neo4jDAO.READ_WORKLOADS:
+				neo4j_dao.read_data(workload=workload)
+
+			for workload in Neo4jDAO.UPDATE_WORKLOADS:
+				neo4j_dao.update_data(
+					workload=workload,
+					key='updated',
+					new_value=f'Docker_{iteration}'
+				)
+
+		neo4j_dao.create_indexes()
+
+		if workers:
+			neo4j_dao.delete_data()
+			neo4j_dao.populate_database(
+				data_folder=neo4j_path,
+				workers=workers,
+				lines=lines
+			)
+
+		if import_mode:
+			neo4j_dao.delete_data()
+			neo4j_dao.populate_database(
+				data_folder=neo4j_path,
+				import_mode=import_mode,
+				lines=lines
+			)
 
 	neo4j_dao.delete_data()
+	neo4j_dao.close_connection()
 
 
 def run_redis(
 	statistics: Statistics,
-	iterations: Optional[int] = 10
+	iterations: Optional[int] = 10,
+	pipeline_size: Optional[int] = None
 ) -> None:
 	"""Run basic Redis DAO Functionalities.
 
 	Args:
 		statistics (Statistics): Database Testing Statistics Object.
 		iterations (Optional[int]): Number of repetition. Defaults to 10.
+		pipeline_size (Optional[int]): Number of commands buffered before 
+		each Pipeline flush. Pipelining is disabled if not set. Defaults to 
+		None.
 	"""
-	redis_dao = RedisDAO(statistics)
+	redis_dao = RedisDAO(statistics, pipeline_size=pipeline_size)
 
-	redis_path = os.path.join(os.getcwd(), 'data', 'json_data')
+	redis_path = data_folder('json_data')
 	collections = sorted(os.listdir(redis_path))
 
-	for iteration in range(iterations):
+	for iteration in benchmark_iterations(
+		statistics, [redis_dao], iterations
+	):
 		for collection in collections:
 			redis_dao.delete_data(
 				database=os.getenv('DB_NAME'),
@@ -141,7 +402,9 @@ def run_redis(
 		for collection in collections:
 			redis_dao.read_data(
 				database=os.getenv('DB_NAME'),
-				collection=collection.split('.')[0]
+				collection=collection.split('.')[0],
+				batch_size=pipeline_size,
+				sink='null'
 			)
 
 		redis_dao.update_data(
@@ -153,3 +416,719 @@ def run_redis(
 		)
 
 	redis_dao.close_connection()
+
+
+def run_cached(
+	statistics: Statistics,
+	iterations: Optional[int] = 10,
+	reads: Optional[int] = 5,
+	capacity: Optional[int] = None,
+	ttl: Optional[float] = 60.0,
+	write_policy: Optional[str] = 'invalidate',
+	redis_tier: Optional[bool] = False,
+	l2_ttl: Optional[float] = 600.0
+) -> None:
+	"""Run MongoDB reads through the read-through cache, recorded as 
+	'MongoDB (Cached)' or 'MongoDB (Cached, Redis)'.
+
+	Every collection is read repeatedly, so the first read misses and the 
+	following ones hit. Passes over the collections alternate their order, 
+	so with an in-process tier smaller than the collections the most 
+	recently read ones hit in-process and the evicted ones hit Redis. The 
+	update in between applies the write policy before the next reads.
+
+	Args:
+		statistics (Statistics): Database Testing Statistics Object.
+		iterations (Optional[int]): Number of repetition. Defaults to 10.
+		reads (Optional[int]): Reads of every collection per iteration. 
+		Defaults to 5.
+		capacity (Optional[int]): Maximum number of cached reads in the 
+		in-process tier, see CachedDAO. Defaults to half the number of 
+		collections with the Redis tier, else 1024.
+		ttl (Optional[float]): Time to live of cached reads in the 
+		in-process tier in seconds. Defaults to 60.0.
+		write_policy (Optional[str]): 'invalidate' or 'write_through'. 
+		Defaults to 'invalidate'.
+		redis_tier (Optional[bool]): Back the cache with Redis as second 
+		tier. Defaults to False.
+		l2_ttl (Optional[float]): Time to live of cached reads in the Redis 
+		tier in seconds. Defaults to 600.0.
+	"""
+	mongodb_path = data_folder('json_data')
+	collections = sorted(os.listdir(mongodb_path))
+
+	if capacity is None:
+		capacity = max(1, len(collections) // 2) if redis_tier else 1024
+
+	redis_dao = (
+		RedisDAO(statistics, instrumentation=False) if redis_tier else None
+	)
+	cached_dao = CachedDAO(
+		MongoDbDAO(statistics, instrumentation=False),
+		statistics,
+		capacity=capacity,
+		ttl=ttl,
+		write_policy=write_policy,
+		redis_dao=redis_dao,
+		l2_ttl=l2_ttl
+	)
+
+	for iteration in benchmark_iterations(
+		statistics, [cached_dao], iterations
+	):
+		for collection in collections:
+			cached_dao.delete_data(
+				database=os.getenv('DB_NAME'),
+				collection=collection.split('.')[0]
+			)
+
+		cached_dao.populate_database(data_folder=mongodb_path)
+
+		for read in range(reads):
+			if read == reads // 2:
+				cached_dao.update_data(
+					database=os.getenv('DB_NAME'),
+					collection='data',
+					old_values={'name': {'$regex': '.'}},
+					new_values={'$set': {'address': f'Docker_{iteration}'}}
+				)
+
+			for collection in (
+				collections if read % 2 == 0 else collections[::-1]
+			):
+				cached_dao.read_data(
+					database=os.getenv('DB_NAME'),
+					collection=collection.split('.')[0],
+					sink='null'
+				)
+
+	cached_dao.clear()
+	cached_dao.close_connection()
+
+	if redis_dao is not None:
+		redis_dao.close_connection()
+
+
+def _format_iteration(value: Any, iteration: int) -> Any:
+	# Fills the iteration number into the strings of nested update values.
+	if isinstance(value, str):
+		return value.format(iteration=iteration)
+
+	if isinstance(value, dict):
+		return {
+			key: _format_iteration(item, iteration)
+			for key, item in value.items()
+		}
+
+	return value
+
+
+async def _run_async(
+	statistics: Statistics,
+	dao: AsyncDAO,
+	iterations: int,
+	update: Dict[str, Any]
+) -> None:
+	# Runs populate, read and update rounds of single asyncio DAO.
+	data_path = data_folder('json_data')
+	collections = [
+		collection.split('.')[0] 
+		for collection in sorted(os.listdir(data_path))
+	]
+
+	try:
+		for iteration in benchmark_iterations(
+			statistics, [dao], iterations
+		):
+			for collection in collections:
+				await dao.delete_data(
+					database=os.getenv('DB_NAME'),
+					collection=collection
+				)
+
+			await dao.populate_database(data_folder=data_path)
+
+			for collection in collections:
+				await dao.read_data(
+					database=os.getenv('DB_NAME'),
+					collection=collection,
+					sink='null'
+				)
+
+			await dao.update_data(
+				database=os.getenv('DB_NAME'),
+				collection='data',
+				**_format_iteration(update, iteration)
+			)
+
+	finally:
+		await dao.close_connection()
+
+
+def run_async(
+	statistics: Statistics,
+	iterations: Optional[int] = 10,
+	database_type: Optional[str] = 'MongoDB',
+	concurrency: Optional[int] = 16
+) -> None:
+	"""Run asyncio DAO Functionalities, recorded as e.g. 'MongoDB (Async)'.
+
+	Args:
+		statistics (Statistics): Database Testing Statistics Object.
+		iterations (Optional[int]): Number of repetition. Defaults to 10.
+		database_type (Optional[str]): Type of NoSQL Database ('CouchDB', 
+		'MongoDB' or 'Redis'). Defaults to 'MongoDB'.
+		concurrency (Optional[int]): Maximum number of requests in flight. 
+		Defaults to 16.
+	"""
+	if database_type == 'MongoDB':
+		dao = AsyncMongoDbDAO(statistics, concurrency=concurrency)
+		update = {
+			'old_values': {'name': {'$regex': '.'}},
+			'new_values': {'$set': {'address': 'Docker_{iteration}'}}
+		}
+
+	elif database_type == 'CouchDB':
+		dao = AsyncCouchDbDAO(statistics, concurrency=concurrency)
+		update = {'key': 'address', 'new_value': 'Docker_{iteration}'}
+
+	elif database_type == 'Redis':
+		dao = AsyncRedisDAO(statistics, concurrency=concurrency)
+		update = {
+			'doc_ids': [], 'key': 'address', 'new_value': 'Docker_{iteration}'
+		}
+
+	else:
+		raise ValueError(f'Unknown Database type: {database_type}')
+
+	asyncio.run(_run_async(statistics, dao, iterations, update))
+
+
+# Every suite owns its Database, variants of a suite run one after another 
+# inside it, so concurrent suites never clobber each other's data.
+SUITES = {
+	'CouchDB': [
+		run_couchdb,
+		partial(run_async, database_type='CouchDB')
+	],
+	'Neo4j': [run_neo4j],
+	'MongoDB': [
+		run_mongodb,
+		*[
+			partial(
+				run_mongodb,
+				write_concern=write_concern,
+				ordered=False,
+				read=False
+			)
+			for write_concern in [
+				{'w': 0},
+				{'w': 1},
+				{'w': 1, 'j': True},
+				{'w': 'majority', 'j': True}
+			]
+		],
+		partial(run_async, database_type='MongoDB'),
+		run_cached,
+		partial(run_cached, write_policy='write_through', redis_tier=True)
+	],
+	'Redis': [
+		run_redis,
+		partial(run_redis, pipeline_size=1000),
+		partial(run_async, database_type='Redis')
+	]
+}
+
+
+def run_suite(
+	suite: str,
+	iterations: int,
+	run_mode: str
+) -> Tuple[
+	Optional[pd.DataFrame],
+	Dict[Tuple[str, str, str], LatencyHistogram],
+	Optional[pd.DataFrame]
+]:
+	"""Runs single Database suite with its own Statistics Object.
+
+	Used as the Process Pool worker, so the recorded execution times, 
+	Latency Histograms and throughputs are sent back to the aggregating 
+	Statistics Object in the main process.
+
+	Args:
+		suite (str): Name of the Database suite (key of SUITES).
+		iterations (int): Number of repetition.
+		run_mode (str): Run mode recorded with every execution time.
+
+	Returns:
+		Tuple[Optional[pd.DataFrame], Dict[Tuple[str, str, str], 
+		LatencyHistogram], Optional[pd.DataFrame]]: Execution times, Latency 
+		Histograms and throughputs recorded by the suite.
+	"""
+	statistics = Statistics(iterations, run_mode=run_mode)
+
+	for run in SUITES[suite]:
+		run(statistics, iterations)
+
+	return (
+		statistics.execution_times,
+		statistics.latency_histograms,
+		statistics.throughputs
+	)
+
+
+def run_benchmarks(
+	statistics: Statistics,
+	iterations: Optional[int] = 10,
+	concurrent: Optional[bool] = False,
+	suites: Optional[List[str]] = None
+) -> None:
+	"""Runs Database suites either isolated or concurrently.
+
+	Isolated suites run one after another in the current process. 
+	Concurrent suites run in a Process Pool with one worker per suite and 
+	their execution times are merged into the given Statistics Object.
+
+	Args:
+		statistics (Statistics): Aggregating Database Testing Statistics 
+		Object.
+		iterations (Optional[int]): Number of repetition. Defaults to 10.
+		concurrent (Optional[bool]): Run suites concurrently. Defaults to 
+		False.
+		suites (Optional[List[str]]): Names of suites to run. Runs every 
+		suite in SUITES if not set. Defaults to None.
+	"""
+	suites = list(SUITES) if suites is None else suites
+
+	if not concurrent:
+		for suite in suites:
+			for run in SUITES[suite]:
+				run(statistics, iterations)
+
+		return
+
+	with ProcessPoolExecutor(max_workers=len(suites)) as executor:
+		futures = [
+			executor.submit(run_suite, suite, iterations, 'concurrent')
+			for suite in suites
+		]
+
+		for future in futures:
+			execution_times, latency_histograms, throughputs = (
+				future.result()
+			)
+
+			statistics.add_execution_times(execution_times)
+			statistics.add_latency_histograms(latency_histograms)
+			statistics.add_throughputs(throughputs)
+
+
+def geometric_sizes(
+	start: Optional[int] = 1000,
+	stop: Optional[int] = 10000000,
+	factor: Optional[int] = 10
+) -> List[int]:
+	"""Returns geometrically growing dataset sizes.
+
+	Args:
+		start (Optional[int]): Smallest size. Defaults to 1000.
+		stop (Optional[int]): Largest size (inclusive). Defaults to 10000000.
+		factor (Optional[int]): Growth factor between sizes. Defaults to 10.
+
+	Returns:
+		List[int]: Dataset sizes.
+	"""
+	sizes = []
+
+	while start <= stop:
+		sizes.append(start)
+		start *= factor
+
+	return sizes
+
+
+def run_sweep(
+	statistics: Statistics,
+	iterations: Optional[int] = 10,
+	sizes: Optional[List[int]] = None,
+	concurrent: Optional[bool] = False,
+	suites: Optional[List[str]] = None,
+	synthetic: Optional[bool] = False,
+	seed: Optional[int] = 0
+) -> None:
+	"""Runs Database suites at growing dataset sizes.
+
+	For every size, each data File is subsampled (or repeated) to exactly 
+	that many records under data/sweep/<size>, see write_sample_folder, or 
+	synthetic data of that size is generated under 
+	data/sweep/synthetic_<size>, see write_synthetic_folder. The suites then 
+	run against it. Every size is recorded by its own Statistics 
+	Object, exported to data/output/sweep_<size>, and summarized into the 
+	scaling curves of the given Statistics Object.
+
+	Args:
+		statistics (Statistics): Statistics Object receiving the scaling 
+		curves.
+		iterations (Optional[int]): Number of repetition. Defaults to 10.
+		sizes (Optional[List[int]]): Records per data File. Defaults to 
+		geometric_sizes().
+		concurrent (Optional[bool]): Run suites concurrently, see 
+		run_benchmarks. Defaults to False.
+		suites (Optional[List[str]]): Names of suites to run. Runs every 
+		suite in SUITES if not set. Defaults to None.
+		synthetic (Optional[bool]): Generate synthetic data instead of 
+		sampling the data Files. Defaults to False.
+		seed (Optional[int]): Random seed of the synthetic data. Defaults 
+		to 0.
+	"""
+	sizes = geometric_sizes() if sizes is None else sizes
+	sources = {
+		name: data_folder(name) for name in ['json_data', 'archive']
+		if os.path.exists(data_folder(name))
+	}
+	environment = {
+		variable: os.getenv(variable)
+		for variable in ['DATA_FOLDER', 'ARCHIVE_LINES']
+	}
+
+	try:
+		for size in sizes:
+			sweep_folder = os.path.join(
+				os.getcwd(),
+				'data',
+				'sweep',
+				f'synthetic_{size}' if synthetic else str(size)
+			)
+
+			if synthetic:
+				write_synthetic_folder(sweep_folder, size, seed=seed)
+
+			else:
+				for name, source in sources.items():
+					write_sample_folder(
+						source, os.path.join(sweep_folder, name), size
+					)
+
+			os.environ['DATA_FOLDER'] = sweep_folder
+			os.environ['ARCHIVE_LINES'] = str(size)
+
+			sized_statistics = Statistics(
+				iterations,
+				export_folder_path=os.path.join(
+					os.getcwd(), 'data', 'output', f'sweep_{size}'
+				),
+				run_mode='concurrent' if concurrent else 'isolated'
+			)
+
+			run_benchmarks(
+				sized_statistics,
+				iterations,
+				concurrent=concurrent,
+				suites=suites
+			)
+
+			sized_statistics.export_data_to_csv()
+			statistics.add_scaling(size, sized_statistics)
+
+	finally:
+		for variable, value in environment.items():
+			if value is None:
+				os.environ.pop(variable, None)
+
+			else:
+				os.environ[variable] = value
+
+
+def _populate_load_database(
+	dao: Any,
+	database_type: str,
+	database: str
+) -> None:
+	# Sets the Database up the same way as the benchmark suites do, so the 
+	# load mode does not depend on data left behind by an earlier run.
+	if database_type == 'Neo4j':
+		dao.delete_data()
+		dao.populate_database(
+			data_folder=data_folder('archive'),
+			lines=archive_lines()
+		)
+		return
+
+	json_path = data_folder('json_data')
+
+	for file in sorted(os.listdir(json_path)):
+		dao.delete_data(database=database, collection=file.split('.')[0])
+
+	dao.populate_database(data_folder=json_path)
+
+
+def run_load(
+	statistics: Statistics,
+	database_type: str,
+	concurrency_levels: Optional[List[int]] = None,
+	operations: Optional[int] = 100,
+	mix: Optional[Dict[str, float]] = None,
+	collection: Optional[str] = 'data'
+) -> None:
+	"""Runs concurrent client load against single Database.
+
+	The Database is deleted and populated from the data folder first (the 
+	arXiv Graph for Neo4j). DAO instrumentation is switched off, so loaded 
+	samples are not mixed into the single-client results.
+
+	Args:
+		statistics (Statistics): Database Testing Statistics Object which 
+		receives throughput and latency percentiles.
+		database_type (str): Type of NoSQL Database ('CouchDB', 'MongoDB', 
+		'Neo4j' or 'Redis').
+		concurrency_levels (Optional[List[int]]): Numbers of concurrent 
+		workers. Defaults to [1, 2, 4, 8, 16, 32].
+		operations (Optional[int]): Number of operations executed by each 
+		worker. Defaults to 100.
+		mix (Optional[Dict[str, float]]): Relative weights of 'read', 
+		'insert' and 'update' operations. Defaults to 80 % reads, 10 % 
+		inserts and 10 % updates (90 % co-author reads and 10 % paper 
+		updates for Neo4j).
+		collection (Optional[str]): Collection the load is run against. 
+		Defaults to 'data'.
+	"""
+	concurrency_levels = (
+		[1, 2, 4, 8, 16, 32] if concurrency_levels is None 
+		else concurrency_levels
+	)
+	if mix is None:
+		mix = (
+			{'read': 0.9, 'update': 0.1} if database_type == 'Neo4j' 
+			else {'read': 0.8, 'insert': 0.1, 'update': 0.1}
+		)
+
+	database = os.getenv('DB_NAME')
+
+	if database_type == 'MongoDB':
+		dao = MongoDbDAO(statistics, instrumentation=False)
+		_populate_load_database(dao, database_type, database)
+		operations_mapping = {
+			'read': lambda: dao.read_data(
+				database=database,
+				collection=collection,
+				sink='null'
+			),
+			'insert': lambda: dao.insert_data(
+				database=database,
+				collection=collection,
+				data=[{'name': 'Load', 'address': 'Docker_load'}]
+			),
+			'update': lambda: dao.update_data(
+				database=database,
+				collection=collection,
+				old_values={'name': {'$regex': '.'}},
+				new_values={'$set': {'address': 'Docker_load'}}
+			)
+		}
+
+	elif database_type == 'CouchDB':
+		dao = CouchDbDAO(statistics, instrumentation=False)
+		_populate_load_database(dao, database_type, database)
+		operations_mapping = {
+			'read': lambda: dao.read_data(
+				database=database,
+				collection=collection,
+				sink='null'
+			),
+			'insert': lambda: dao.insert_data(
+				database=database,
+				collection=collection,
+				data={'name': 'Load', 'address': 'Docker_load'}
+			),
+			'update': lambda: dao.update_data(
+				database=database,
+				collection=collection,
+				doc_ids=[],
+				key='address',
+				new_value='Docker_load'
+			)
+		}
+
+	elif database_type == 'Redis':
+		dao = RedisDAO(statistics, instrumentation=False)
+		_populate_load_database(dao, database_type, database)
+		operations_mapping = {
+			'read': lambda: dao.read_data(
+				database=database,
+				collection=collection,
+				sink='null'
+			),
+			'insert': lambda: dao.insert_data(
+				key='_'.join(
+					[database, collection, f'load{uuid.uuid4().hex}']
+				).lower(),
+				data={'name': 'Load', 'address': 'Docker_load'}
+			),
+			'update': lambda: dao.update_data(
+				database=database,
+				collection=collection,
+				doc_ids=[],
+				key='address',
+				new_value='Docker_load'
+			)
+		}
+
+	elif database_type == 'Neo4j':
+		dao = Neo4jDAO(statistics, instrumentation=False)
+		_populate_load_database(dao, database_type, database)
+		authors = dao.sample_keys('Co-Authors', 1000)
+		papers = dao.sample_keys('Papers', 1000)
+		operations_mapping = {
+			'read': lambda: dao.read_data(
+				workload='Co-Authors',
+				keys=[random.choice(authors)]
+			),
+			'update': lambda: dao.update_data(
+				workload='Papers',
+				key='updated',
+				new_value='Docker_load',
+				keys=[random.choice(papers)]
+			)
+		}
+
+	else:
+		raise ValueError(f'Unsupported Database Type: {database_type}')
+
+	statistics.add_load_results(
+		database_type=database_type,
+		results=LoadGenerator(operations_mapping, mix)(
+			concurrency_levels=concurrency_levels,
+			operations=operations
+		)
+	)
+
+	dao.close_connection()
+
+
+def _dataset_operations(
+	dao: Any,
+	database_type: str,
+	database: str,
+	dataset: str,
+	scenario: Dict[str, Any],
+	iteration: int
+) -> Dict[str, Any]:
+	# Maps scenario operations on single dataset to DAO calls, every 
+	# Database reads the whole dataset, inserts one Document and sets the 
+	# same key on every Document.
+	key = scenario['update']['key']
+	value = scenario['update']['value'].format(iteration=iteration)
+
+	if database_type == 'MongoDB':
+		return {
+			'read': lambda: dao.read_data(
+				database=database, collection=dataset, sink='null'
+			),
+			'insert': lambda: dao.insert_data(
+				database=database,
+				collection=dataset,
+				data=[dict(scenario['insert'])]
+			),
+			'update': lambda: dao.update_data(
+				database=database,
+				collection=dataset,
+				old_values={},
+				new_values={'$set': {key: value}}
+			)
+		}
+
+	if database_type == 'CouchDB':
+		return {
+			'read': lambda: dao.read_data(
+				database=database, collection=dataset, sink='null'
+			),
+			'insert': lambda: dao.insert_data(
+				database=database,
+				collection=dataset,
+				data=dict(scenario['insert'])
+			),
+			'update': lambda: dao.update_data(
+				database=database,
+				collection=dataset,
+				doc_ids=[],
+				key=key,
+				new_value=value
+			)
+		}
+
+	return {
+		'read': lambda: dao.read_data(
+			database=database, collection=dataset, sink='null'
+		),
+		'insert': lambda: dao.insert_data(
+			key='_'.join(
+				[database, dataset, f'scenario{uuid.uuid4().hex}']
+			).lower(),
+			data=dict(scenario['insert'])
+		),
+		'update': lambda: dao.update_data(
+			database=database,
+			collection=dataset,
+			doc_ids=[],
+			key=key,
+			new_value=value
+		)
+	}
+
+
+def run_scenario(statistics: Statistics, file_path: str) -> None:
+	"""Runs a YAML workload specification against every Database it names.
+
+	Every Database goes through the same steps: each dataset of the data 
+	folder (json_data in DATA_FOLDER unless the scenario sets data_folder) 
+	is deleted, the folder is populated, then the operation mix runs 
+	with the Load Generator at every concurrency level. Results are added 
+	as load results of e.g. 'MongoDB (<scenario name>)'. DAO 
+	instrumentation is switched off, see run_load.
+
+	Args:
+		statistics (Statistics): Database Testing Statistics Object.
+		file_path (str): Scenario File Path, see load_scenario.
+	"""
+	scenario = load_scenario(file_path, data_folder('json_data'))
+	database = os.getenv('DB_NAME')
+	daos = {
+		'CouchDB': CouchDbDAO,
+		'MongoDB': MongoDbDAO,
+		'Redis': RedisDAO
+	}
+
+	for database_type in scenario['databases']:
+		dao = daos[database_type](statistics, instrumentation=False)
+
+		for iteration in range(scenario['iterations']):
+			for file in sorted(os.listdir(scenario['data_folder'])):
+				dao.delete_data(
+					database=database, collection=file.split('.')[0]
+				)
+
+			dao.populate_database(data_folder=scenario['data_folder'])
+
+			operations_mapping = {
+				f'{operation}:{dataset}': call
+				for dataset in scenario['datasets']
+				for operation, call in _dataset_operations(
+					dao, database_type, database, dataset, scenario, iteration
+				).items()
+			}
+
+			results = LoadGenerator(
+				operations_mapping, scenario_mix(scenario), scenario['seed']
+			)(
+				concurrency_levels=scenario['concurrency'],
+				operations=scenario['operations'],
+				duration=scenario['duration'],
+				warmup=scenario['warmup']
+			)
+
+			statistics.add_load_results(
+				database_type=f"{database_type} ({scenario['name']})",
+				results=results.assign(iteration=iteration)
+			)
+
+		dao.close_connection()
@@ -0,0 +1,31 @@
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from utils.archive_utils import build_archive_tables, clean_archive_data
+
+
+def test_papers_without_authors_or_categories_get_empty_lists() -> None:
+    df = pd.DataFrame({
+        'id': ['0001', '0002', '0003'],
+        'title': ['First', 'Second', 'Third'],
+        'authors_parsed': [
+            [['Doe', 'Jane', '']],
+            [],
+            None
+        ],
+        'categories': ['cs.DB cs.DS', None, 'cs.DB']
+    })
+
+    cleaned = clean_archive_data(df)
+
+    assert cleaned['cleaned_authors_list'].tolist() == [['Jane Doe'], [], []]
+    assert cleaned['category_list'].tolist() == [
+        ['cs.DB', 'cs.DS'], [], ['cs.DB']
+    ]
+
+    tables = build_archive_tables(cleaned)
+
+    assert tables['authors']['author'].tolist() == ['Jane Doe']
+    assert tables['authored']['paper_id'].tolist() == [0]
+    assert sorted(tables['in_category']['paper_id'].tolist()) == [0, 0, 2]
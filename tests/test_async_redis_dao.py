@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip('redis')
+
+from redis.asyncio.connection import Connection
+
+from dao.async_redis_dao import AsyncRedisDAO
+
+
+class _FakeConnectionPool:
+
+    """Connection Pool handing out a Connection which never hits a server."""
+
+    def __init__(self) -> None:
+        self.commands = []
+        self.connection = Connection()
+        self.connection.send_packed_command = self.__send
+        self.connection.read_response = self.__read
+
+    async def __send(self, command, check_health=True) -> None:
+        self.commands.append(command)
+
+    async def __read(self, disable_decoding=False):
+        return 'OK'
+
+    async def get_connection(self, command_name, *keys, **options):
+        return self.connection
+
+    async def release(self, connection) -> None:
+        pass
+
+
+def test_pipelined_insert_runs_on_asyncio_client(monkeypatch):
+    monkeypatch.setenv('DB_NAME', 'test')
+    dao = AsyncRedisDAO(statistics=None)
+    pool = _FakeConnectionPool()
+    dao._AsyncRedisDAO__connection.connection_pool = pool
+
+    asyncio.run(
+        dao._AsyncRedisDAO__insert_batch(
+            [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}], 'data'
+        )
+    )
+
+    sent = b''.join(
+        part if isinstance(part, bytes) else bytes(part)
+        for command in pool.commands for part in command
+    )
+
+    assert sent.count(b'JSON.SET') == 2
+    assert b'test_data_1' in sent
+    assert json.dumps({'id': 2, 'name': 'b'}).encode() in sent
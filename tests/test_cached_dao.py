@@ -0,0 +1,89 @@
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('redis')
+
+from dao.cached_dao import CachedDAO
+from dao.dao import DAO
+from stats.statistics import Statistics
+
+
+class _CollectionDAO(DAO):
+
+    """DAO reading one Document per collection from memory."""
+
+    def __init__(self) -> None:
+        super().__init__(database_type='Memory', instrumentation=False)
+
+    def create_connection(self, **kwargs) -> None:
+        pass
+
+    def read_data(self, **kwargs) -> None:
+        kwargs['sink']({'collection': kwargs['collection']})
+
+    def insert_data(self, **kwargs) -> None:
+        pass
+
+    def update_data(self, **kwargs) -> None:
+        pass
+
+    def delete_data(self, **kwargs) -> None:
+        pass
+
+    def close_connection(self) -> None:
+        pass
+
+    def populate_database(self, data_folder: str) -> None:
+        pass
+
+
+class _RedisConnection:
+
+    """Key-value store standing in for the Redis client."""
+
+    def __init__(self) -> None:
+        self.values = {}
+        self.expirations = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, px=None) -> None:
+        self.values[key] = value
+        self.expirations[key] = px
+
+
+class _RedisDAO:
+
+    """Redis DAO exposing the stand-in client."""
+
+    def __init__(self) -> None:
+        self.connection = _RedisConnection()
+
+
+def test_reads_evicted_in_process_are_served_by_redis() -> None:
+    statistics = Statistics(1)
+    redis_dao = _RedisDAO()
+    cached_dao = CachedDAO(
+        _CollectionDAO(),
+        statistics,
+        capacity=1,
+        ttl=1.0,
+        redis_dao=redis_dao,
+        l2_ttl=10.0
+    )
+
+    for collection in ['books', 'grades', 'grades', 'books']:
+        cached_dao.read_data(
+            database='test', collection=collection, sink='null'
+        )
+
+    summary = statistics.cache_summary.set_index('dataset')
+
+    assert summary.loc['books', ['hits', 'l2_hits', 'misses']].tolist() == [
+        1, 1, 1
+    ]
+    assert summary.loc['grades', ['hits', 'l2_hits', 'misses']].tolist() == [
+        1, 0, 1
+    ]
+    assert set(redis_dao.connection.expirations.values()) == {10000}
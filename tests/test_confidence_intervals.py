@@ -0,0 +1,70 @@
+import math
+from statistics import NormalDist
+
+import pytest
+
+pytest.importorskip('pandas')
+
+from stats.statistics import Statistics
+
+
+def _record(statistics, times, action='read') -> None:
+    for time in times:
+        statistics.add_execution_time(
+            'MongoDB', 'test', 'data', action, time
+        )
+
+
+def test_interval_width_of_a_known_variance_sample() -> None:
+    statistics = Statistics(20)
+    _record(statistics, [0.9, 1.1] * 10)
+
+    interval = statistics.confidence_intervals().iloc[0]
+    half_width = (
+        NormalDist().inv_cdf(0.975) * 0.1 * math.sqrt(20 / 19) / math.sqrt(20)
+    )
+
+    assert interval['samples'] == 20
+    assert interval['transient'] == 0
+    assert interval['mean'] == pytest.approx(1.0)
+    assert interval['upper'] - interval['mean'] == pytest.approx(half_width)
+    assert interval['mean'] - interval['lower'] == pytest.approx(half_width)
+    assert interval['precision'] == pytest.approx(half_width)
+
+
+def test_transient_samples_are_dropped() -> None:
+    statistics = Statistics(25)
+    _record(statistics, [5.0] * 5 + [0.9, 1.1] * 10)
+
+    interval = statistics.confidence_intervals().iloc[0]
+
+    assert interval['transient'] == 5
+    assert interval['mean'] == pytest.approx(1.0)
+
+
+def test_converged_decision() -> None:
+    statistics = Statistics(20)
+
+    assert not statistics.converged(0.05)
+
+    _record(statistics, [0.9, 1.1] * 10)
+
+    # Half width is about 4.5 % of the mean.
+    assert statistics.converged(0.05)
+    assert not statistics.converged(0.04)
+    assert not statistics.converged(0.05, min_samples=21)
+    assert not statistics.converged(0.05, confidence=0.99)
+
+    marker = statistics.sample_count
+    _record(statistics, [0.5, 1.5] * 3)
+
+    assert not statistics.converged(0.05, since=marker)
+
+
+def test_every_action_must_converge() -> None:
+    statistics = Statistics(20)
+    _record(statistics, [0.9, 1.1] * 10)
+    _record(statistics, [1.0, 1.0], action='update')
+
+    assert not statistics.converged(0.05)
+    assert statistics.converged(0.05, min_samples=2)
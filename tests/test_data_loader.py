@@ -0,0 +1,30 @@
+import json
+
+from utils.data_loader import iter_json_chunks
+
+
+def test_blank_lines_are_skipped(tmp_path) -> None:
+    file_path = tmp_path / 'data.json'
+    file_path.write_text(
+        '\n'.join(
+            [json.dumps({'id': 1}), '', '   ', json.dumps({'id': 2}), '']
+        )
+        + '\n'
+    )
+
+    chunks = list(
+        iter_json_chunks(
+            str(file_path), chunk_size=10, backend='json', cache_folder=''
+        )
+    )
+
+    assert chunks == [[{'id': 1}, {'id': 2}]]
+    assert list(
+        iter_json_chunks(
+            str(file_path),
+            chunk_size=10,
+            limit=2,
+            backend='json',
+            cache_folder=''
+        )
+    ) == chunks
@@ -0,0 +1,113 @@
+import math
+import random
+
+import pytest
+
+from stats.latency_histogram import LatencyHistogram
+
+
+def _nearest_rank(values, percentile):
+    values = sorted(values)
+
+    return values[max(math.ceil(percentile / 100 * len(values)), 1) - 1]
+
+
+def test_small_values_are_exact() -> None:
+    histogram = LatencyHistogram()
+
+    for value in range(128):
+        histogram.record_ns(value)
+
+    for percentile in [1, 50, 90, 99, 100]:
+        assert histogram.percentile(percentile) * 1e9 == pytest.approx(
+            _nearest_rank(range(128), percentile)
+        )
+
+
+def test_bucket_boundaries_cover_their_values() -> None:
+    histogram = LatencyHistogram()
+    index = histogram._LatencyHistogram__index
+    highest_value = histogram._LatencyHistogram__highest_value
+    previous = -1
+
+    for value in list(range(4096)) + [2 ** bits - 1 for bits in range(12, 40)]:
+        bucket = index(value)
+
+        assert bucket >= previous
+        assert value <= highest_value(bucket) <= value * (1 + 2 / 128)
+        assert bucket == 0 or highest_value(bucket - 1) < value
+
+        previous = bucket
+
+
+def test_percentiles_are_within_the_error_bound() -> None:
+    generator = random.Random(42)
+    values = [
+        int(generator.lognormvariate(13, 1.5)) for _ in range(10000)
+    ]
+    histogram = LatencyHistogram()
+
+    for value in values:
+        histogram.record_ns(value)
+
+    for percentile in [50, 90, 99, 99.9]:
+        exact = _nearest_rank(values, percentile)
+
+        assert histogram.percentile(percentile) * 1e9 == pytest.approx(
+            exact, rel=2 / 128
+        )
+
+    assert histogram.percentile(100) * 1e9 == pytest.approx(max(values))
+    assert histogram.summary()['max'] * 1e9 == pytest.approx(max(values))
+
+
+def test_merge_matches_recording_every_value() -> None:
+    generator = random.Random(7)
+    values = [generator.randint(0, 10 ** 9) for _ in range(2000)]
+    merged, first, second = (
+        LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    )
+
+    for value in values:
+        merged.record_ns(value)
+
+    for value in values[:500]:
+        first.record_ns(value)
+
+    for value in values[500:]:
+        second.record_ns(value)
+
+    first.merge(second)
+
+    assert first.count == merged.count == len(values)
+    assert first.summary() == merged.summary()
+
+
+def test_empty_histogram_reports_nan() -> None:
+    histogram = LatencyHistogram()
+
+    assert math.isnan(histogram.percentile(50))
+
+    summary = histogram.summary()
+
+    assert summary['count'] == 0
+    assert math.isnan(summary['p99'])
+    assert math.isnan(summary['max'])
+
+
+def test_merging_empty_histograms() -> None:
+    histogram = LatencyHistogram()
+    histogram.merge(LatencyHistogram())
+
+    assert histogram.count == 0
+
+    other = LatencyHistogram()
+    other.record_ns(1500)
+    other.record_ns(3000)
+    histogram.merge(other)
+
+    assert histogram.count == 2
+    assert histogram.percentile(0) * 1e9 == pytest.approx(
+        1500, rel=2 / 128
+    )
+    assert histogram.summary()['max'] * 1e9 == pytest.approx(3000)
@@ -0,0 +1,37 @@
+import math
+
+import pytest
+
+pytest.importorskip('numpy')
+pytest.importorskip('pandas')
+
+from utils.load_generator import LoadGenerator
+
+
+def test_no_finished_operation_reports_nan_percentiles() -> None:
+    results = LoadGenerator({'read': lambda: None}).run(
+        concurrency=2, operations=0
+    )
+
+    assert results['operation'].tolist() == ['all']
+    assert results['operations'].tolist() == [0]
+    assert results['throughput'].tolist() == [0]
+    assert all(
+        math.isnan(results[column].iloc[0])
+        for column in ['mean', 'p50', 'p90', 'p99', 'max']
+    )
+
+
+def test_failed_warmup_reaches_the_caller() -> None:
+    calls = []
+
+    def read() -> None:
+        calls.append(None)
+
+        if len(calls) == 1:
+            raise RuntimeError('warm-up failed')
+
+    with pytest.raises(RuntimeError, match='warm-up failed'):
+        LoadGenerator({'read': read}).run(
+            concurrency=4, operations=1, warmup=2
+        )
@@ -0,0 +1,19 @@
+import pytest
+
+pytest.importorskip('yaml')
+
+from utils.scenario import load_scenario
+
+
+def test_data_folder_defaults_to_the_given_folder(tmp_path) -> None:
+    json_data = tmp_path / 'json_data'
+    json_data.mkdir()
+    (json_data / 'books.json').write_text('')
+    (json_data / 'data.json').write_text('')
+    scenario_path = tmp_path / 'scenario.yaml'
+    scenario_path.write_text('operations: 10\n')
+
+    scenario = load_scenario(str(scenario_path), str(json_data))
+
+    assert scenario['data_folder'] == str(json_data)
+    assert scenario['datasets'] == ['books', 'data']
@@ -0,0 +1,26 @@
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from stats.statistics import Statistics
+
+
+def test_added_execution_times_default_missing_columns() -> None:
+    statistics = Statistics(1, run_mode='concurrent')
+
+    statistics.add_execution_times(
+        pd.DataFrame(
+            {
+                'database_type': ['MongoDB'],
+                'database': ['test'],
+                'dataset': ['data'],
+                'action': ['read'],
+                'time': [0.5]
+            }
+        )
+    )
+
+    execution_times = statistics.execution_times
+
+    assert execution_times['phase'].tolist() == ['total']
+    assert execution_times['run_mode'].tolist() == ['concurrent']